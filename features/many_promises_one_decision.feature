@@ -26,3 +26,9 @@ Feature: CI gate evaluates multiple promises and produces a single overall decis
     When I run the CI gate with fail-on-violation enabled
     Then the CI gate should pass
     And the overall verdict should be "allow"
+
+  Scenario: Parallel CI gate keeps the configured promise order
+    Given "llm-input-logging" is slower to evaluate than the other promises
+    When I run the CI gate with fail-on-violation enabled using 3 jobs
+    Then the CI gate should pass
+    And the report results should follow the configured promise order
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import shlex
+import time
 from pathlib import Path
 
 from behave import given, when, then
@@ -72,13 +73,22 @@ def step_all_critical_verdict(context, verdict: str) -> None:
     context.verdicts = verdicts
 
 
+@given('"{promise_id}" is slower to evaluate than the other promises')
+def step_promise_slow(context, promise_id: str) -> None:
+    delays = getattr(context, "delays", {})
+    delays[promise_id] = 0.3
+    context.delays = delays
+
+
 def _install_fake_service(context) -> None:
     verdicts = getattr(context, "verdicts", {})
+    delays = getattr(context, "delays", {})
 
     class FakeEvaluationService:
         def evaluate_path(self, path: str, *args, **kwargs) -> EvaluationResult:
             config = kwargs.get("config")
             promise_id = getattr(config, "promise_id", "unknown")
+            time.sleep(delays.get(promise_id, 0.0))
             verdict = verdicts.get(promise_id, "green")
             if verdict == "error":
                 credence = 0.0
@@ -133,6 +143,34 @@ def step_run_ci_gate(context) -> None:
     _restore_service(context)
 
 
+@when("I run the CI gate with fail-on-violation enabled using {jobs:d} jobs")
+def step_run_ci_gate_parallel(context, jobs: int) -> None:
+    _install_fake_service(context)
+    if context.report_path.exists():
+        context.report_path.unlink()
+    args = [
+        "ci-gate",
+        ".",
+        "--fail-on-violation",
+        "--jobs",
+        str(jobs),
+        "--config",
+        str(context.config_path),
+        "--output",
+        str(context.report_path),
+    ]
+    result = context.runner.invoke(cli_module.app, args)
+    context.cli_result = result
+    _restore_service(context)
+
+
+@then("the report results should follow the configured promise order")
+def step_report_order(context) -> None:
+    report = json.loads(context.report_path.read_text(encoding="utf-8"))
+    ids = [item.get("id") for item in report.get("results", [])]
+    assert ids == context.promise_ids, ids
+
+
 @then(
     '"logs/ci-gate-report.json" should contain a list of results for all configured promises'
 )
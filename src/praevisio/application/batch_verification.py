@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import AbstractSet, Any, Callable, Dict, List, Sequence, Tuple
+
+from ..infrastructure.audit_pack import verify_audit_pack
+from ..infrastructure.evidence_cache import sha256_file
+from ..infrastructure.verification_ledger import VerificationLedger
+
+OK = "ok"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+@dataclass(frozen=True)
+class BundleResult:
+    """Outcome of verifying one bundle; `skipped` means already in the ledger."""
+
+    bundle: str
+    sha256: str | None
+    status: str
+    error: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": "bundle", **asdict(self)}
+
+
+@dataclass(frozen=True)
+class BatchSummary:
+    bundles: int
+    ok: int
+    failed: int
+    skipped: int
+    failures: List[Dict[str, str]] = field(default_factory=list)
+
+    @classmethod
+    def from_results(cls, results: Sequence[BundleResult]) -> "BatchSummary":
+        counts = Counter(result.status for result in results)
+        failures = sorted(
+            ({"bundle": r.bundle, "error": r.error} for r in results if r.status == FAILED),
+            key=lambda item: item["bundle"],
+        )
+        return cls(len(results), counts[OK], counts[FAILED], counts[SKIPPED], failures)
+
+    @property
+    def reasons(self) -> Dict[str, int]:
+        """Failure count per error message, most frequent first."""
+        return dict(Counter(item["error"] for item in self.failures).most_common())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": "summary", **asdict(self), "reasons": self.reasons}
+
+
+def find_bundles(root: Path) -> List[Path]:
+    """Every `*.zip` under `root`, in path order."""
+    return sorted(path for path in root.rglob("*.zip") if path.is_file())
+
+
+def split_jobs(jobs: int, bundles: int) -> Tuple[int, int]:
+    """Share `jobs` workers between bundle processes and hashing threads.
+
+    Bundles are verified in parallel first; threads left over go to hashing
+    the artifacts inside each bundle, so the total stays near `jobs`.
+    """
+    processes = max(1, min(jobs, bundles))
+    return processes, max(1, jobs // processes)
+
+
+def verify_bundles(
+    bundles: Sequence[Path],
+    ledger: VerificationLedger | None = None,
+    jobs: int = 1,
+    reverify: bool = False,
+    on_result: Callable[[BundleResult], None] | None = None,
+) -> BatchSummary:
+    """Verify `bundles` on a process pool, reporting each as it completes.
+
+    Bundles whose SHA-256 is in `ledger` are skipped unless `reverify` is
+    set; bundles that pass are recorded in it. `on_result` is called in
+    completion order, the summary is in path order.
+    """
+    known = frozenset() if ledger is None or reverify else frozenset(ledger.verified())
+    processes, threads = split_jobs(jobs, len(bundles))
+    results: List[BundleResult] = []
+
+    def finish(result: BundleResult) -> None:
+        if ledger is not None and result.status == OK and result.sha256:
+            ledger.record(result.sha256, result.bundle)
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    if processes == 1:
+        for bundle in bundles:
+            finish(_verify_bundle(str(bundle), threads, known))
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [
+                pool.submit(_verify_bundle, str(bundle), threads, known) for bundle in bundles
+            ]
+            for future in as_completed(futures):
+                finish(future.result())
+    return BatchSummary.from_results(results)
+
+
+def _verify_bundle(bundle: str, threads: int, known: AbstractSet[str]) -> BundleResult:
+    digest = None
+    try:
+        digest = sha256_file(Path(bundle))
+        if digest is None:
+            return BundleResult(bundle, None, FAILED, "bundle not found")
+        if digest in known:
+            return BundleResult(bundle, digest, SKIPPED)
+        ok, error, _ = verify_audit_pack(Path(bundle), jobs=threads)
+    except Exception as exc:  # one unreadable bundle must not stop the batch
+        return BundleResult(bundle, digest, FAILED, f"{type(exc).__name__}: {exc}")
+    return BundleResult(bundle, digest, OK if ok else FAILED, error)
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Sequence
+
+from ..infrastructure.bench_fixtures import (
+    BenchScenario,
+    Standins,
+    generate_governed_repo,
+    install_standins,
+)
+from ..infrastructure.config import YamlConfigLoader
+from ..infrastructure.toolchain import current_toolchain_metadata
+from .evaluation_service import EvaluationService
+
+BENCH_FORMAT = "praevisio-bench/1"
+OPERATIONS = ("evaluate_path", "ci-gate", "replay-audit", "export", "verify")
+
+
+class BenchError(RuntimeError):
+    """An operation under benchmark did not complete successfully."""
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    scenario: str
+    operation: str
+    timings_s: List[float]
+    details: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def median_s(self) -> float:
+        return statistics.median(self.timings_s)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "scenario": self.scenario,
+            "operation": self.operation,
+            "median_s": round(self.median_s, 6),
+            "min_s": round(min(self.timings_s), 6),
+            "timings_s": [round(t, 6) for t in self.timings_s],
+            "details": dict(self.details),
+        }
+
+
+@dataclass(frozen=True)
+class Regression:
+    scenario: str
+    operation: str
+    baseline_s: float
+    current_s: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_s / self.baseline_s if self.baseline_s else float("inf")
+
+
+class BenchService:
+    """Time praevisio's main operations on generated governed repositories.
+
+    `evaluate_path` is timed in-process; `ci-gate`, `replay-audit`, `export`
+    and `verify` run as `python -m praevisio` subprocesses, as CI runs them,
+    so their timings include interpreter start-up.
+    """
+
+    def __init__(self, workdir: Path, repeat: int = 3, force_standins: bool = False) -> None:
+        if repeat < 1:
+            raise ValueError("repeat must be >= 1")
+        self._workdir = workdir
+        self._repeat = repeat
+        self._standins = install_standins(workdir / "tools", force=force_standins)
+
+    @property
+    def standins(self) -> Standins:
+        return self._standins
+
+    def run(
+        self,
+        scenarios: Sequence[BenchScenario],
+        on_result: Callable[[BenchResult], None] | None = None,
+    ) -> Dict[str, Any]:
+        """Benchmark each scenario and return the machine-readable report."""
+        results: List[BenchResult] = []
+        for scenario in scenarios:
+            for result in self._run_scenario(scenario):
+                results.append(result)
+                if on_result is not None:
+                    on_result(result)
+        toolchain = current_toolchain_metadata()
+        return {
+            "format": BENCH_FORMAT,
+            "python_version": toolchain.get("python_version"),
+            "os": toolchain.get("os"),
+            "praevisio_version": toolchain.get("praevisio_version"),
+            "repeat": self._repeat,
+            "standins": list(self._standins.replaced),
+            "scenarios": [scenario.to_dict() for scenario in scenarios],
+            "results": [result.to_dict() for result in results],
+        }
+
+    def _run_scenario(self, scenario: BenchScenario) -> Iterator[BenchResult]:
+        root = self._workdir / "repos" / scenario.name
+        config_path = generate_governed_repo(root, scenario)
+        environ = self._standins.environ()
+        evaluation = YamlConfigLoader().load(str(config_path)).evaluation
+
+        timings: List[float] = []
+        run_id = None
+        with _environ(environ):
+            for _ in range(self._repeat):
+                started = time.perf_counter()
+                result = EvaluationService().evaluate_path(str(root), evaluation)
+                timings.append(time.perf_counter() - started)
+                run_id = result.details.get("run_id")
+                if result.verdict == "error":
+                    raise BenchError(f"{scenario.name}: evaluate_path returned an error verdict")
+        run_root = root / evaluation.run_dir / str(run_id)
+        details = _evidence_details(run_root)
+        yield BenchResult(scenario.name, "evaluate_path", timings, details)
+
+        runs_dir = str(root / evaluation.run_dir)
+        pack = self._workdir / "packs" / f"{scenario.name}.zip"
+        pack.parent.mkdir(parents=True, exist_ok=True)
+        commands = {
+            "ci-gate": [
+                "ci-gate",
+                str(root),
+                "--config",
+                str(config_path),
+                "--output",
+                str(self._workdir / "reports" / f"{scenario.name}.json"),
+            ],
+            "replay-audit": [
+                "replay-audit",
+                str(run_root / "audit.json"),
+                "--runs-dir",
+                runs_dir,
+                "--json",
+            ],
+            "export": ["export", "--run", str(run_id), "--out", str(pack), "--runs-dir", runs_dir],
+            "verify": ["verify", str(pack)],
+        }
+        for operation in OPERATIONS[1:]:
+            yield BenchResult(
+                scenario.name,
+                operation,
+                [self._time_cli(commands[operation], root, environ) for _ in range(self._repeat)],
+            )
+
+    @staticmethod
+    def _time_cli(args: List[str], cwd: Path, environ: Dict[str, str]) -> float:
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-m", "praevisio", *args],
+            cwd=cwd,
+            env=environ,
+            capture_output=True,
+            text=True,
+        )
+        elapsed = time.perf_counter() - started
+        if completed.returncode != 0:
+            raise BenchError(
+                f"'praevisio {args[0]}' exited with {completed.returncode}:\n"
+                f"{completed.stdout}{completed.stderr}"
+            )
+        return elapsed
+
+
+def compare_to_baseline(
+    report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.25
+) -> List[Regression]:
+    """Operations whose median exceeds the baseline's by more than `tolerance`.
+
+    Operations missing from the baseline are not compared.
+    """
+    previous = {
+        (item["scenario"], item["operation"]): float(item["median_s"])
+        for item in baseline.get("results") or []
+    }
+    regressions = []
+    for item in report.get("results") or []:
+        key = (item["scenario"], item["operation"])
+        if key not in previous:
+            continue
+        current = float(item["median_s"])
+        if current > previous[key] * (1 + tolerance):
+            regressions.append(Regression(key[0], key[1], previous[key], current))
+    return regressions
+
+
+def _evidence_details(run_root: Path) -> Dict[str, Any]:
+    """What the generated repository produced, to sanity-check a scenario."""
+    audit = json.loads((run_root / "audit.json").read_text(encoding="utf-8"))
+    semgrep = json.loads((run_root / "evidence" / "semgrep.json").read_text(encoding="utf-8"))
+    return {
+        "audit_events": len(audit),
+        "llm_call_sites": semgrep.get("total_calls"),
+        "violations": semgrep.get("violations"),
+    }
+
+
+@contextmanager
+def _environ(environ: Dict[str, str]) -> Iterator[None]:
+    # The in-process evaluation starts semgrep and pytest itself, so the
+    # stand-ins have to be on this process' PATH/PYTHONPATH.
+    saved = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(environ)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
@@ -2,12 +2,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Any, Dict, List
 
 from ..domain.config import Configuration
 from ..domain.entities import EvaluationResult
 from ..domain.evaluation_config import EvaluationConfig
 from ..domain.ports import ConfigLoader, FileSystemService
+from ..infrastructure.git import SubprocessGitRepository
+from ..infrastructure.speculative_store import SpeculativeResultStore
 from .override_service import OverrideArtifact, parse_override
 from .configuration_service import ConfigurationService
 from .evaluation_service import EvaluationService
@@ -47,9 +50,14 @@ class PraevisioEngine:
         threshold_override: float | None = None,
         override: OverrideArtifact | Dict[str, Any] | None = None,
         now: datetime | None = None,
+        reuse_speculative: bool = False,
     ) -> GateResult:
         effective = self.apply_threshold(evaluation, threshold_override, None)
-        result = self.evaluate(path, effective)
+        result = None
+        if reuse_speculative:
+            result = self.speculative_result(path, effective)
+        if result is None:
+            result = self.evaluate(path, effective)
         entry = self._build_report_entry(result, effective, severity=effective.severity or "high")
         should_fail = self._should_fail(result, effective, fail_on_violation=True)
         override_applies = self._override_applies(
@@ -60,6 +68,27 @@ class PraevisioEngine:
             entry["override_applied"] = True
         return GateResult(evaluation=result, report_entry=entry, should_fail=should_fail)
 
+    def speculative_result(
+        self, path: str, evaluation: EvaluationConfig
+    ) -> EvaluationResult | None:
+        """Result `praevisio watch` stored for the current working tree, if any.
+
+        Only returned when the working tree's content and every evaluation
+        setting match what was evaluated; details are marked `speculative`.
+        """
+        store = SpeculativeResultStore(Path(path) / evaluation.evidence_cache_dir)
+        if not store.has_entry(evaluation):
+            return None
+        state = SubprocessGitRepository(Path(path)).get_worktree_state(
+            exclude=(evaluation.run_dir, evaluation.evidence_cache_dir)
+        )
+        if state is None:
+            return None
+        result = store.get(evaluation, state)
+        if result is None:
+            return None
+        return replace(result, details={**result.details, "speculative": True})
+
     def ci_gate(
         self,
         path: str,
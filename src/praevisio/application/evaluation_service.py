@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import contextvars
 import hashlib
 import json
 import os
 import random
+import secrets
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Iterator
@@ -15,23 +20,43 @@ from abductio_core.application.ports import RunSessionDeps
 from abductio_core.application.use_cases.run_session import run_session
 import abductio_core
 
-from ..domain.entities import EvaluationResult, StaticAnalysisResult
+from ..domain.entities import EvaluationResult, StaticAnalysisResult, StaticFinding
 from ..domain.evaluation_config import EvaluationConfig
 from ..domain.ports import StaticAnalyzer, TestRunner, PromiseLoader
 from ..infrastructure.abductio_ports import (
     DeterministicDecomposer,
     DeterministicEvaluator,
     DeterministicSearcher,
-    ListAuditSink,
+    JsonlAuditSink,
+)
+from ..infrastructure.evidence_cache import (
+    EvidenceCache,
+    SemgrepFileCache,
+    sha256_file,
+    tracked_tree_fingerprint,
 )
 from ..infrastructure.evidence_store import EvidenceStore
 from ..infrastructure.promise_loader import YamlPromiseLoader
 from ..infrastructure.report_signing import sign_bytes
+from ..infrastructure.resource_usage import RESOURCES_KEY, ResourceMeter, measure_resources
+from ..infrastructure.run_index import RunIndex, RunRecord, toolchain_from_metadata
 from ..infrastructure.static_analysis_semgrep import SemgrepStaticAnalyzer
+from ..infrastructure.test_impact import PLUGIN as IMPACT_PLUGIN, TestImpactMap
+from ..infrastructure.test_runner_forkserver import ForkServerPytestRunner
 from ..infrastructure.test_runner_subprocess import SubprocessPytestRunner
 from ..infrastructure.toolchain import current_toolchain_metadata
-from ..infrastructure.audit_chain import chain_audit_log
+from ..infrastructure.tracing import Tracer, active_tracer, span
+from ..infrastructure.audit_log import AUDIT_JSON, AUDIT_JSONL, JsonlAuditWriter, write_audit_json
+from ..infrastructure.cancellation import CancelScope, Cancelled
+from ..infrastructure.worktree import isolated_copy
 from ..infrastructure.offline_guard import offline_guard, EgressViolation, OfflineEnforcement
+from .semgrep_batch import PrecomputedStaticAnalyzer, active_static_analysis
+from .evidence_sharing import (
+    SharedEvidence,
+    active_evidence_registry,
+    evidence_fingerprint,
+    evidence_settings,
+)
 
 
 @dataclass(frozen=True)
@@ -54,25 +79,32 @@ class EvaluationService:
         promise_loader: PromiseLoader | None = None,
     ) -> None:
         self._analyzer = analyzer
+        self._test_runner_override = test_runner
         self._test_runner = test_runner or SubprocessPytestRunner()
+        self._forkserver_runners: Dict[Tuple[str, ...], ForkServerPytestRunner] = {}
         self._promise_loader = promise_loader
+        self._promise_loaders: Dict[Path, YamlPromiseLoader] = {}
 
     def evaluate_path(self, path: str, config: EvaluationConfig | None = None) -> EvaluationResult:
         evaluation = config or EvaluationConfig()
-        repo_root = Path(path)
-        run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        with Tracer().active():
+            result = self._evaluate(path, evaluation)
+        self._index_run(Path(path) / evaluation.run_dir, result)
+        return result
 
-        run_root = repo_root / evaluation.run_dir / run_id
-        run_root.mkdir(parents=True, exist_ok=True)
+    def _evaluate(self, path: str, evaluation: EvaluationConfig) -> EvaluationResult:
+        repo_root = Path(path)
+        run_id, run_root = self._create_run_root(repo_root / evaluation.run_dir)
         evidence_store = EvidenceStore(run_root, hash_only=evaluation.hash_only_evidence)
 
         promise = None
         promise_error = None
         try:
-            loader = self._promise_loader or YamlPromiseLoader(
-                base_path=repo_root / "governance" / "promises"
+            loader = self._promise_loader or self._yaml_promise_loader(
+                repo_root / "governance" / "promises"
             )
-            promise = loader.load(evaluation.promise_id)
+            with span("load_promise"):
+                promise = loader.load(evaluation.promise_id)
         except Exception as exc:
             promise_error = str(exc)
 
@@ -96,7 +128,8 @@ class EvaluationService:
                 "required_slots": list(evaluation.abductio_required_slots),
             },
         }
-        toolchain_metadata = current_toolchain_metadata()
+        with span("toolchain"):
+            toolchain_metadata = current_toolchain_metadata()
         manifest_metadata.update(
             {
                 "tool_versions": toolchain_metadata.get("tool_versions"),
@@ -114,8 +147,8 @@ class EvaluationService:
         try:
             with offline_guard(evaluation.offline) as egress_state:
                 if promise_error:
-                    manifest_path, manifest_sha = evidence_store.write_manifest(
-                        metadata=manifest_metadata
+                    manifest_path, manifest_sha = self._write_manifest(
+                        evidence_store, manifest_metadata
                     )
                     details = self._details(
                         evaluation=evaluation,
@@ -141,7 +174,10 @@ class EvaluationService:
                         details=details,
                     )
 
-                analyzer, semgrep_rules_path = self._build_analyzer(evaluation, self._analyzer)
+                with span("configure"):
+                    analyzer, semgrep_rules_path = self._build_analyzer(
+                        path, evaluation, self._analyzer
+                    )
                 anomalies: List[str] = []
                 derived_applicable = self._derive_applicability(evaluation)
                 applicable = derived_applicable
@@ -153,38 +189,68 @@ class EvaluationService:
                     anomalies.append("applicability_override_ignored")
                 anomaly_actions: Dict[str, str] = {}
 
-                collection = self._collect_evidence_payloads(
-                    path, evaluation, analyzer, semgrep_rules_path
-                )
+                registry = active_evidence_registry()
+                fingerprint = evidence_fingerprint(path, evaluation)
+                shared = registry.get(fingerprint) if registry is not None else None
+                if shared is not None:
+                    collection = shared.collection
+                    mismatch = shared.determinism_mismatch
+                else:
+                    with span("evidence"):
+                        collection, mismatch, cache_key, cache_hit = (
+                            self._collect_or_load_evidence(
+                                path, evaluation, analyzer, semgrep_rules_path, toolchain_metadata
+                            )
+                        )
                 determinism = {
                     "runs": evaluation.determinism_runs,
                     "mode": evaluation.determinism_mode,
                     "seed": evaluation.determinism_seed,
-                    "mismatch": False,
+                    "mismatch": mismatch,
                 }
-                if evaluation.determinism_runs > 1:
-                    base_digest = self._evidence_digest(collection)
-                    for _ in range(1, evaluation.determinism_runs):
-                        other = self._collect_evidence_payloads(
-                            path, evaluation, analyzer, semgrep_rules_path
-                        )
-                        if self._evidence_digest(other) != base_digest:
-                            determinism["mismatch"] = True
-                            anomalies.append("toolchain_nondeterminism")
-                            break
-                if "toolchain_nondeterminism" in anomalies:
+                if mismatch:
+                    anomalies.append("toolchain_nondeterminism")
                     anomaly_actions["toolchain_nondeterminism"] = (
                         "Re-run with pinned toolchain or set determinism_seed."
                     )
 
                 pytest_path = "evidence/pytest.json"
                 semgrep_path = "evidence/semgrep.json"
-                pytest_ref = evidence_store.write_json(
-                    pytest_path, collection.pytest_payload, kind="pytest"
-                )
-                semgrep_ref = evidence_store.write_json(
-                    semgrep_path, collection.semgrep_payload, kind="semgrep"
-                )
+                manifest_metadata["evidence_fingerprint"] = fingerprint
+                if shared is not None:
+                    pytest_artifact, semgrep_artifact = shared.artifacts
+                    pytest_ref = evidence_store.link_artifact(pytest_artifact, shared.run_root)
+                    semgrep_ref = evidence_store.link_artifact(
+                        semgrep_artifact, shared.run_root
+                    )
+                    manifest_metadata["evidence_source"] = "shared"
+                    manifest_metadata["evidence_shared_from"] = shared.run_id
+                else:
+                    with span("write_evidence"):
+                        pytest_ref = evidence_store.write_json(
+                            pytest_path, collection.pytest_payload, kind="pytest"
+                        )
+                        semgrep_ref = evidence_store.write_json(
+                            semgrep_path, collection.semgrep_payload, kind="semgrep"
+                        )
+                    manifest_metadata["evidence_source"] = "cache" if cache_hit else "collected"
+                    if cache_key:
+                        manifest_metadata["evidence_cache_key"] = cache_key
+                    if registry is not None:
+                        written = {a.path: a for a in evidence_store.artifacts()}
+                        registry.put(
+                            fingerprint,
+                            SharedEvidence(
+                                collection=collection,
+                                determinism_mismatch=mismatch,
+                                run_id=run_id,
+                                run_root=run_root,
+                                artifacts=[
+                                    written[str(Path(pytest_path))],
+                                    written[str(Path(semgrep_path))],
+                                ],
+                            ),
+                        )
 
                 evidence = collection.evidence
                 evidence_refs = {"pytest": [pytest_ref], "semgrep": [semgrep_ref]}
@@ -211,8 +277,8 @@ class EvaluationService:
                 audit_sha = None
 
                 if collection.sa_result.error or collection.test_error:
-                    manifest_path, manifest_sha = evidence_store.write_manifest(
-                        metadata=manifest_metadata
+                    manifest_path, manifest_sha = self._write_manifest(
+                        evidence_store, manifest_metadata
                     )
                     details = self._details(
                         evaluation=evaluation,
@@ -241,8 +307,8 @@ class EvaluationService:
                         details=details,
                     )
                 if determinism["mismatch"] and evaluation.determinism_mode == "strict":
-                    manifest_path, manifest_sha = evidence_store.write_manifest(
-                        metadata=manifest_metadata
+                    manifest_path, manifest_sha = self._write_manifest(
+                        evidence_store, manifest_metadata
                     )
                     details = self._details(
                         evaluation=evaluation,
@@ -271,7 +337,6 @@ class EvaluationService:
                         details=details,
                     )
 
-                audit_sink = ListAuditSink()
                 evaluator = DeterministicEvaluator(
                     evidence=evidence, evidence_refs=evidence_refs
                 )
@@ -308,15 +373,31 @@ class EvaluationService:
                     evidence_items=evidence_items,
                 )
                 searcher = DeterministicSearcher()
-                result = run_session(
-                    session,
-                    RunSessionDeps(
-                        evaluator=evaluator,
-                        decomposer=decomposer,
-                        audit_sink=audit_sink,
-                        searcher=searcher,
-                    ),
+                egress_outcome = (
+                    "blocked_or_none_attempted" if evaluation.offline else None
                 )
+                # Events go to disk as the session produces them; none are
+                # kept in memory, and a crash leaves a valid partial chain.
+                with JsonlAuditWriter(run_root / AUDIT_JSONL) as audit_log:
+                    with span("run_session"):
+                        result = run_session(
+                            session,
+                            RunSessionDeps(
+                                evaluator=evaluator,
+                                decomposer=decomposer,
+                                audit_sink=JsonlAuditSink(audit_log),
+                                searcher=searcher,
+                            ),
+                        )
+                    if evaluation.offline:
+                        audit_log.append(
+                            **self._egress_event(
+                                policy=egress_policy,
+                                outcome=egress_outcome,
+                                attempted=egress_state.attempted,
+                                error=egress_state.last_error,
+                            )
+                        )
                 credence = float(result.ledger.get(evaluation.promise_id, 0.0))
                 root_view = result.roots.get(evaluation.promise_id, {})
                 k_root = float(root_view.get("k_root", 0.0))
@@ -326,27 +407,10 @@ class EvaluationService:
                 }
                 verdict = "green" if all(gates.values()) else "red"
 
-                audit_payload = result.audit
-                egress_outcome = (
-                    "blocked_or_none_attempted" if evaluation.offline else None
-                )
-                if evaluation.offline:
-                    audit_payload = self._append_audit_event(
-                        audit_payload,
-                        self._egress_event(
-                            policy=egress_policy,
-                            outcome=egress_outcome,
-                            attempted=egress_state.attempted,
-                            error=egress_state.last_error,
-                        ),
+                with span("audit_chain"):
+                    audit_path, audit_sha, merkle_root = self._record_audit(
+                        audit_log, run_root, evidence_store, manifest_metadata
                     )
-                audit_payload = chain_audit_log(audit_payload)
-                audit_path = run_root / "audit.json"
-                audit_text = json.dumps(audit_payload, indent=2, sort_keys=True)
-                audit_bytes = audit_text.encode("utf-8")
-                audit_path.write_bytes(audit_bytes)
-                audit_sha = hashlib.sha256(audit_bytes).hexdigest()
-                evidence_store.record_external("audit", audit_path, audit_sha)
 
                 report_payload = {
                     "run_id": run_id,
@@ -354,20 +418,22 @@ class EvaluationService:
                     "credence": credence,
                     "verdict": verdict,
                     "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+                    "audit_merkle_root": merkle_root,
                 }
-                report_text = json.dumps(report_payload, indent=2, sort_keys=True)
-                report_ref = evidence_store.write_text(
-                    "report.json", report_text, kind="report"
-                )
-                report_sig = sign_bytes(report_text.encode("utf-8"))
-                report_sig_ref = evidence_store.write_text(
-                    "report.sig", report_sig, kind="report_signature"
-                )
+                with span("report"):
+                    report_text = json.dumps(report_payload, indent=2, sort_keys=True)
+                    report_ref = evidence_store.write_text(
+                        "report.json", report_text, kind="report"
+                    )
+                    report_sig = sign_bytes(report_text.encode("utf-8"))
+                    report_sig_ref = evidence_store.write_text(
+                        "report.sig", report_sig, kind="report_signature"
+                    )
                 report_path = run_root / "report.json"
                 report_sig_path = run_root / "report.sig"
 
-                manifest_path, manifest_sha = evidence_store.write_manifest(
-                    metadata=manifest_metadata
+                manifest_path, manifest_sha = self._write_manifest(
+                    evidence_store, manifest_metadata
                 )
 
                 details = self._details(
@@ -378,6 +444,7 @@ class EvaluationService:
                     semgrep_skipped=collection.static_skipped,
                     audit_path=audit_path,
                     audit_sha=audit_sha,
+                    audit_merkle_root=merkle_root,
                     manifest_path=manifest_path,
                     manifest_sha=manifest_sha,
                     run_id=run_id,
@@ -403,24 +470,20 @@ class EvaluationService:
         except EgressViolation as exc:
             error_message = str(exc)
             egress_outcome = "blocked_or_none_attempted"
-            audit_payload = self._append_audit_event(
-                [],
-                self._egress_event(
-                    policy=egress_policy,
-                    outcome=egress_outcome,
-                    attempted=egress_state.attempted,
-                    error=error_message,
-                ),
+            with JsonlAuditWriter(run_root / AUDIT_JSONL) as audit_log:
+                audit_log.append(
+                    **self._egress_event(
+                        policy=egress_policy,
+                        outcome=egress_outcome,
+                        attempted=egress_state.attempted,
+                        error=error_message,
+                    )
+                )
+            audit_path, audit_sha, merkle_root = self._record_audit(
+                audit_log, run_root, evidence_store, manifest_metadata
             )
-            audit_payload = chain_audit_log(audit_payload)
-            audit_path = run_root / "audit.json"
-            audit_text = json.dumps(audit_payload, indent=2, sort_keys=True)
-            audit_bytes = audit_text.encode("utf-8")
-            audit_path.write_bytes(audit_bytes)
-            audit_sha = hashlib.sha256(audit_bytes).hexdigest()
-            evidence_store.record_external("audit", audit_path, audit_sha)
-            manifest_path, manifest_sha = evidence_store.write_manifest(
-                metadata=manifest_metadata
+            manifest_path, manifest_sha = self._write_manifest(
+                evidence_store, manifest_metadata
             )
             details = self._details(
                 evaluation=evaluation,
@@ -430,6 +493,7 @@ class EvaluationService:
                 semgrep_skipped=True,
                 audit_path=audit_path,
                 audit_sha=audit_sha,
+                audit_merkle_root=merkle_root,
                 manifest_path=manifest_path,
                 manifest_sha=manifest_sha,
                 run_id=run_id,
@@ -446,22 +510,104 @@ class EvaluationService:
                 details=details,
             )
 
+    @staticmethod
+    def _write_manifest(
+        evidence_store: EvidenceStore, metadata: Dict[str, Any]
+    ) -> Tuple[Path, str]:
+        """Write `trace.json` (when tracing) and then the manifest hashing it.
+
+        Writing the manifest is the last step of a run and is not traced.
+        """
+        tracer = active_tracer()
+        if tracer is not None:
+            evidence_store.write_json("trace.json", tracer.to_dict(), kind="trace")
+        return evidence_store.write_manifest(metadata=metadata)
+
+    def _yaml_promise_loader(self, base_path: Path) -> YamlPromiseLoader:
+        key = base_path.resolve()
+        loader = self._promise_loaders.get(key)
+        if loader is None:
+            loader = self._promise_loaders[key] = YamlPromiseLoader(base_path=base_path)
+        return loader
+
+    @staticmethod
+    def _create_run_root(runs_dir: Path) -> Tuple[str, Path]:
+        """Create a fresh run directory under `runs_dir` and return its id.
+
+        Ids are the UTC start time (microsecond resolution) plus a random
+        suffix, so they sort chronologically; the directory is created
+        exclusively, and a (very unlikely) clash just draws a new id.
+        """
+        runs_dir.mkdir(parents=True, exist_ok=True)
+        while True:
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")
+            run_id = f"{stamp}-{secrets.token_hex(4)}"
+            run_root = runs_dir / run_id
+            try:
+                run_root.mkdir()
+            except FileExistsError:
+                continue
+            return run_id, run_root
+
+    @staticmethod
+    def _index_run(runs_dir: Path, result: EvaluationResult) -> None:
+        """Add the finished run to the runs directory's SQLite catalog."""
+        details = result.details
+        run_id = details.get("run_id")
+        manifest_path = details.get("manifest_path")
+        if not run_id or not manifest_path:
+            return
+        try:
+            manifest = json.loads(Path(manifest_path).read_text(encoding="utf-8"))
+            metadata = manifest.get("metadata") or {}
+            RunIndex(runs_dir).record(
+                RunRecord(
+                    run_id=run_id,
+                    promise_id=details.get("promise_id"),
+                    verdict=result.verdict,
+                    credence=result.credence,
+                    k_root=details.get("k_root"),
+                    timestamp_utc=metadata.get("timestamp_utc"),
+                    recorded_utc=datetime.now(timezone.utc).isoformat(),
+                    manifest_sha256=details.get("manifest_sha256"),
+                    audit_sha256=details.get("audit_sha256"),
+                    toolchain=toolchain_from_metadata(metadata),
+                )
+            )
+        except (OSError, ValueError, sqlite3.Error):
+            # The index is a cache of the run directories; `runs rebuild`
+            # recovers it, so a failed update must not fail the evaluation.
+            pass
+
     @staticmethod
     def _build_analyzer(
+        path: str,
         evaluation: EvaluationConfig,
         analyzer_override: StaticAnalyzer | None,
     ) -> Tuple[StaticAnalyzer | None, str]:
         semgrep_rules_path = evaluation.semgrep_rules_path
         if analyzer_override is not None:
             return analyzer_override, semgrep_rules_path
+        precomputed = active_static_analysis()
+        if precomputed is not None:
+            return PrecomputedStaticAnalyzer(precomputed), semgrep_rules_path
         if not semgrep_rules_path:
             return None, ""
         if not evaluation.semgrep_callsite_rule_id or not evaluation.semgrep_violation_rule_id:
             return None, semgrep_rules_path
+        baseline_path = None
+        if evaluation.semgrep_incremental:
+            baseline_path = Path(evaluation.evidence_cache_dir) / "semgrep-baseline.json"
+        file_cache = None
+        if evaluation.semgrep_file_cache:
+            file_cache = SemgrepFileCache(Path(path) / evaluation.evidence_cache_dir)
         analyzer = SemgrepStaticAnalyzer(
             rules_path=Path(semgrep_rules_path),
             callsite_rule_id=evaluation.semgrep_callsite_rule_id,
             violation_rule_id=evaluation.semgrep_violation_rule_id,
+            baseline_path=baseline_path,
+            exclude_dirs=(evaluation.run_dir, evaluation.evidence_cache_dir),
+            file_cache=file_cache,
         )
         return analyzer, semgrep_rules_path
 
@@ -513,27 +659,25 @@ class EvaluationService:
         semgrep_rules_path: str,
     ) -> EvidenceCollection:
         with self._determinism_seed(evaluation.determinism_seed):
-            test_passes, tests_skipped, test_exit_code, test_error = self._run_tests(
-                path, evaluation
-            )
-
-            static_skipped = False
-            if analyzer is None:
-                if not semgrep_rules_path:
-                    static_skipped = True
-                    sa_result = StaticAnalysisResult(
-                        total_llm_calls=0, violations=0, coverage=0.0, findings=[]
-                    )
-                else:
-                    sa_result = StaticAnalysisResult(
-                        total_llm_calls=0,
-                        violations=0,
-                        coverage=0.0,
-                        findings=[],
-                        error="semgrep rule ids not configured",
+            # pytest and semgrep are independent subprocesses: run the tests on
+            # a worker thread while static analysis runs here. Both start inside
+            # the seed context, so they inherit the same PRAEVISIO_SEED.
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                tests_future = pool.submit(
+                    contextvars.copy_context().run,
+                    self._measured,
+                    self._run_tests,
+                    path,
+                    evaluation,
+                )
+                with span("semgrep"):
+                    (sa_result, static_skipped), semgrep_resources = self._measured(
+                        self._run_static_analysis, path, analyzer, semgrep_rules_path
                     )
-            else:
-                sa_result = analyzer.analyze(path)
+                (
+                    (test_passes, tests_skipped, test_exit_code, test_error, test_details),
+                    pytest_resources,
+                ) = tests_future.result()
 
         pytest_payload = {
             "targets": list(evaluation.pytest_targets),
@@ -542,6 +686,8 @@ class EvaluationService:
             "skipped": tests_skipped,
             "error": test_error,
         }
+        pytest_payload.update(test_details)
+        pytest_payload[RESOURCES_KEY] = pytest_resources
 
         semgrep_payload = {
             "rules_path": semgrep_rules_path,
@@ -552,7 +698,9 @@ class EvaluationService:
             "violations": sa_result.violations,
             "error": sa_result.error,
             "skipped": static_skipped,
+            "scope": sa_result.scope,
             "findings": [f.__dict__ for f in sa_result.findings],
+            RESOURCES_KEY: semgrep_resources,
         }
 
         evidence = {
@@ -576,27 +724,314 @@ class EvaluationService:
             sa_result=sa_result,
         )
 
+    @staticmethod
+    def _measured(func: Any, *args: Any) -> Tuple[Any, Dict[str, Any]]:
+        """Call `func`, returning its result and its subprocesses' resource use."""
+        with measure_resources() as meter:
+            result = func(*args)
+        return result, meter.summary()
+
+    @staticmethod
+    def _run_static_analysis(
+        path: str,
+        analyzer: StaticAnalyzer | None,
+        semgrep_rules_path: str,
+    ) -> tuple[StaticAnalysisResult, bool]:
+        if analyzer is not None:
+            return analyzer.analyze(path), False
+        if not semgrep_rules_path:
+            return (
+                StaticAnalysisResult(total_llm_calls=0, violations=0, coverage=0.0, findings=[]),
+                True,
+            )
+        return (
+            StaticAnalysisResult(
+                total_llm_calls=0,
+                violations=0,
+                coverage=0.0,
+                findings=[],
+                error="semgrep rule ids not configured",
+            ),
+            False,
+        )
+
+    def _collect_or_load_evidence(
+        self,
+        path: str,
+        evaluation: EvaluationConfig,
+        analyzer: StaticAnalyzer | None,
+        semgrep_rules_path: str,
+        toolchain_metadata: Dict[str, Any],
+    ) -> tuple[EvidenceCollection, bool, str | None, bool]:
+        """Collect evidence, consulting the persistent cache when enabled.
+
+        Returns (collection, determinism_mismatch, cache_key, cache_hit).
+        Only clean collections (no tool errors, deterministic) are stored.
+        """
+        cache = None
+        cache_key = None
+        if evaluation.evidence_cache:
+            cache_key = self._evidence_cache_key(
+                path, evaluation, semgrep_rules_path, toolchain_metadata
+            )
+            if cache_key:
+                cache = EvidenceCache(Path(path) / evaluation.evidence_cache_dir)
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return self._collection_from_cache(cached), False, cache_key, True
+
+        collection = self._collect_evidence_payloads(
+            path, evaluation, analyzer, semgrep_rules_path
+        )
+        with span("determinism", runs=evaluation.determinism_runs):
+            mismatch = self._determinism_mismatch(
+                path, evaluation, analyzer, semgrep_rules_path, collection
+            )
+        clean = not (collection.sa_result.error or collection.test_error or mismatch)
+        if cache is not None and cache_key and clean:
+            cache.put(cache_key, self._collection_to_cache(collection))
+        return collection, mismatch, cache_key, False
+
+    @staticmethod
+    def _evidence_cache_key(
+        path: str,
+        evaluation: EvaluationConfig,
+        semgrep_rules_path: str,
+        toolchain_metadata: Dict[str, Any],
+    ) -> str | None:
+        repo_root = Path(path)
+        tree = tracked_tree_fingerprint(repo_root)
+        if tree is None:
+            return None
+        rules_sha = None
+        if semgrep_rules_path:
+            rules_path = Path(semgrep_rules_path)
+            if not rules_path.is_absolute():
+                rules_path = repo_root / rules_path
+            rules_sha = sha256_file(rules_path)
+        payload = {
+            "tree": tree,
+            "semgrep_rules_sha256": rules_sha,
+            "evidence_settings": evidence_settings(evaluation),
+            "tool_versions": toolchain_metadata.get("tool_versions"),
+            "python_version": toolchain_metadata.get("python_version"),
+        }
+        encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    @staticmethod
+    def _collection_to_cache(collection: EvidenceCollection) -> Dict[str, Any]:
+        # Resource figures belong to the run that collected the evidence;
+        # a later run replaying it from the cache did not use them.
+        return {
+            "evidence": collection.evidence,
+            "pytest_payload": _without_resources(collection.pytest_payload),
+            "semgrep_payload": _without_resources(collection.semgrep_payload),
+            "static_skipped": collection.static_skipped,
+        }
+
+    @staticmethod
+    def _collection_from_cache(payload: Dict[str, Any]) -> EvidenceCollection:
+        # No tool ran for a cache hit; entries written before resources were
+        # stripped may still carry the collecting run's figures.
+        cached = {**ResourceMeter().summary(), "cached": True}
+        semgrep_payload = {**_without_resources(payload["semgrep_payload"]), RESOURCES_KEY: cached}
+        pytest_payload = {**_without_resources(payload["pytest_payload"]), RESOURCES_KEY: cached}
+        sa_result = StaticAnalysisResult(
+            total_llm_calls=semgrep_payload.get("total_calls", 0),
+            violations=semgrep_payload.get("violations", 0),
+            coverage=semgrep_payload.get("coverage", 0.0),
+            findings=[StaticFinding(**item) for item in semgrep_payload.get("findings", [])],
+            error=semgrep_payload.get("error"),
+            scope=semgrep_payload.get("scope", "full"),
+        )
+        return EvidenceCollection(
+            evidence=payload["evidence"],
+            pytest_payload=pytest_payload,
+            semgrep_payload=semgrep_payload,
+            static_skipped=bool(payload.get("static_skipped", False)),
+            test_error=pytest_payload.get("error"),
+            sa_result=sa_result,
+        )
+
+    def _determinism_mismatch(
+        self,
+        path: str,
+        evaluation: EvaluationConfig,
+        analyzer: StaticAnalyzer | None,
+        semgrep_rules_path: str,
+        collection: EvidenceCollection,
+    ) -> bool:
+        if evaluation.determinism_runs <= 1:
+            return False
+        base_digest = self._evidence_digest(collection)
+        # Replicates re-run the configured targets in full: after the first
+        # run the impact map would trust every test and nothing would execute.
+        # Each replicate lives in a throwaway copy, so a warm fork server
+        # there would be started cold and never reused; run pytest directly.
+        replicate = replace(evaluation, test_impact=False, pytest_runner="subprocess")
+        scope = CancelScope()
+        replicates = evaluation.determinism_runs - 1
+        # Replicates run concurrently, each in its own copy of the tree. The
+        # seed is set once around all of them so their entries and exits
+        # cannot unset PRAEVISIO_SEED under each other.
+        with self._determinism_seed(evaluation.determinism_seed), ThreadPoolExecutor(
+            max_workers=replicates
+        ) as pool:
+            futures = [
+                pool.submit(
+                    self._replicate_digest, path, replicate, analyzer, semgrep_rules_path, scope
+                )
+                for _ in range(replicates)
+            ]
+            for future in as_completed(futures):
+                if future.result() != base_digest:
+                    # First mismatch decides; stop the remaining replicates.
+                    scope.cancel()
+                    for pending in futures:
+                        pending.cancel()
+                    return True
+        return False
+
+    def _replicate_digest(
+        self,
+        path: str,
+        evaluation: EvaluationConfig,
+        analyzer: StaticAnalyzer | None,
+        semgrep_rules_path: str,
+        scope: CancelScope,
+    ) -> str | None:
+        """Digest of one replicate collection, or None if it was cancelled."""
+        with scope.active(), isolated_copy(
+            Path(path), exclude=(evaluation.run_dir, evaluation.evidence_cache_dir)
+        ) as copy:
+            try:
+                other = self._collect_evidence_payloads(
+                    str(copy), evaluation, analyzer, semgrep_rules_path
+                )
+            except Cancelled:
+                return None
+            if scope.cancelled:
+                return None
+            return self._evidence_digest(other)
+
     @staticmethod
     def _evidence_digest(collection: EvidenceCollection) -> str:
+        # How the evidence was gathered (test selection, sharding, scan scope,
+        # resources used) is not part of the result being compared.
+        pytest_payload = {
+            k: v
+            for k, v in collection.pytest_payload.items()
+            if k not in ("impact", "shards", RESOURCES_KEY)
+        }
+        impact = collection.pytest_payload.get("impact")
+        if impact and not impact.get("executed") and pytest_payload.get("exit_code") is None:
+            # Every test was trusted and none ran: the run asserts the pass
+            # that a full replicate records as exit code 0.
+            pytest_payload["exit_code"] = 0
         payload = {
-            "pytest": collection.pytest_payload,
-            "semgrep": collection.semgrep_payload,
+            "pytest": pytest_payload,
+            "semgrep": {
+                k: v
+                for k, v in collection.semgrep_payload.items()
+                if k not in ("scope", RESOURCES_KEY)
+            },
         }
         encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
         return hashlib.sha256(encoded).hexdigest()
 
+    def _runner_for(self, path: str, evaluation: EvaluationConfig) -> TestRunner:
+        if self._test_runner_override is not None:
+            return self._test_runner
+        if evaluation.pytest_runner == "forkserver":
+            # One warm runner per preload set, reused by every evaluation
+            # this service runs.
+            key = tuple(evaluation.pytest_preload)
+            if key not in self._forkserver_runners:
+                self._forkserver_runners[key] = ForkServerPytestRunner(preload=key)
+            return self._forkserver_runners[key]
+        if evaluation.pytest_shards > 1:
+            return SubprocessPytestRunner(
+                shards=evaluation.pytest_shards,
+                durations_path=Path(path) / evaluation.evidence_cache_dir / "pytest-durations.json",
+            )
+        return self._test_runner
+
+    def _execute_tests(
+        self, path: str, evaluation: EvaluationConfig, args: List[str]
+    ) -> tuple[int, Dict[str, Any]]:
+        """Run pytest; returns the exit code and extra pytest payload fields."""
+        runner = self._runner_for(path, evaluation)
+        if isinstance(runner, SubprocessPytestRunner):
+            exit_code, shards = runner.run_sharded(path, args)
+            if shards:
+                return exit_code, {"shards": [shard.__dict__ for shard in shards]}
+            return exit_code, {}
+        return runner.run(path, args), {}
+
     def _run_tests(
         self, path: str, evaluation: EvaluationConfig
-    ) -> tuple[bool | None, bool, int | None, str | None]:
+    ) -> tuple[bool | None, bool, int | None, str | None, Dict[str, Any]]:
         if not evaluation.pytest_targets:
-            return None, True, None, None
+            return None, True, None, None, {}
+        with span("pytest", test_impact=evaluation.test_impact):
+            if evaluation.test_impact:
+                return self._run_impacted_tests(path, evaluation)
+            try:
+                test_result_code, details = self._execute_tests(
+                    path, evaluation, [*evaluation.pytest_targets, *evaluation.pytest_args]
+                )
+                return test_result_code == 0, False, test_result_code, None, details
+            except Exception as exc:  # pragma: no cover - defensive
+                return False, False, None, str(exc), {}
+
+    def _run_impacted_tests(
+        self, path: str, evaluation: EvaluationConfig
+    ) -> tuple[bool | None, bool, int | None, str | None, Dict[str, Any]]:
+        """Run only the tests whose recorded dependencies changed.
+
+        Tests skipped as unaffected are listed as `trusted`: their last
+        recorded run passed and none of the files they depend on changed.
+        """
+        cache_dir = Path(path) / evaluation.evidence_cache_dir
+        impact_map = TestImpactMap(
+            cache_dir / "test-impact.json",
+            Path(path),
+            evaluation.pytest_targets,
+            evaluation.pytest_args,
+        )
+        selection = impact_map.select()
+        impact: Dict[str, Any] = {
+            "mode": selection.mode,
+            "reason": selection.reason,
+            "executed": list(selection.targets),
+            "trusted": list(selection.trusted),
+        }
+        if not selection.targets:
+            return True, False, None, None, {"impact": impact}
+        record_path = cache_dir / f"test-impact-{os.getpid()}-{threading.get_ident()}.json"
         try:
-            test_result_code = self._test_runner.run(
-                path, [*evaluation.pytest_targets, *evaluation.pytest_args]
+            test_result_code, details = self._execute_tests(
+                path,
+                evaluation,
+                [
+                    *selection.targets,
+                    *evaluation.pytest_args,
+                    "-p",
+                    IMPACT_PLUGIN,
+                    f"--praevisio-impact-out={record_path}",
+                ],
             )
-            return test_result_code == 0, False, test_result_code, None
         except Exception as exc:  # pragma: no cover - defensive
-            return False, False, None, str(exc)
+            return False, False, None, str(exc), {"impact": impact}
+        # Sharded runs leave one record per shard next to `record_path`.
+        records = sorted(cache_dir.glob(f"{record_path.name}*"))
+        try:
+            impact["map_updated"] = impact_map.update(selection, records)
+        finally:
+            for record in records:
+                record.unlink(missing_ok=True)
+        return test_result_code == 0, False, test_result_code, None, {**details, "impact": impact}
 
     @staticmethod
     def _details(
@@ -620,6 +1055,7 @@ class EvaluationService:
         anomaly_actions: Dict[str, str] | None = None,
         report_path: Path | None = None,
         report_signature_path: Path | None = None,
+        audit_merkle_root: str | None = None,
     ) -> Dict[str, Any]:
         promise_payload = None
         if promise is not None:
@@ -645,6 +1081,7 @@ class EvaluationService:
             "promise_error": promise_error,
             "audit_path": str(audit_path) if audit_path else None,
             "audit_sha256": audit_sha,
+            "audit_merkle_root": audit_merkle_root,
             "manifest_path": str(manifest_path) if manifest_path else None,
             "manifest_sha256": manifest_sha,
             "run_id": run_id,
@@ -691,14 +1128,23 @@ class EvaluationService:
         return {"event_type": "egress_enforcement", "payload": payload}
 
     @staticmethod
-    def _append_audit_event(audit: Any, event: Dict[str, Any]) -> Any:
-        if isinstance(audit, dict) and isinstance(audit.get("events"), list):
-            events = list(audit["events"])
-            events.append(event)
-            return {"events": events}
-        if isinstance(audit, list):
-            return [*audit, event]
-        return [event]
+    def _record_audit(
+        audit_log: JsonlAuditWriter,
+        run_root: Path,
+        evidence_store: EvidenceStore,
+        manifest_metadata: Dict[str, Any],
+    ) -> Tuple[Path, str, str]:
+        """Record the streamed `audit.jsonl` and the `audit.json` derived from it.
+
+        `audit.json` keeps existing readers working; it is written from the
+        JSONL file one event at a time.
+        """
+        audit_path = run_root / AUDIT_JSON
+        audit_sha = write_audit_json(audit_log.path, audit_path)
+        evidence_store.record_external("audit", audit_path, audit_sha)
+        evidence_store.record_external("audit_log", audit_log.path, audit_log.sha256)
+        manifest_metadata["audit_merkle_root"] = audit_log.merkle_root
+        return audit_path, audit_sha, audit_log.merkle_root
 
     @staticmethod
     def _praevisio_version() -> str:
@@ -707,3 +1153,7 @@ class EvaluationService:
             return version
         except Exception:
             return "unknown"
+
+
+def _without_resources(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in payload.items() if key != RESOURCES_KEY}
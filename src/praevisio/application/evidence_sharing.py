@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List
+
+from ..domain.evaluation_config import EvaluationConfig
+from ..infrastructure.evidence_store import EvidenceArtifact
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from .evaluation_service import EvidenceCollection
+
+
+# EvaluationConfig fields that only affect how evidence is interpreted
+# (promise, thresholds, abductio knobs) or where results are written. Every
+# other field is taken to change what pytest/semgrep produce or how it is
+# recorded, so promises that agree on all of them can share one pass and a
+# newly added setting is part of the fingerprint unless it is listed here.
+INTERPRETATION_FIELDS = frozenset(
+    {"promise_id", "threshold", "severity", "thresholds", "run_dir", "determinism_mode"}
+)
+
+EVIDENCE_FIELDS = tuple(
+    item.name
+    for item in fields(EvaluationConfig)
+    if item.name not in INTERPRETATION_FIELDS and not item.name.startswith("abductio_")
+)
+
+
+def evidence_settings(evaluation: EvaluationConfig) -> Dict[str, Any]:
+    return {name: getattr(evaluation, name) for name in EVIDENCE_FIELDS}
+
+
+def evidence_fingerprint(path: str, evaluation: EvaluationConfig) -> str:
+    payload = evidence_settings(evaluation)
+    payload["path"] = str(Path(path).resolve())
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass(frozen=True)
+class SharedEvidence:
+    """Evidence collected by one run and reusable by later runs."""
+
+    collection: "EvidenceCollection"
+    determinism_mismatch: bool
+    run_id: str
+    run_root: Path
+    artifacts: List[EvidenceArtifact] = field(default_factory=list)
+
+
+class EvidenceRegistry:
+    """In-memory map of evidence fingerprint -> shared evidence."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, SharedEvidence] = {}
+
+    def get(self, fingerprint: str) -> SharedEvidence | None:
+        return self._entries.get(fingerprint)
+
+    def put(self, fingerprint: str, shared: SharedEvidence) -> None:
+        self._entries.setdefault(fingerprint, shared)
+
+
+_ACTIVE_REGISTRY: ContextVar[EvidenceRegistry | None] = ContextVar(
+    "praevisio_evidence_registry", default=None
+)
+
+
+@contextmanager
+def shared_evidence(registry: EvidenceRegistry | None = None) -> Iterator[EvidenceRegistry]:
+    """Share collected evidence between evaluations run inside this block.
+
+    Sharing is scoped rather than global because the fingerprint does not
+    cover the working tree: it is only safe while the tree is known not to
+    change, e.g. for the promises of a single ``ci-gate`` invocation.
+    """
+    active = registry or EvidenceRegistry()
+    token = _ACTIVE_REGISTRY.set(active)
+    try:
+        yield active
+    finally:
+        _ACTIVE_REGISTRY.reset(token)
+
+
+def active_evidence_registry() -> EvidenceRegistry | None:
+    return _ACTIVE_REGISTRY.get()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Iterator, List
+
+from ..domain.entities import StaticAnalysisResult
+from ..domain.evaluation_config import EvaluationConfig
+from ..domain.ports import StaticAnalyzer
+from ..infrastructure.static_analysis_semgrep import SemgrepStaticAnalyzer, analyze_batch
+
+
+class PrecomputedStaticAnalyzer(StaticAnalyzer):
+    """StaticAnalyzer that returns a result computed by a batched scan."""
+
+    def __init__(self, result: StaticAnalysisResult) -> None:
+        self._result = result
+
+    def analyze(self, path: str) -> StaticAnalysisResult:
+        return self._result
+
+
+def batch_static_analysis(
+    path: str, evaluations: List[EvaluationConfig]
+) -> List[StaticAnalysisResult | None] | None:
+    """Run Semgrep once for every evaluation that has its own rule set.
+
+    Returns one entry per evaluation (None where there is nothing to batch,
+    e.g. no rules configured), or None if batching does not apply or the
+    combined run failed; callers then analyze per promise as usual.
+    """
+    batchable = [
+        index
+        for index, evaluation in enumerate(evaluations)
+        if evaluation.semgrep_batch
+        # Replicates must re-run the scanner to check it is deterministic.
+        and evaluation.determinism_runs <= 1
+        and evaluation.semgrep_rules_path
+        and evaluation.semgrep_callsite_rule_id
+        and evaluation.semgrep_violation_rule_id
+    ]
+    if len(batchable) < 2:
+        return None
+    analyzers = [
+        SemgrepStaticAnalyzer(
+            rules_path=Path(evaluations[index].semgrep_rules_path),
+            callsite_rule_id=evaluations[index].semgrep_callsite_rule_id,
+            violation_rule_id=evaluations[index].semgrep_violation_rule_id,
+        )
+        for index in batchable
+    ]
+    try:
+        batched = analyze_batch(path, analyzers)
+    except (OSError, RuntimeError):
+        return None
+    results: List[StaticAnalysisResult | None] = [None] * len(evaluations)
+    for index, result in zip(batchable, batched):
+        results[index] = result
+    return results
+
+
+_ACTIVE_RESULT: ContextVar[StaticAnalysisResult | None] = ContextVar(
+    "praevisio_precomputed_static_analysis", default=None
+)
+
+
+@contextmanager
+def precomputed_static_analysis(result: StaticAnalysisResult | None) -> Iterator[None]:
+    """Use `result` instead of running Semgrep for evaluations in this block."""
+    token = _ACTIVE_RESULT.set(result)
+    try:
+        yield
+    finally:
+        _ACTIVE_RESULT.reset(token)
+
+
+def active_static_analysis() -> StaticAnalysisResult | None:
+    return _ACTIVE_RESULT.get()
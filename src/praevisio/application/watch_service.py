@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import posixpath
+import time
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+from ..domain.entities import EvaluationResult
+from ..domain.evaluation_config import EvaluationConfig
+from ..infrastructure.git import SubprocessGitRepository
+from ..infrastructure.speculative_store import SpeculativeResultStore
+from .engine import PraevisioEngine
+
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+class WatchService:
+    """Re-evaluate a working tree in the background as files change.
+
+    The tree is polled every `poll_interval` seconds; once it has been quiet
+    for `debounce` seconds, all changes since the last evaluation are handled
+    by a single evaluation. Each result is stored in the
+    `SpeculativeResultStore` keyed on the working tree's content, where
+    `pre-commit` picks it up instead of evaluating again.
+    """
+
+    def __init__(
+        self,
+        engine: PraevisioEngine,
+        path: str,
+        evaluation: EvaluationConfig,
+        poll_interval: float = 0.5,
+        debounce: float = 0.5,
+        on_result: Callable[[EvaluationResult], None] | None = None,
+    ) -> None:
+        self._engine = engine
+        self._path = path
+        self._root = Path(path)
+        self._evaluation = evaluation
+        self._poll_interval = poll_interval
+        self._debounce = debounce
+        self._on_result = on_result
+        self._git = SubprocessGitRepository(self._root)
+        self._store = SpeculativeResultStore(self._root / evaluation.evidence_cache_dir)
+        # Praevisio writes runs and caches while evaluating; they must not
+        # count as edits.
+        self._excluded = tuple(
+            posixpath.normpath(d).rstrip("/") + "/"
+            for d in (evaluation.run_dir, evaluation.evidence_cache_dir)
+            if d
+        )
+        self._evaluated_state: str | None = None
+
+    def run(self, max_evaluations: int | None = None) -> None:
+        """Watch until interrupted (or after `max_evaluations` evaluations)."""
+        evaluations = 0
+        snapshot = self.snapshot()
+        if self.evaluate_if_changed() is not None:
+            evaluations += 1
+        changed_at: float | None = None
+        while max_evaluations is None or evaluations < max_evaluations:
+            time.sleep(self._poll_interval)
+            current = self.snapshot()
+            if current != snapshot:
+                snapshot = current
+                changed_at = time.monotonic()
+                continue
+            if changed_at is None or time.monotonic() - changed_at < self._debounce:
+                continue
+            changed_at = None
+            if self.evaluate_if_changed() is not None:
+                evaluations += 1
+
+    def snapshot(self) -> Snapshot:
+        """(mtime, size) of every tracked or untracked, non-ignored file."""
+        files = self._git.get_files() or []
+        snapshot: Snapshot = {}
+        for rel in files:
+            if rel.startswith(self._excluded):
+                continue
+            try:
+                stat = (self._root / rel).stat()
+            except OSError:
+                continue
+            snapshot[rel] = (stat.st_mtime_ns, stat.st_size)
+        index_path = self._git.get_index_path()
+        if index_path is not None and index_path.exists():
+            # Staging a new file changes what is tracked without touching it.
+            stat = index_path.stat()
+            snapshot["\0index"] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def evaluate_if_changed(self) -> EvaluationResult | None:
+        """Evaluate the tree unless its current state was already evaluated."""
+        state = self._git.get_worktree_state(exclude=self._excluded)
+        if state is None or state == self._evaluated_state:
+            return None
+        result = self._engine.evaluate(self._path, self._evaluation)
+        # An edit made while evaluating leaves the result for the old state;
+        # it is not stored and the next poll picks the new state up.
+        if self._git.get_worktree_state(exclude=self._excluded) == state:
+            self._store.put(self._evaluation, state, result)
+            self._evaluated_state = state
+        if self._on_result is not None:
+            self._on_result(result)
+        return result
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, Dict, List
 
 from .entities import Hook
 from .evaluation_config import EvaluationConfig
@@ -12,3 +12,5 @@ class Configuration:
     hooks: List[Hook] = field(default_factory=list)
     evaluation: EvaluationConfig = field(default_factory=EvaluationConfig)
     promises: List[str] = field(default_factory=list)
+    # Per-promise EvaluationConfig overrides, e.g. a promise's own Semgrep rules.
+    promise_overrides: Dict[str, Dict[str, Any]] = field(default_factory=dict)
@@ -59,3 +59,4 @@ class StaticAnalysisResult:
     coverage: float
     findings: List[StaticFinding] = field(default_factory=list)
     error: str | None = None
+    scope: str = "full"  # full | incremental
@@ -38,3 +38,12 @@ class EvaluationConfig:
     determinism_mode: str = "warn"  # warn | strict
     determinism_runs: int = 1
     determinism_seed: int | None = None
+    evidence_cache: bool = False
+    evidence_cache_dir: str = ".praevisio/cache"
+    semgrep_incremental: bool = False
+    semgrep_file_cache: bool = False
+    test_impact: bool = False
+    pytest_runner: str = "subprocess"  # subprocess | forkserver
+    pytest_preload: List[str] = field(default_factory=list)
+    pytest_shards: int = 1
+    semgrep_batch: bool = False
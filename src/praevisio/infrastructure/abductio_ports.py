@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from abductio_core.domain.audit import AuditEvent
 from abductio_core.application.dto import EvidenceItem
 
+from .audit_log import JsonlAuditWriter
+
 
 @dataclass
 class ListAuditSink:
@@ -18,6 +20,21 @@ class ListAuditSink:
         return [{"event_type": e.event_type, "payload": dict(e.payload)} for e in self.events]
 
 
+@dataclass
+class JsonlAuditSink:
+    """Audit sink that streams events to disk instead of keeping them.
+
+    `run_session` builds `SessionResult.audit` from `events`, which stays
+    empty; the audit lives in the writer's `audit.jsonl`.
+    """
+
+    writer: JsonlAuditWriter
+    events: Tuple[AuditEvent, ...] = ()
+
+    def append(self, event: AuditEvent) -> None:
+        self.writer.append(event.event_type, dict(event.payload))
+
+
 @dataclass
 class DeterministicDecomposer:
     promise_statement: str
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Optional, Sequence, Tuple
+
+# Artifacts are hashed in chunks of this size: memory stays constant however
+# large an artifact is, and hashlib releases the GIL while digesting each
+# chunk, so a thread pool hashes several artifacts at once.
+CHUNK_SIZE = 1 << 20
+
+# `ArtifactFailure.reason` values.
+MISSING = "missing"
+MISMATCH = "mismatch"
+
+
+@dataclass(frozen=True)
+class ArtifactFailure:
+    path: str
+    reason: str
+
+
+class _Cancelled(Exception):
+    pass
+
+
+class _Cutoff:
+    """Index of the earliest failure seen so far.
+
+    Artifacts after it no longer matter, so their workers stop at the next
+    chunk; artifacts before it still have to be hashed, since one of them
+    may be the first failure in manifest order.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._lock = threading.Lock()
+        self.index = size
+
+    def lower(self, index: int) -> None:
+        with self._lock:
+            self.index = min(self.index, index)
+
+
+def find_first_failure(
+    artifacts: Sequence[Tuple[str, Optional[str]]],
+    open_artifact: Callable[[str], Optional[BinaryIO]],
+    jobs: int = 1,
+) -> ArtifactFailure | None:
+    """Check `(path, sha256)` pairs and return the first failure in order.
+
+    `open_artifact` returns a binary stream for a path, or None when the
+    artifact is missing; it must be safe to call from several threads. A
+    None digest only checks that the artifact exists. With
+    `jobs > 1` artifacts are hashed on a thread pool, but the result is the
+    same as a serial walk: the failing artifact reported is the first one in
+    `artifacts`, whichever worker finished first.
+    """
+    cutoff = _Cutoff(len(artifacts))
+
+    def check(index: int, path: str, expected: str | None) -> str | None:
+        if index > cutoff.index:
+            raise _Cancelled
+        try:
+            reason = _check_one(path, expected, open_artifact, lambda: index > cutoff.index)
+        except _Cancelled:
+            raise
+        except BaseException:
+            cutoff.lower(index)
+            raise
+        if reason is not None:
+            cutoff.lower(index)
+        return reason
+
+    if jobs <= 1 or len(artifacts) <= 1:
+        for index, (path, expected) in enumerate(artifacts):
+            reason = check(index, path, expected)
+            if reason is not None:
+                return ArtifactFailure(path, reason)
+        return None
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="praevisio-hash") as pool:
+        futures = [
+            pool.submit(check, index, path, expected)
+            for index, (path, expected) in enumerate(artifacts)
+        ]
+        try:
+            for future, (path, _) in zip(futures, artifacts):
+                # Every earlier artifact has passed, so this one decides.
+                reason = future.result()
+                if reason is not None:
+                    return ArtifactFailure(path, reason)
+            return None
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def _check_one(
+    path: str,
+    expected: str | None,
+    open_artifact: Callable[[str], Optional[BinaryIO]],
+    cancelled: Callable[[], bool],
+) -> str | None:
+    stream = open_artifact(path)
+    if stream is None:
+        return MISSING
+    if expected is None:
+        stream.close()
+        return None
+    digest = hashlib.sha256()
+    with stream:
+        for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+            if cancelled():
+                raise _Cancelled
+            digest.update(chunk)
+    return None if digest.hexdigest() == expected else MISMATCH
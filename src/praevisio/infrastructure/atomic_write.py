@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+
+def _current_umask() -> int:
+    # os.umask can only be read by setting it, so do that once at import
+    # rather than racing other threads on every write.
+    mask = os.umask(0o022)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _current_umask()
+
+
+def _target_mode(path: Path) -> int:
+    """The mode a plain `open(path, "w")` would leave `path` with."""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def open_atomic(path: Path) -> Iterator[BinaryIO]:
+    """Open a sibling temp file for writing; rename it over `path` on success.
+
+    Readers see either the previous content or the complete new content,
+    never a partially written file. Lets large files be written in pieces.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            # mkstemp creates the file 0600; give it the usual mode instead.
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, _target_mode(path))
+            yield handle
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write `data` to a sibling temp file, then rename it over `path`."""
+    with open_atomic(path) as handle:
+        handle.write(data)
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    write_bytes_atomic(path, text.encode("utf-8"))
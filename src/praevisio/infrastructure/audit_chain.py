@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any, Dict, List, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Tuple
 
 
 def _extract_events(audit: Any) -> List[Dict[str, Any]]:
@@ -20,35 +21,257 @@ def _canonical_event(event_type: str | None, payload: Dict[str, Any]) -> str:
     )
 
 
-def chain_audit_log(audit: Any) -> Any:
-    events = _extract_events(audit)
-    prev_hash = "GENESIS"
-    for event in events:
-        payload = dict(event.get("payload") or {})
-        payload["prev_hash"] = prev_hash
-        entry_hash = hashlib.sha256(
-            _canonical_event(event.get("event_type"), payload).encode("utf-8")
-        ).hexdigest()
+def _entry_hash(event_type: str | None, payload: Dict[str, Any]) -> str:
+    return hashlib.sha256(_canonical_event(event_type, payload).encode("utf-8")).hexdigest()
+
+
+class AuditChainer:
+    """Hash-chain audit events one at a time, as they are produced.
+
+    `chain_audit_log` is the whole-log form; both give the same hashes.
+    """
+
+    def __init__(self) -> None:
+        self._prev_hash = "GENESIS"
+        self._merkle = MerkleAccumulator()
+
+    @property
+    def merkle_root(self) -> str:
+        return self._merkle.root()
+
+    def link(self, event_type: str | None, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """A copy of `payload` with its `prev_hash` and `entry_hash` set."""
+        payload = dict(payload)
+        payload["prev_hash"] = self._prev_hash
+        entry_hash = _entry_hash(event_type, payload)
         payload["entry_hash"] = entry_hash
-        event["payload"] = payload
-        prev_hash = entry_hash
+        self._prev_hash = entry_hash
+        self._merkle.add(entry_hash)
+        return payload
+
+
+def chain_audit_log(audit: Any) -> Any:
+    chainer = AuditChainer()
+    for event in _extract_events(audit):
+        event["payload"] = chainer.link(event.get("event_type"), event.get("payload") or {})
     return audit
 
 
-def validate_audit_log(audit: Any) -> Tuple[bool, str]:
-    events = _extract_events(audit)
-    prev_hash = "GENESIS"
-    for event in events:
+class AuditChainValidator:
+    """Check a hash-chained audit log one event at a time.
+
+    Lets callers validate a log as they read it, without holding it in
+    memory; `validate_audit_log` is the whole-log form.
+    """
+
+    def __init__(self) -> None:
+        self._prev_hash = "GENESIS"
+        self._merkle = MerkleAccumulator()
+        self.error = ""
+
+    @property
+    def merkle_root(self) -> str:
+        """Merkle root over the entry hashes of the events added so far."""
+        return self._merkle.root()
+
+    def add(self, event: Dict[str, Any]) -> bool:
+        """Check the next event; False (with `error` set) once the chain breaks."""
+        if self.error:
+            return False
         payload = dict(event.get("payload") or {})
         if "prev_hash" not in payload or "entry_hash" not in payload:
-            return False, "hash chain missing entry"
-        if payload["prev_hash"] != prev_hash:
-            return False, "hash chain mismatch (missing entry)"
+            self.error = "hash chain missing entry"
+            return False
+        if payload["prev_hash"] != self._prev_hash:
+            self.error = "hash chain mismatch (missing entry)"
+            return False
         entry_hash = payload.pop("entry_hash")
-        expected = hashlib.sha256(
-            _canonical_event(event.get("event_type"), payload).encode("utf-8")
-        ).hexdigest()
-        if entry_hash != expected:
-            return False, "hash chain mismatch"
-        prev_hash = entry_hash
+        if entry_hash != _entry_hash(event.get("event_type"), payload):
+            self.error = "hash chain mismatch"
+            return False
+        self._prev_hash = entry_hash
+        self._merkle.add(entry_hash)
+        return True
+
+
+def validate_audit_log(audit: Any) -> Tuple[bool, str]:
+    validator = AuditChainValidator()
+    for event in _extract_events(audit):
+        if not validator.add(event):
+            return False, validator.error
+    return True, ""
+
+
+# Merkle tree over the chain's entry hashes, shaped as in RFC 6962 (a tree of
+# n leaves splits at the largest power of two below n), with its 0x00/0x01
+# prefixes so a leaf can never be passed off as an interior node. The linear
+# chain still proves the log is complete; the tree adds inclusion proofs of
+# one event that take O(log n) hashes to check.
+MERKLE_ALGORITHM = "sha256-rfc6962"
+
+
+def _leaf_hash(entry_hash: str) -> bytes:
+    return hashlib.sha256(b"\x00" + bytes.fromhex(entry_hash)).digest()
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+class MerkleAccumulator:
+    """Merkle root of a sequence of entry hashes, fed one at a time.
+
+    Keeps one hash per complete subtree (O(log n) memory), so the root of a
+    streamed audit log needs no second pass.
+    """
+
+    def __init__(self) -> None:
+        self._size = 0
+        self._stack: List[bytes] = []
+
+    def add(self, entry_hash: str) -> None:
+        node = _leaf_hash(entry_hash)
+        size = self._size
+        while size & 1:
+            node = _node_hash(self._stack.pop(), node)
+            size >>= 1
+        self._stack.append(node)
+        self._size += 1
+
+    def root(self) -> str:
+        if not self._stack:
+            return hashlib.sha256(b"").hexdigest()
+        node = self._stack[-1]
+        for left in reversed(self._stack[:-1]):
+            node = _node_hash(left, node)
+        return node.hex()
+
+
+def _entry_hashes(audit: Any) -> List[str]:
+    hashes = []
+    for index, event in enumerate(_extract_events(audit)):
+        entry_hash = (event.get("payload") or {}).get("entry_hash")
+        if not entry_hash:
+            raise ValueError(f"audit event {index} is not hash-chained")
+        hashes.append(entry_hash)
+    return hashes
+
+
+def audit_merkle_root(audit: Any) -> str:
+    """Merkle root of a chained audit log (see `chain_audit_log`)."""
+    accumulator = MerkleAccumulator()
+    for entry_hash in _entry_hashes(audit):
+        accumulator.add(entry_hash)
+    return accumulator.root()
+
+
+@dataclass(frozen=True)
+class InclusionProof:
+    """Audit path proving that event `index` is in a tree of `tree_size`."""
+
+    index: int
+    tree_size: int
+    entry_hash: str
+    root: str
+    path: List[str] = field(default_factory=list)
+    algorithm: str = MERKLE_ALGORITHM
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "algorithm": self.algorithm,
+            "index": self.index,
+            "tree_size": self.tree_size,
+            "entry_hash": self.entry_hash,
+            "root": self.root,
+            "path": list(self.path),
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "InclusionProof":
+        return cls(
+            index=int(raw["index"]),
+            tree_size=int(raw["tree_size"]),
+            entry_hash=str(raw["entry_hash"]),
+            root=str(raw["root"]),
+            path=[str(item) for item in raw.get("path") or []],
+            algorithm=str(raw.get("algorithm") or MERKLE_ALGORITHM),
+        )
+
+
+def _subtree_root(leaves: Sequence[bytes]) -> bytes:
+    if len(leaves) == 1:
+        return leaves[0]
+    split = 1 << ((len(leaves) - 1).bit_length() - 1)
+    return _node_hash(_subtree_root(leaves[:split]), _subtree_root(leaves[split:]))
+
+
+def _audit_path(index: int, leaves: Sequence[bytes]) -> List[bytes]:
+    if len(leaves) <= 1:
+        return []
+    split = 1 << ((len(leaves) - 1).bit_length() - 1)
+    if index < split:
+        return _audit_path(index, leaves[:split]) + [_subtree_root(leaves[split:])]
+    return _audit_path(index - split, leaves[split:]) + [_subtree_root(leaves[:split])]
+
+
+def inclusion_proof(audit: Any, index: int) -> InclusionProof:
+    """Prove that event `index` of a chained audit log is under its root."""
+    hashes = _entry_hashes(audit)
+    if not 0 <= index < len(hashes):
+        raise IndexError(f"event index {index} out of range (audit has {len(hashes)} events)")
+    leaves = [_leaf_hash(entry_hash) for entry_hash in hashes]
+    return InclusionProof(
+        index=index,
+        tree_size=len(leaves),
+        entry_hash=hashes[index],
+        root=_subtree_root(leaves).hex(),
+        path=[node.hex() for node in _audit_path(index, leaves)],
+    )
+
+
+def inclusion_document(audit: Any, index: int) -> Dict[str, Any]:
+    """A self-contained proof: event `index` itself plus its inclusion proof."""
+    proof = inclusion_proof(audit, index)
+    return {"event": _extract_events(audit)[index], "proof": proof.to_dict()}
+
+
+def verify_inclusion(
+    event: Dict[str, Any], proof: InclusionProof, trusted_root: str
+) -> Tuple[bool, str]:
+    """Check one event against a trusted Merkle root in O(log n) hashes.
+
+    The event is re-hashed as `chain_audit_log` hashed it, so an edited
+    event fails even when its recorded `entry_hash` was left untouched.
+    """
+    if proof.algorithm != MERKLE_ALGORITHM:
+        return False, f"unsupported proof algorithm: {proof.algorithm}"
+    payload = dict(event.get("payload") or {})
+    if payload.pop("entry_hash", None) != proof.entry_hash:
+        return False, "event does not match the proof's entry hash"
+    if _entry_hash(event.get("event_type"), payload) != proof.entry_hash:
+        return False, "event hash mismatch"
+    if not 0 <= proof.index < proof.tree_size:
+        return False, "proof index out of range"
+    # RFC 9162, section 2.1.3.2.
+    fn, sn = proof.index, proof.tree_size - 1
+    node = _leaf_hash(proof.entry_hash)
+    for sibling_hex in proof.path:
+        sibling = bytes.fromhex(sibling_hex)
+        if sn == 0:
+            return False, "proof path too long"
+        if fn & 1 or fn == sn:
+            node = _node_hash(sibling, node)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            node = _node_hash(node, sibling)
+        fn >>= 1
+        sn >>= 1
+    if sn != 0:
+        return False, "proof path too short"
+    if node.hex() != proof.root:
+        return False, "proof does not lead to its root"
+    if proof.root != trusted_root:
+        return False, "merkle root mismatch"
     return True, ""
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+from .atomic_write import open_atomic
+from .audit_chain import AuditChainer
+
+AUDIT_JSONL = "audit.jsonl"
+AUDIT_JSON = "audit.json"
+
+
+def audit_jsonl_line(event: Dict[str, Any]) -> str:
+    """One event as a line of `audit.jsonl`, the format audit packs use."""
+    return json.dumps(event, sort_keys=True) + "\n"
+
+
+class JsonlAuditWriter:
+    """Append hash-chained audit events to `audit.jsonl` as they happen.
+
+    Each event is chained, written and flushed before `append` returns, so
+    memory stays constant however long the session runs, and a crash
+    leaves every event produced so far on disk with a valid chain. The
+    SHA-256 of the file and the Merkle root are kept up to date as it grows.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._path = path
+        self._handle = path.open("wb")
+        self._chainer = AuditChainer()
+        self._digest = hashlib.sha256()
+        self.events = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+    @property
+    def merkle_root(self) -> str:
+        return self._chainer.merkle_root
+
+    def append(self, event_type: str | None, payload: Dict[str, Any]) -> None:
+        event = {"event_type": event_type, "payload": self._chainer.link(event_type, payload)}
+        data = audit_jsonl_line(event).encode("utf-8")
+        self._handle.write(data)
+        self._handle.flush()
+        self._digest.update(data)
+        self.events += 1
+
+    def close(self) -> None:
+        self._handle.close()
+
+    def __enter__(self) -> "JsonlAuditWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def iter_audit_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                yield json.loads(line)
+
+
+def write_audit_json(jsonl_path: Path, json_path: Path) -> str:
+    """Write the single-document `audit.json` from `audit.jsonl`.
+
+    Streams one event at a time, producing the same bytes as
+    `json.dumps(events, indent=2, sort_keys=True)`. Returns its SHA-256.
+    """
+    digest = hashlib.sha256()
+    with open_atomic(json_path) as handle:
+
+        def write(text: str) -> None:
+            data = text.encode("utf-8")
+            handle.write(data)
+            digest.update(data)
+
+        separator = "[\n"
+        for event in iter_audit_jsonl(jsonl_path):
+            text = json.dumps(event, indent=2, sort_keys=True)
+            write(separator + "\n".join("  " + line for line in text.split("\n")))
+            separator = ",\n"
+        write("[]" if separator == "[\n" else "\n]")
+    return digest.hexdigest()
+
+
+def load_audit(path: Path) -> Any:
+    """Read an audit log from `audit.jsonl` or the single-document `audit.json`."""
+    if path.suffix == ".jsonl":
+        return list(iter_audit_jsonl(path))
+    return json.loads(path.read_text(encoding="utf-8"))
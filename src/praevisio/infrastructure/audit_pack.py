@@ -1,13 +1,15 @@
 from __future__ import annotations
 
-import hashlib
+import io
 import json
+import threading
 import zipfile
-from pathlib import Path
-from tempfile import TemporaryDirectory
-from typing import Any, Dict, List, Tuple
+from pathlib import Path, PurePath
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
-from .audit_chain import validate_audit_log
+from .artifact_hashing import MISSING, find_first_failure
+from .audit_chain import AuditChainValidator, audit_merkle_root, validate_audit_log
+from .audit_log import AUDIT_JSON, AUDIT_JSONL, audit_jsonl_line
 from .report_signing import verify_bytes
 
 
@@ -20,90 +22,171 @@ def _extract_events(audit: Any) -> List[Dict[str, Any]]:
 
 
 def _audit_to_jsonl(audit: Any) -> str:
-    events = _extract_events(audit)
-    lines = [json.dumps(event, sort_keys=True) for event in events]
-    return "\n".join(lines) + ("\n" if lines else "")
+    return "".join(audit_jsonl_line(event) for event in _extract_events(audit))
 
 
 def export_audit_pack(run_root: Path, out_path: Path) -> None:
+    """Bundle a run's manifest, audit log and artifacts into a zip.
+
+    Runs that streamed their audit to `audit.jsonl` have it copied as is;
+    older runs only have `audit.json`, which is converted.
+    """
     manifest_path = run_root / "manifest.json"
     if not manifest_path.exists():
         raise FileNotFoundError(f"manifest not found: {manifest_path}")
     manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
     artifacts = manifest.get("artifacts", [])
 
-    audit_path = run_root / "audit.json"
+    jsonl_path = run_root / AUDIT_JSONL
+    audit_path = run_root / AUDIT_JSON
     audit_payload = None
-    if audit_path.exists():
+    if not jsonl_path.exists() and audit_path.exists():
         audit_payload = json.loads(audit_path.read_text(encoding="utf-8"))
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
     with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
         zf.write(manifest_path, arcname="manifest.json")
-        if audit_payload is not None:
-            zf.writestr("audit.jsonl", _audit_to_jsonl(audit_payload))
+        if jsonl_path.exists():
+            zf.write(jsonl_path, arcname=AUDIT_JSONL)
+        elif audit_payload is not None:
+            zf.writestr(AUDIT_JSONL, _audit_to_jsonl(audit_payload))
         for artifact in artifacts:
             rel = artifact.get("path")
-            if not rel:
+            if not rel or PurePath(rel).as_posix() == AUDIT_JSONL:
                 continue
             path = run_root / rel
             if path.exists():
                 zf.write(path, arcname=str(rel))
 
 
-def _sha256_bytes(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
+def _member(zf: zipfile.ZipFile, name: str) -> zipfile.ZipInfo | None:
+    try:
+        return zf.getinfo(PurePath(name).as_posix())
+    except KeyError:
+        return None
+
+
+class _MemberReaders:
+    """Open archive members from any thread.
+
+    Members of one `ZipFile` cannot safely be opened concurrently, so each
+    hashing thread gets its own handle on the bundle; the calling thread
+    keeps using the archive it already has open.
+    """
+
+    def __init__(self, zf: zipfile.ZipFile) -> None:
+        self._path = zf.filename
+        self._local = threading.local()
+        self._local.zf = zf
+        self._lock = threading.Lock()
+        self._opened: List[zipfile.ZipFile] = []
+
+    def open(self, name: str) -> Optional[BinaryIO]:
+        zf = getattr(self._local, "zf", None)
+        if zf is None:
+            zf = self._local.zf = zipfile.ZipFile(self._path, "r")
+            with self._lock:
+                self._opened.append(zf)
+        info = _member(zf, name)
+        return None if info is None else zf.open(info)
+
+    def close(self) -> None:
+        for zf in self._opened:
+            zf.close()
+
+
+def _validate_audit_member(zf: zipfile.ZipFile) -> Tuple[bool, str, str | None]:
+    """Check the audit hash chain straight from the archive.
+
+    `audit.jsonl` is validated line by line as it is decompressed; the
+    legacy single-document `audit.json` has to be parsed whole. Also
+    returns the log's Merkle root (None when the bundle has no audit).
+    """
+    jsonl = _member(zf, "audit.jsonl")
+    if jsonl is not None:
+        validator = AuditChainValidator()
+        with zf.open(jsonl) as member:
+            for line in io.TextIOWrapper(member, encoding="utf-8"):
+                if line.strip() and not validator.add(json.loads(line)):
+                    return False, validator.error, None
+        return True, "", validator.merkle_root
+    legacy = _member(zf, "audit.json")
+    if legacy is not None:
+        with zf.open(legacy) as member:
+            audit = json.load(member)
+        ok, error = validate_audit_log(audit)
+        return ok, error, audit_merkle_root(audit) if ok else None
+    return True, "", None
+
+
+def _report_field(report_bytes: bytes, key: str) -> Any:
+    try:
+        report = json.loads(report_bytes.decode("utf-8"))
+    except ValueError:
+        return None
+    return report.get(key) if isinstance(report, dict) else None
+
+
+def verify_audit_pack(bundle_path: Path, jobs: int = 1) -> Tuple[bool, str, Dict[str, Any]]:
+    """Verify a bundle without extracting it.
+
+    Every check reads members directly from the open archive: the audit
+    hash chain and its Merkle root (against the root recorded in the
+    manifest and signed report), the report signature and each manifest
+    artifact's SHA-256
+    (hashed in fixed-size chunks, on `jobs` threads). A failing artifact is
+    reported in manifest order, however many threads hash them.
+    """
+    try:
+        with zipfile.ZipFile(bundle_path, "r") as zf:
+            return _verify_open_pack(zf, jobs)
+    except zipfile.BadZipFile as exc:
+        # Also raised mid-read when a member fails its CRC check.
+        return False, f"corrupt bundle: {exc}", {}
 
 
-def verify_audit_pack(bundle_path: Path) -> Tuple[bool, str, Dict[str, Any]]:
-    with TemporaryDirectory() as tmpdir:
-        tmp_root = Path(tmpdir)
-        with zipfile.ZipFile(bundle_path, "r") as zf:
-            zf.extractall(tmp_root)
-
-        manifest_path = tmp_root / "manifest.json"
-        if not manifest_path.exists():
-            return False, "manifest missing", {}
-        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
-        artifacts = manifest.get("artifacts", [])
-
-        audit_payload = None
-        audit_jsonl_path = tmp_root / "audit.jsonl"
-        audit_json_path = tmp_root / "audit.json"
-        if audit_jsonl_path.exists():
-            events = []
-            for line in audit_jsonl_path.read_text(encoding="utf-8").splitlines():
-                if line.strip():
-                    events.append(json.loads(line))
-            audit_payload = {"events": events}
-        elif audit_json_path.exists():
-            audit_payload = json.loads(audit_json_path.read_text(encoding="utf-8"))
-
-        if audit_payload is not None:
-            ok, error = validate_audit_log(audit_payload)
-            if not ok:
-                return False, error or "hash chain invalid", {}
-
-        report_path = tmp_root / "report.json"
-        sig_path = tmp_root / "report.sig"
-        if report_path.exists() and sig_path.exists():
-            report_bytes = report_path.read_bytes()
-            sig = sig_path.read_text(encoding="utf-8")
-            if not verify_bytes(report_bytes, sig):
-                return False, "signature verification failed", {}
-        else:
-            return False, "signature missing", {}
+def _verify_open_pack(zf: zipfile.ZipFile, jobs: int = 1) -> Tuple[bool, str, Dict[str, Any]]:
+    manifest_info = _member(zf, "manifest.json")
+    if manifest_info is None:
+        return False, "manifest missing", {}
+    manifest = json.loads(zf.read(manifest_info).decode("utf-8"))
+    artifacts = manifest.get("artifacts", [])
 
-        for artifact in artifacts:
-            rel = artifact.get("path")
-            expected = artifact.get("sha256")
-            if not rel or not expected:
-                continue
-            path = tmp_root / rel
-            if not path.exists():
-                return False, f"missing artifact: {rel}", {}
-            actual = _sha256_bytes(path.read_bytes())
-            if actual != expected:
-                return False, f"hash mismatch for {rel}", {}
-
-        return True, "", {"integrity_ok": True}
+    ok, error, merkle_root = _validate_audit_member(zf)
+    if not ok:
+        return False, error or "hash chain invalid", {}
+
+    report_info = _member(zf, "report.json")
+    sig_info = _member(zf, "report.sig")
+    if report_info is not None and sig_info is not None:
+        report_bytes = zf.read(report_info)
+        sig = zf.read(sig_info).decode("utf-8")
+        if not verify_bytes(report_bytes, sig):
+            return False, "signature verification failed", {}
+    else:
+        return False, "signature missing", {}
+
+    # Runs that predate Merkle roots record none; there is nothing to compare.
+    recorded_roots = [
+        (manifest.get("metadata") or {}).get("audit_merkle_root"),
+        _report_field(report_bytes, "audit_merkle_root"),
+    ]
+    if any(root and root != merkle_root for root in recorded_roots):
+        return False, "merkle root mismatch", {}
+
+    expected = [
+        (artifact["path"], artifact["sha256"])
+        for artifact in artifacts
+        if artifact.get("path") and artifact.get("sha256")
+    ]
+    readers = _MemberReaders(zf)
+    try:
+        failure = find_first_failure(expected, readers.open, jobs)
+    finally:
+        readers.close()
+    if failure is not None:
+        if failure.reason == MISSING:
+            return False, f"missing artifact: {failure.path}", {}
+        return False, f"hash mismatch for {failure.path}", {}
+
+    return True, "", {"integrity_ok": True}
@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import importlib.util
+import os
+import shutil
+import sys
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Tuple
+
+try:  # optional dependency, as in config.py
+    import yaml  # type: ignore
+except Exception:  # pragma: no cover - optional import
+    yaml = None
+
+CALLSITE_RULE_ID = "llm-call-site"
+VIOLATION_RULE_ID = "llm-call-must-log"
+
+_RULES = f"""rules:
+  - id: {CALLSITE_RULE_ID}
+    languages: [python]
+    message: LLM call site detected
+    severity: INFO
+    patterns:
+      - pattern: call_llm($PROMPT)
+
+  - id: {VIOLATION_RULE_ID}
+    languages: [python]
+    message: LLM call detected without prior logging
+    severity: ERROR
+    patterns:
+      - pattern: call_llm($PROMPT)
+      - pattern-not-inside: |
+          log($PROMPT)
+          ...
+          call_llm($PROMPT)
+"""
+
+_GATEWAY = '''from __future__ import annotations
+
+LOG: list[str] = []
+
+
+def log(prompt: str) -> None:
+    LOG.append(prompt)
+
+
+def call_llm(prompt: str) -> str:
+    return f"echo:{prompt}"
+'''
+
+# Stand-in for `semgrep --config RULES --json TARGETS...`: reports the two
+# benchmark rules for `call_llm(` lines, flagging those not preceded by a
+# `log(` line, in Semgrep's JSON report layout.
+_SEMGREP_STANDIN = '''import json
+import os
+import sys
+
+CALLSITE, VIOLATION = {callsite!r}, {violation!r}
+
+
+def files(targets):
+    for target in targets:
+        if os.path.isfile(target):
+            yield target
+            continue
+        for base, dirs, names in os.walk(target):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            for name in sorted(names):
+                if name.endswith(".py"):
+                    yield os.path.join(base, name)
+
+
+def result(check_id, path, line, code):
+    return {{"check_id": check_id, "path": path, "start": {{"line": line, "col": 1}},
+            "extra": {{"lines": code}}}}
+
+
+args = sys.argv[1:]
+if "--version" in args:
+    print("0.0.0+praevisio-bench-standin")
+    sys.exit(0)
+targets = [a for i, a in enumerate(args) if not a.startswith("--") and args[i - 1] != "--config"]
+results = []
+for path in files(targets or ["."]):
+    with open(path, encoding="utf-8") as handle:
+        lines = handle.read().splitlines()
+    for number, text in enumerate(lines, 1):
+        if "call_llm(" not in text or text.lstrip().startswith("def "):
+            continue
+        results.append(result(CALLSITE, path, number, text.strip()))
+        if number < 2 or "log(" not in lines[number - 2]:
+            results.append(result(VIOLATION, path, number, text.strip()))
+json.dump({{"results": results, "errors": [], "paths": {{"scanned": []}}}}, sys.stdout)
+'''
+
+# Stand-in for `python -m pytest`: imports each test module and calls its
+# test functions, which is all the generated suites need.
+_PYTEST_STANDIN = '''import importlib.util
+import os
+import sys
+
+sys.path.insert(0, os.getcwd())
+failed = ran = 0
+for target in [a for a in sys.argv[1:] if not a.startswith("-")]:
+    paths = [target] if os.path.isfile(target) else sorted(
+        os.path.join(base, name)
+        for base, _, names in os.walk(target)
+        for name in names
+        if name.startswith("test_") and name.endswith(".py")
+    )
+    for path in paths:
+        spec = importlib.util.spec_from_file_location(os.path.basename(path)[:-3], path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for name in sorted(dir(module)):
+            if name.startswith("test_") and callable(getattr(module, name)):
+                ran += 1
+                try:
+                    getattr(module, name)()
+                except Exception:
+                    failed += 1
+print(f"{{ran - failed}} passed, {{failed}} failed")
+sys.exit(1 if failed else (0 if ran else 5))
+'''
+
+
+@dataclass(frozen=True)
+class BenchScenario:
+    """Shape of one synthetic governed repository.
+
+    `abductio_credits` sets the audit trail's length: each credit buys an
+    operation, up to the point where every required slot is assessed (about
+    75 events for the default slots).
+    """
+
+    name: str
+    files: int = 10
+    call_sites: int = 10
+    findings: int = 1
+    promises: int = 1
+    abductio_credits: int = 6
+
+    def __post_init__(self) -> None:
+        if min(self.files, self.promises, self.abductio_credits) < 1:
+            raise ValueError(f"{self.name}: files, promises and abductio_credits must be >= 1")
+        if not 0 <= self.findings <= self.call_sites:
+            raise ValueError(f"{self.name}: findings must be between 0 and call_sites")
+
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "BenchScenario":
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(raw) - known)
+        if unknown:
+            raise ValueError(f"unknown scenario keys: {', '.join(unknown)}")
+        return cls(**{k: (str(v) if k == "name" else int(v)) for k, v in raw.items()})
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+DEFAULT_SCENARIOS = (
+    BenchScenario(name="small"),
+    BenchScenario(
+        name="medium", files=200, call_sites=400, findings=40, promises=4, abductio_credits=20
+    ),
+)
+
+
+def load_scenarios(path: Path) -> List[BenchScenario]:
+    """Read scenarios from a YAML file with a top-level `scenarios` list."""
+    if yaml is None:
+        raise RuntimeError("PyYAML is required to load benchmark scenarios")
+    raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    return [BenchScenario.from_dict(item) for item in raw.get("scenarios") or []]
+
+
+def generate_governed_repo(root: Path, scenario: BenchScenario) -> Path:
+    """Write a governed repository shaped by `scenario` under `root`.
+
+    Call sites are spread evenly over `files` modules; the first `findings`
+    of them skip the `log()` call and so are policy violations. Each module
+    gets one test. Returns the path of the generated `.praevisio.yaml`.
+    """
+    if root.exists():
+        shutil.rmtree(root)
+    app = root / "app"
+    app.mkdir(parents=True)
+    (app / "__init__.py").write_text("", encoding="utf-8")
+    (app / "gateway.py").write_text(_GATEWAY, encoding="utf-8")
+    tests = root / "tests"
+    tests.mkdir()
+
+    site = 0
+    for index in range(scenario.files):
+        count = scenario.call_sites // scenario.files + (
+            1 if index < scenario.call_sites % scenario.files else 0
+        )
+        body = ["from app.gateway import call_llm, log", ""]
+        for _ in range(count):
+            body += ["", f"def handler_{site}(prompt: str) -> str:"]
+            if site >= scenario.findings:
+                body.append("    log(prompt)")
+            body += ["    return call_llm(prompt)", ""]
+            site += 1
+        body.append(f"MODULE_ID = {index}")
+        (app / f"module_{index}.py").write_text("\n".join(body) + "\n", encoding="utf-8")
+        (tests / f"test_module_{index}.py").write_text(
+            f"from app import module_{index}\n\n\n"
+            f"def test_module_{index}_loads() -> None:\n"
+            f"    assert module_{index}.MODULE_ID == {index}\n",
+            encoding="utf-8",
+        )
+
+    evidence = root / "governance" / "evidence"
+    evidence.mkdir(parents=True)
+    (evidence / "semgrep_rules.yaml").write_text(_RULES, encoding="utf-8")
+    promises_dir = root / "governance" / "promises"
+    promises_dir.mkdir(parents=True)
+    promise_ids = [f"bench-promise-{i}" for i in range(scenario.promises)]
+    for promise_id in promise_ids:
+        (promises_dir / f"{promise_id}.yaml").write_text(
+            f"id: {promise_id}\n"
+            "version: 0.1.0\n"
+            "domain: /llm/observability\n"
+            "statement: All LLM API calls must log input prompts.\n"
+            "critical: true\n",
+            encoding="utf-8",
+        )
+
+    config_path = root / ".praevisio.yaml"
+    config_path.write_text(
+        "evaluation:\n"
+        f"  promise_id: {promise_ids[0]}\n"
+        "  threshold: 0.5\n"
+        "  pytest_targets: [tests]\n"
+        "  semgrep_rules_path: governance/evidence/semgrep_rules.yaml\n"
+        f"  semgrep_callsite_rule_id: {CALLSITE_RULE_ID}\n"
+        f"  semgrep_violation_rule_id: {VIOLATION_RULE_ID}\n"
+        f"  abductio_credits: {scenario.abductio_credits}\n"
+        "promises:\n" + "".join(f"  - {promise_id}\n" for promise_id in promise_ids),
+        encoding="utf-8",
+    )
+    return config_path
+
+
+@dataclass(frozen=True)
+class Standins:
+    """Stand-in tools written by `install_standins` and how to reach them."""
+
+    replaced: Tuple[str, ...] = ()
+    path_dir: str | None = None
+    python_dir: str | None = None
+
+    def environ(self, base: Mapping[str, str] | None = None) -> Dict[str, str]:
+        """`base` (default `os.environ`) with the stand-in directories first."""
+        environ = dict(os.environ if base is None else base)
+        for key, entry in (("PATH", self.path_dir), ("PYTHONPATH", self.python_dir)):
+            if entry:
+                current = environ.get(key)
+                environ[key] = entry if not current else f"{entry}{os.pathsep}{current}"
+        return environ
+
+
+def install_standins(tools_dir: Path, force: bool = False) -> Standins:
+    """Write stand-ins for semgrep and pytest where they are not installed.
+
+    With `force`, both are replaced even when installed, which keeps results
+    comparable between machines with different tool versions.
+    """
+    replaced: List[str] = []
+    path_dir = python_dir = None
+    if force or shutil.which("semgrep") is None:
+        script = tools_dir / "bin" / "semgrep"
+        script.parent.mkdir(parents=True, exist_ok=True)
+        script.write_text(
+            f"#!{sys.executable}\n"
+            + _SEMGREP_STANDIN.format(callsite=CALLSITE_RULE_ID, violation=VIOLATION_RULE_ID),
+            encoding="utf-8",
+        )
+        script.chmod(0o755)
+        path_dir = str(script.parent)
+        replaced.append("semgrep")
+    if force or importlib.util.find_spec("pytest") is None:
+        package = tools_dir / "python" / "pytest"
+        package.mkdir(parents=True, exist_ok=True)
+        (package / "__init__.py").write_text("", encoding="utf-8")
+        (package / "__main__.py").write_text(_PYTEST_STANDIN.format(), encoding="utf-8")
+        python_dir = str(package.parent)
+        replaced.append("pytest")
+    return Standins(replaced=tuple(replaced), path_dir=path_dir, python_dir=python_dir)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import subprocess
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Set
+
+from .resource_usage import MeteredPopen
+
+
+class Cancelled(RuntimeError):
+    """Raised by `run_cancellable` when its scope was cancelled."""
+
+
+class CancelScope:
+    """Cancellation token for a group of subprocesses.
+
+    Subprocesses started through `run_cancellable` while the scope is active
+    (see `active()`) are terminated when `cancel()` is called, and later ones
+    are refused.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._processes: Set[subprocess.Popen] = set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        with self._lock:
+            self._cancelled = True
+            processes = list(self._processes)
+        for process in processes:
+            try:
+                process.kill()
+            except OSError:
+                pass
+
+    @contextmanager
+    def active(self) -> Iterator["CancelScope"]:
+        token = _ACTIVE_SCOPE.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_SCOPE.reset(token)
+
+    def _register(self, process: subprocess.Popen) -> bool:
+        with self._lock:
+            if self._cancelled:
+                return False
+            self._processes.add(process)
+            return True
+
+    def _unregister(self, process: subprocess.Popen) -> None:
+        with self._lock:
+            self._processes.discard(process)
+
+
+_ACTIVE_SCOPE: ContextVar[CancelScope | None] = ContextVar(
+    "praevisio_cancel_scope", default=None
+)
+
+
+@contextmanager
+def popen_cancellable(command: List[str], **kwargs: Any) -> Iterator[subprocess.Popen]:
+    """`subprocess.Popen` that the active `CancelScope` can kill.
+
+    For callers that stream a subprocess' output instead of collecting it.
+    The child's resource usage goes to the active `ResourceMeter`.
+    """
+    scope = _ACTIVE_SCOPE.get()
+    if scope is not None and scope.cancelled:
+        raise Cancelled("cancelled before start")
+    with MeteredPopen(command, **kwargs) as process:
+        if scope is not None and not scope._register(process):
+            process.kill()
+            raise Cancelled("cancelled before start")
+        try:
+            yield process
+        finally:
+            if scope is not None:
+                scope._unregister(process)
+    if scope is not None and scope.cancelled:
+        raise Cancelled("cancelled while running")
+
+
+def run_cancellable(command: List[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    """`subprocess.run` that the active `CancelScope` can interrupt.
+
+    The child's resource usage goes to the active `ResourceMeter`.
+    """
+    scope = _ACTIVE_SCOPE.get()
+    if scope is not None and scope.cancelled:
+        raise Cancelled("cancelled before start")
+    input_data = kwargs.pop("input", None)
+    if input_data is not None:
+        kwargs["stdin"] = subprocess.PIPE
+    if kwargs.pop("capture_output", False):
+        kwargs["stdout"] = subprocess.PIPE
+        kwargs["stderr"] = subprocess.PIPE
+    with MeteredPopen(command, **kwargs) as process:
+        if scope is not None and not scope._register(process):
+            process.kill()
+            process.wait()
+            raise Cancelled("cancelled before start")
+        try:
+            stdout, stderr = process.communicate(input_data)
+        except BaseException:
+            # Like subprocess.run: do not leave the child running.
+            process.kill()
+            raise
+        finally:
+            if scope is not None:
+                scope._unregister(process)
+    if scope is not None and scope.cancelled:
+        raise Cancelled("cancelled while running")
+    return subprocess.CompletedProcess(command, process.returncode, stdout, stderr)
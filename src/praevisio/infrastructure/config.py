@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List
+import os
+from typing import Any, Dict, List, Tuple
 
 try:
     import yaml  # type: ignore
@@ -14,6 +15,14 @@ from ..domain.ports import ConfigLoader
 from ..domain.value_objects import HookType, FilePattern
 
 
+# Settings a `promises` entry may override for that promise only.
+PROMISE_OVERRIDE_FIELDS = (
+    "semgrep_rules_path",
+    "semgrep_callsite_rule_id",
+    "semgrep_violation_rule_id",
+)
+
+
 class InMemoryConfigLoader(ConfigLoader):
     """Return a pre-built Configuration (useful for tests)."""
     def __init__(self, config: Configuration) -> None:
@@ -23,6 +32,29 @@ class InMemoryConfigLoader(ConfigLoader):
         return self._config
 
 
+class CachingConfigLoader(ConfigLoader):
+    """Reuse the parsed Configuration while the file is unchanged.
+
+    Entries are keyed on the resolved path and the file's mtime and size, so
+    long-lived processes (the daemon) see edits without a restart.
+    """
+
+    def __init__(self, inner: ConfigLoader) -> None:
+        self._inner = inner
+        self._cache: Dict[str, Tuple[Tuple[int, int], Configuration]] = {}
+
+    def load(self, path: str) -> Configuration:
+        key = os.path.realpath(path)
+        stat = os.stat(key)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        config = self._inner.load(path)
+        self._cache[key] = (signature, config)
+        return config
+
+
 class YamlConfigLoader(ConfigLoader):
     """Load Configuration from a YAML file on disk."""
 
@@ -33,7 +65,21 @@ class YamlConfigLoader(ConfigLoader):
             raw = yaml.safe_load(f) or {}
         evaluation_raw = raw.get("evaluation", {}) or {}
         promises_raw = raw.get("promises", []) or []
-        promises = [str(item) for item in promises_raw] if isinstance(promises_raw, list) else []
+        promises: List[str] = []
+        promise_overrides: Dict[str, Dict[str, Any]] = {}
+        for item in promises_raw if isinstance(promises_raw, list) else []:
+            if isinstance(item, dict):
+                promise_id = str(item["id"])
+                overrides = {
+                    key: "" if item[key] is None else str(item[key])
+                    for key in PROMISE_OVERRIDE_FIELDS
+                    if key in item
+                }
+                if overrides:
+                    promise_overrides[promise_id] = overrides
+            else:
+                promise_id = str(item)
+            promises.append(promise_id)
         defaults = EvaluationConfig()
         thresholds = evaluation_raw.get("thresholds", {}) or {}
         rules_path_raw = evaluation_raw.get("semgrep_rules_path", defaults.semgrep_rules_path)
@@ -97,6 +143,21 @@ class YamlConfigLoader(ConfigLoader):
                 if "determinism_seed" in evaluation_raw and evaluation_raw["determinism_seed"] is not None
                 else defaults.determinism_seed
             ),
+            evidence_cache=bool(evaluation_raw.get("evidence_cache", defaults.evidence_cache)),
+            evidence_cache_dir=str(
+                evaluation_raw.get("evidence_cache_dir", defaults.evidence_cache_dir)
+            ),
+            semgrep_incremental=bool(
+                evaluation_raw.get("semgrep_incremental", defaults.semgrep_incremental)
+            ),
+            semgrep_file_cache=bool(
+                evaluation_raw.get("semgrep_file_cache", defaults.semgrep_file_cache)
+            ),
+            test_impact=bool(evaluation_raw.get("test_impact", defaults.test_impact)),
+            pytest_runner=str(evaluation_raw.get("pytest_runner", defaults.pytest_runner)),
+            pytest_preload=list(evaluation_raw.get("pytest_preload", defaults.pytest_preload)),
+            pytest_shards=int(evaluation_raw.get("pytest_shards", defaults.pytest_shards)),
+            semgrep_batch=bool(evaluation_raw.get("semgrep_batch", defaults.semgrep_batch)),
         )
         hooks = []
         for item in raw.get("hooks", []) or []:
@@ -113,4 +174,9 @@ class YamlConfigLoader(ConfigLoader):
                 file_scoped=bool(item.get("file_scoped", True)),
             )
             hooks.append(hook)
-        return Configuration(hooks=hooks, evaluation=evaluation, promises=promises)
+        return Configuration(
+            hooks=hooks,
+            evaluation=evaluation,
+            promises=promises,
+            promise_overrides=promise_overrides,
+        )
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .atomic_write import write_text_atomic
+
+
+def tracked_tree_fingerprint(root: Path) -> str | None:
+    """Hash the tracked files under `root` as they currently exist on disk.
+
+    Combines the index (`git ls-files -s`, i.e. path + blob id) with the binary
+    diff of unstaged changes, so edits that have not been staged still change
+    the fingerprint. Returns None outside a git work tree.
+    """
+    digest = hashlib.sha256()
+    for command in (
+        ["git", "ls-files", "-s", "-z"],
+        ["git", "diff", "--binary", "--no-ext-diff", "--no-color"],
+    ):
+        try:
+            result = subprocess.run(command, cwd=root, capture_output=True)
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+        digest.update(result.stdout)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def sha256_file(path: Path) -> str | None:
+    if not path.is_file():
+        return None
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class EvidenceCache:
+    """Content-addressed store of evidence payloads under `.praevisio/cache`."""
+
+    def __init__(self, base_dir: Path) -> None:
+        self._base_dir = base_dir / "evidence"
+
+    def get(self, key: str) -> Dict[str, Any] | None:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if entry.get("key") != key:
+            return None
+        return entry.get("payload")
+
+    def put(self, key: str, payload: Dict[str, Any]) -> Path:
+        path = self._path(key)
+        text = json.dumps({"key": key, "payload": payload}, indent=2, sort_keys=True)
+        write_text_atomic(path, text)
+        return path
+
+    def _path(self, key: str) -> Path:
+        return self._base_dir / key[:2] / f"{key}.json"
+
+
+class SemgrepFileCache:
+    """Content-addressed Semgrep findings for single files.
+
+    Entries are keyed on the file content, the rules file, the Semgrep version
+    and the rule ids, so they stay valid across checkouts and can be restored
+    between CI runners. Findings are stored without their path; the caller
+    re-attaches the path the content currently lives at. `location` is the
+    part of that path the rules can see: the suffix, which selects the
+    language, or the whole relative path when rules filter on `paths:`.
+    """
+
+    def __init__(self, base_dir: Path) -> None:
+        self._base_dir = base_dir / "semgrep"
+
+    @staticmethod
+    def key(
+        file_sha256: str,
+        rules_sha256: str,
+        semgrep_version: str,
+        rule_ids: List[str],
+        location: str,
+    ) -> str:
+        payload = json.dumps(
+            [file_sha256, rules_sha256, semgrep_version, sorted(rule_ids), location]
+        ).encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> List[Dict[str, Any]] | None:
+        path = self._path(key)
+        if not path.exists():
+            return None
+        try:
+            findings = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        return findings if isinstance(findings, list) else None
+
+    def put(self, key: str, findings: List[Dict[str, Any]]) -> None:
+        write_text_atomic(self._path(key), json.dumps(findings, sort_keys=True))
+
+    def _path(self, key: str) -> Path:
+        return self._base_dir / key[:2] / f"{key}.json"
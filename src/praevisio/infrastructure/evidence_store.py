@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import shutil
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+from .atomic_write import write_bytes_atomic
 from .chain_of_custody import ChainOfCustodyLog
 
 
@@ -39,7 +42,9 @@ class EvidenceStore:
         data = content.encode("utf-8")
         sha = self._sha256_bytes(data)
         if not self._hash_only:
-            path.write_bytes(data)
+            # Replace rather than rewrite: the file may be a hard link into
+            # another run directory (see `link_artifact`).
+            write_bytes_atomic(path, data)
         self._record(kind, path, sha, size_bytes=len(data))
         return f"{kind}:sha256:{sha}"
 
@@ -47,6 +52,26 @@ class EvidenceStore:
         text = json.dumps(payload, indent=2, sort_keys=True)
         return self.write_text(name, text, kind=kind)
 
+    def link_artifact(self, artifact: EvidenceArtifact, source_root: Path) -> str:
+        """Record an artifact already written under another run directory.
+
+        The file is hard-linked (copied when linking is not possible) so the
+        run stays self-contained; the recorded hash is the source's.
+        """
+        path = self._base_dir / artifact.path
+        source = source_root / artifact.path
+        if not self._hash_only and source.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if not (path.exists() and os.path.samefile(source, path)):
+                if path.exists():
+                    path.unlink()
+                try:
+                    os.link(source, path)
+                except OSError:
+                    shutil.copyfile(source, path)
+        self._record(artifact.kind, path, artifact.sha256, size_bytes=artifact.size_bytes)
+        return f"{artifact.kind}:sha256:{artifact.sha256}"
+
     def read_text(
         self, name: str, *, evidence_id: str, actor: str, purpose: str
     ) -> str:
@@ -92,7 +117,7 @@ class EvidenceStore:
         path = self._base_dir / name
         text = json.dumps(manifest, indent=2, sort_keys=True)
         data = text.encode("utf-8")
-        path.write_bytes(data)
+        write_bytes_atomic(path, data)
         sha = self._sha256_bytes(data)
         return path, sha
 
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from typing import List
+import hashlib
+import posixpath
+import subprocess
+from pathlib import Path
+from typing import List, Sequence
 
 from ..domain.ports import GitRepository
 
@@ -16,3 +20,110 @@ class InMemoryGitRepository(GitRepository):
 
     def get_commit_message(self) -> str:
         return self._message
+
+
+class SubprocessGitRepository(GitRepository):
+    """GitRepository adapter that shells out to the `git` CLI.
+
+    Paths are reported relative to `root`, which may be a subdirectory of the
+    work tree.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self._root = root
+
+    def get_staged_files(self) -> List[str]:
+        return self._lines(["git", "diff", "--cached", "--name-only", "--relative", "-z"]) or []
+
+    def get_commit_message(self) -> str:
+        git_dir = self._git(["git", "rev-parse", "--git-dir"])
+        if git_dir is None:
+            return ""
+        message_path = self._root / git_dir.decode("utf-8").strip() / "COMMIT_EDITMSG"
+        if not message_path.exists():
+            return ""
+        return message_path.read_text(encoding="utf-8")
+
+    def get_revision(self) -> str | None:
+        output = self._git(["git", "rev-parse", "--verify", "-q", "HEAD"])
+        if output is None:
+            return None
+        return output.decode("utf-8").strip() or None
+
+    def get_changed_files(self, since: str | None = None) -> List[str] | None:
+        """Files whose working-tree content differs from `since` (default HEAD).
+
+        Covers staged, unstaged and untracked (non-ignored) files. Returns None
+        when the revision cannot be compared, e.g. outside a repository.
+        """
+        diff = self._lines(
+            ["git", "diff", "--name-only", "--relative", "-z", since or "HEAD", "--"]
+        )
+        untracked = self._lines(["git", "ls-files", "--others", "--exclude-standard", "-z"])
+        if diff is None or untracked is None:
+            return None
+        return sorted(set(diff) | set(untracked))
+
+    def get_files(self) -> List[str] | None:
+        """Tracked and untracked (non-ignored) files, or None outside git."""
+        return self._lines(
+            ["git", "ls-files", "--cached", "--others", "--exclude-standard", "-z"]
+        )
+
+    def get_worktree_state(self, exclude: Sequence[str] = ()) -> str | None:
+        """Digest of the working-tree content pytest and Semgrep would see.
+
+        Covers tracked files, however staged, and untracked (non-ignored)
+        ones. Paths come from the index; a file with unstaged changes
+        contributes the blob id of its current content and a deleted one
+        drops out, so `git add` alone does not change the digest. Untracked
+        files under an `exclude` directory (e.g. run output) are left out.
+        None outside git.
+        """
+        listing = self._git(["git", "ls-files", "-s", "-z"])
+        modified = self._lines(["git", "diff", "--name-only", "--relative", "--no-renames", "-z"])
+        untracked = self._lines(["git", "ls-files", "--others", "--exclude-standard", "-z"])
+        if listing is None or modified is None or untracked is None:
+            return None
+        blobs = {}
+        for entry in listing.decode("utf-8").split("\0"):
+            if entry:
+                info, _, path = entry.partition("\t")
+                blobs[path] = info.split()[1]
+        excluded = tuple(posixpath.normpath(d).rstrip("/") + "/" for d in exclude if d)
+        changed = [*modified, *(path for path in untracked if not path.startswith(excluded))]
+        present = [path for path in changed if (self._root / path).is_file()]
+        for path in modified:
+            blobs.pop(path, None)
+        if present:
+            hashed = self._git(
+                ["git", "hash-object", "--stdin-paths"], input="\n".join(present).encode("utf-8")
+            )
+            if hashed is None:
+                return None
+            blobs.update(zip(present, hashed.decode("utf-8").split()))
+        digest = hashlib.sha256()
+        for path in sorted(blobs):
+            digest.update(f"{path}\t{blobs[path]}\0".encode("utf-8"))
+        return digest.hexdigest()
+
+    def get_index_path(self) -> Path | None:
+        output = self._git(["git", "rev-parse", "--git-path", "index"])
+        if output is None:
+            return None
+        return self._root / output.decode("utf-8").strip()
+
+    def _lines(self, command: List[str]) -> List[str] | None:
+        output = self._git(command)
+        if output is None:
+            return None
+        return [item for item in output.decode("utf-8").split("\0") if item]
+
+    def _git(self, command: List[str], input: bytes | None = None) -> bytes | None:
+        try:
+            result = subprocess.run(command, cwd=self._root, input=input, capture_output=True)
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Dict, Tuple
 
 import yaml
 
@@ -9,18 +10,35 @@ from ..domain.ports import PromiseLoader
 
 
 class YamlPromiseLoader(PromiseLoader):
-    """Load promise definitions from governance/promises/*.yaml."""
+    """Load promise definitions from governance/promises/*.yaml.
+
+    Parsed promises are kept per loader and reused while the file's mtime and
+    size are unchanged.
+    """
 
     def __init__(self, base_path: Path | None = None) -> None:
         self._base_path = base_path or Path("governance/promises")
+        self._cache: Dict[str, Tuple[Tuple[int, int], Promise]] = {}
 
     def load(self, promise_id: str) -> Promise:
         promise_file = self._base_path / f"{promise_id}.yaml"
-        if not promise_file.exists():
+        try:
+            stat = promise_file.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Promise file not found: {promise_file}\n"
                 f"Expected location: governance/promises/{promise_id}.yaml"
-            )
+            ) from None
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(promise_id)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        promise = self._parse(promise_file)
+        self._cache[promise_id] = (signature, promise)
+        return promise
+
+    @staticmethod
+    def _parse(promise_file: Path) -> Promise:
         data = yaml.safe_load(promise_file.read_text(encoding="utf-8")) or {}
         return Promise(
             id=data["id"],
@@ -0,0 +1,122 @@
+"""Warm pytest fork server.
+
+Started by `ForkServerPytestRunner` as
+``python -m praevisio.infrastructure.pytest_forkserver READ_FD WRITE_FD [MODULE ...]``
+with the governed repository as working directory. It imports pytest, its
+installed plugins and the given modules once, then forks a fresh child for
+every request so each run starts from the same warm, unpolluted state.
+
+Requests and replies are JSON lines on the two pipe file descriptors. If a
+project file that was imported while warming up changes on disk, the server
+answers ``{"restart": true}`` and exits instead of running stale code.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sys
+import time
+import traceback
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+def _project_stamps(root: Path) -> Dict[str, Tuple[int, int]]:
+    stamps: Dict[str, Tuple[int, int]] = {}
+    for module in list(sys.modules.values()):
+        filename = getattr(module, "__file__", None)
+        if not filename:
+            continue
+        path = Path(filename).resolve()
+        if root not in path.parents or "site-packages" in path.parts:
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            stamps[str(path)] = (-1, -1)
+            continue
+        stamps[str(path)] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+def _warm_up(modules: List[str]) -> None:
+    import pytest  # noqa: F401
+
+    for entry_point in entry_points(group="pytest11"):
+        try:
+            entry_point.load()
+        except Exception:  # pragma: no cover - surfaces again in the real run
+            pass
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:  # pragma: no cover - surfaces again in the real run
+            pass
+
+
+def _run_child(request: Dict[str, object]) -> None:
+    code = 3
+    try:
+        import pytest
+
+        os.environ.clear()
+        os.environ.update(request["env"])  # type: ignore[arg-type]
+        os.chdir(str(request["cwd"]))
+        code = int(pytest.main(list(request["args"])))  # type: ignore[arg-type]
+    except SystemExit as exc:
+        code = exc.code if isinstance(exc.code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def main(argv: List[str]) -> int:
+    read_fd, write_fd = int(argv[0]), int(argv[1])
+    root = Path.cwd().resolve()
+    _warm_up(argv[2:])
+    stamps = _project_stamps(root)
+    with os.fdopen(read_fd, "r", encoding="utf-8") as requests, os.fdopen(
+        write_fd, "w", encoding="utf-8"
+    ) as replies:
+
+        def reply(payload: Dict[str, object]) -> None:
+            replies.write(json.dumps(payload) + "\n")
+            replies.flush()
+
+        reply({"ready": True})
+        for line in requests:
+            if _project_stamps(root) != stamps:
+                reply({"restart": True})
+                return 0
+            request = json.loads(line)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid == 0:
+                requests.close()
+                replies.close()
+                _run_child(request)
+            started = time.monotonic()
+            _, status, rusage = os.wait4(pid, 0)
+            reply(
+                {
+                    "exit_code": os.waitstatus_to_exitcode(status),
+                    "usage": {
+                        "wall_s": time.monotonic() - started,
+                        "user_cpu_s": rusage.ru_utime,
+                        "system_cpu_s": rusage.ru_stime,
+                        "ru_maxrss": rusage.ru_maxrss,
+                    },
+                }
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,152 @@
+"""Pytest plugin that records which source files each test depends on.
+
+Loaded into the governed test run with
+``-p praevisio.infrastructure.pytest_impact_plugin --praevisio-impact-out FILE``.
+A test depends on the files of its test module and everything that module
+imports from the project (followed through module globals), loaded
+``conftest.py`` files, and every project file that had a function called
+while the test ran. Files outside the invocation directory and in
+site-packages are ignored.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterable, Set
+
+import pytest
+
+
+def pytest_addoption(parser: Any) -> None:
+    parser.addoption(
+        "--praevisio-impact-out",
+        default=None,
+        help="Write per-test source dependencies to this JSON file.",
+    )
+
+
+def pytest_configure(config: Any) -> None:
+    out = config.getoption("--praevisio-impact-out")
+    if out and not config.getoption("collectonly"):
+        path = Path(out)
+        shard = os.environ.get("PRAEVISIO_PYTEST_SHARD")
+        if shard:
+            # Concurrent shards of one run each write their own record.
+            path = path.with_name(f"{path.name}.shard{shard}")
+        config.pluginmanager.register(_ImpactRecorder(config, path), "praevisio-impact")
+
+
+class _ImpactRecorder:
+    def __init__(self, config: Any, out: Path) -> None:
+        self._out = out
+        self._root = Path(config.invocation_params.dir).resolve()
+        self._rootdir = Path(str(config.rootpath)).resolve()
+        self._relative: Dict[str, str | None] = {}
+        self._module_files: Dict[str, Set[str]] = {}
+        self._tests: Dict[str, Dict[str, Any]] = {}
+        self._called: Set[str] = set()
+
+    def _rel(self, filename: str | None) -> str | None:
+        if not filename or filename.startswith("<"):
+            return None  # <frozen ...>, <string> and other synthetic code
+        if filename not in self._relative:
+            rel = None
+            try:
+                resolved = Path(filename).resolve()
+                candidate = resolved.relative_to(self._root)
+            except (OSError, ValueError):
+                candidate = None
+            if (
+                candidate is not None
+                and "site-packages" not in candidate.parts
+                and resolved.is_file()
+            ):
+                rel = candidate.as_posix()
+            self._relative[filename] = rel
+        return self._relative[filename]
+
+    def _import_closure(self, modules: Iterable[ModuleType]) -> Set[str]:
+        files: Set[str] = set()
+        seen: Set[str] = set()
+        stack = list(modules)
+        while stack:
+            module = stack.pop()
+            name = getattr(module, "__name__", None)
+            if not name or name in seen:
+                continue
+            seen.add(name)
+            rel = self._rel(getattr(module, "__file__", None))
+            if rel is None:
+                continue
+            files.add(rel)
+            parent = name.rpartition(".")[0]
+            if parent in sys.modules:
+                stack.append(sys.modules[parent])
+            for value in list(vars(module).values()):
+                if isinstance(value, ModuleType):
+                    stack.append(value)
+                    continue
+                owner = getattr(value, "__module__", None)
+                if isinstance(owner, str) and owner in sys.modules:
+                    stack.append(sys.modules[owner])
+        return files
+
+    def _test_module_files(self, item: Any) -> Set[str]:
+        module = getattr(item, "module", None)
+        key = getattr(module, "__name__", None) or str(item.path)
+        if key not in self._module_files:
+            files = self._import_closure([module] if module is not None else [])
+            conftests = [
+                m
+                for m in list(sys.modules.values())
+                if isinstance(m, ModuleType)
+                and os.path.basename(getattr(m, "__file__", None) or "") == "conftest.py"
+            ]
+            files |= self._import_closure(conftests)
+            rel = self._rel(str(item.path))
+            if rel is not None:
+                files.add(rel)
+            self._module_files[key] = files
+        return self._module_files[key]
+
+    def _profile(self, frame: Any, event: str, arg: Any) -> None:
+        if event == "call":
+            self._called.add(frame.f_code.co_filename)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item: Any, nextitem: Any):
+        self._called = set()
+        threading.setprofile(self._profile)
+        sys.setprofile(self._profile)
+        try:
+            yield
+        finally:
+            sys.setprofile(None)
+            threading.setprofile(None)
+        deps = set(self._test_module_files(item))
+        deps.update(rel for rel in map(self._rel, self._called) if rel is not None)
+        entry = self._tests.setdefault(self._node_arg(item.nodeid), {"outcome": "passed"})
+        entry["file"] = self._rel(str(item.path))
+        entry["deps"] = sorted(deps)
+
+    def pytest_runtest_logreport(self, report: Any) -> None:
+        entry = self._tests.setdefault(self._node_arg(report.nodeid), {"outcome": "passed"})
+        if report.failed:
+            entry["outcome"] = "failed"
+
+    def pytest_sessionfinish(self, session: Any, exitstatus: int) -> None:
+        self._out.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"exit_status": int(exitstatus), "tests": self._tests}
+        self._out.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+
+    def _node_arg(self, nodeid: str) -> str:
+        # Node ids are relative to pytest's rootdir; store them relative to the
+        # invocation directory so they can be passed straight back to pytest.
+        file_part, sep, rest = nodeid.partition("::")
+        rel = self._rel(str(self._rootdir / file_part)) or file_part
+        return f"{rel}{sep}{rest}"
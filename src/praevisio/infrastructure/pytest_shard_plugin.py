@@ -0,0 +1,50 @@
+"""Pytest plugin used by `SubprocessPytestRunner` to shard a test run.
+
+``--praevisio-collect-out FILE`` writes the collected node ids as a JSON list.
+``--praevisio-shard FILE`` keeps only the node ids listed in FILE and
+deselects the rest. ``--praevisio-durations-out FILE`` writes the total
+setup/call/teardown duration of every test that ran, for balancing the
+next run.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+def pytest_addoption(parser: Any) -> None:
+    group = parser.getgroup("praevisio")
+    group.addoption("--praevisio-collect-out", default=None)
+    group.addoption("--praevisio-shard", default=None)
+    group.addoption("--praevisio-durations-out", default=None)
+
+
+def pytest_collection_modifyitems(config: Any, items: List[Any]) -> None:
+    collect_out = config.getoption("--praevisio-collect-out")
+    if collect_out:
+        Path(collect_out).write_text(
+            json.dumps([item.nodeid for item in items]), encoding="utf-8"
+        )
+    shard_file = config.getoption("--praevisio-shard")
+    if shard_file:
+        wanted = set(json.loads(Path(shard_file).read_text(encoding="utf-8")))
+        keep = [item for item in items if item.nodeid in wanted]
+        deselected = [item for item in items if item.nodeid not in wanted]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = keep
+
+
+_durations: Dict[str, float] = {}
+
+
+def pytest_runtest_logreport(report: Any) -> None:
+    _durations[report.nodeid] = _durations.get(report.nodeid, 0.0) + float(report.duration)
+
+
+def pytest_sessionfinish(session: Any, exitstatus: int) -> None:
+    out = session.config.getoption("--praevisio-durations-out")
+    if out:
+        Path(out).write_text(json.dumps(_durations, sort_keys=True), encoding="utf-8")
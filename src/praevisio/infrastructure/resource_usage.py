@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List
+
+# Evidence payload key holding resource usage. It describes the machine, not
+# the code under evaluation, so evidence digests leave it out.
+RESOURCES_KEY = "resources"
+
+
+@dataclass(frozen=True)
+class ProcessUsage:
+    """Resources used by one finished child process."""
+
+    command: str
+    wall_s: float
+    user_cpu_s: float | None
+    system_cpu_s: float | None
+    max_rss_kb: int | None
+
+    @classmethod
+    def from_rusage(cls, command: str, wall_s: float, rusage: Any) -> "ProcessUsage":
+        if rusage is None:
+            return cls(command, round(wall_s, 6), None, None, None)
+        return cls(
+            command=command,
+            wall_s=round(wall_s, 6),
+            user_cpu_s=round(rusage.ru_utime, 6),
+            system_cpu_s=round(rusage.ru_stime, 6),
+            max_rss_kb=max_rss_kb(rusage.ru_maxrss),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def max_rss_kb(ru_maxrss: int) -> int:
+    """`ru_maxrss` in KiB; macOS reports bytes, Linux and the BSDs KiB."""
+    return int(ru_maxrss // 1024) if sys.platform == "darwin" else int(ru_maxrss)
+
+
+class ResourceMeter:
+    """Collect `ProcessUsage` for the child processes of one tool run."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._processes: List[ProcessUsage] = []
+
+    def record(self, usage: ProcessUsage) -> None:
+        with self._lock:
+            self._processes.append(usage)
+
+    def processes(self) -> List[ProcessUsage]:
+        with self._lock:
+            return list(self._processes)
+
+    def summary(self) -> Dict[str, Any]:
+        """Totals over all recorded processes (RSS is the largest single peak).
+
+        CPU and RSS are None when the platform does not report child rusage.
+        """
+        processes = self.processes()
+        measured = [p for p in processes if p.user_cpu_s is not None]
+        return {
+            "processes": len(processes),
+            "wall_s": round(sum(p.wall_s for p in processes), 6),
+            "user_cpu_s": (
+                round(sum(p.user_cpu_s or 0.0 for p in measured), 6) if measured else None
+            ),
+            "system_cpu_s": (
+                round(sum(p.system_cpu_s or 0.0 for p in measured), 6) if measured else None
+            ),
+            "max_rss_kb": max((p.max_rss_kb or 0 for p in measured), default=None),
+            "invocations": [p.to_dict() for p in processes],
+        }
+
+
+_ACTIVE_METER: ContextVar[ResourceMeter | None] = ContextVar(
+    "praevisio_resource_meter", default=None
+)
+
+
+@contextmanager
+def measure_resources() -> Iterator[ResourceMeter]:
+    """Record children finished through `MeteredPopen` in this context."""
+    meter = ResourceMeter()
+    token = _ACTIVE_METER.set(meter)
+    try:
+        yield meter
+    finally:
+        _ACTIVE_METER.reset(token)
+
+
+def record_usage(usage: ProcessUsage) -> None:
+    """Add `usage` to the active meter, if any (e.g. from a fork server)."""
+    meter = _ACTIVE_METER.get()
+    if meter is not None:
+        meter.record(usage)
+
+
+class MeteredPopen(subprocess.Popen):
+    """`subprocess.Popen` that reaps its child with `os.wait4`.
+
+    The child's rusage (CPU time, peak RSS) is only available from the call
+    that reaps it, so `wait` and `poll` (which `communicate`, `send_signal`
+    and the context manager also go through) call `wait4` themselves where
+    the platform has it. The usage is recorded on the meter active when the
+    process started.
+    """
+
+    def __init__(self, args: Any, *posargs: Any, **kwargs: Any) -> None:
+        self._meter = _ACTIVE_METER.get()
+        self._started = time.monotonic()
+        self._reap_lock = threading.Lock()
+        super().__init__(args, *posargs, **kwargs)
+        argv = [args] if isinstance(args, (str, bytes, os.PathLike)) else list(args)
+        words = [os.fsdecode(a) for a in argv[:3]]
+        self._label = " ".join([os.path.basename(words[0]), *words[1:]]) if words else ""
+
+    def poll(self) -> int | None:
+        if not hasattr(os, "wait4"):
+            return super().poll()
+        if self.returncode is None and self._reap_lock.acquire(blocking=False):
+            try:
+                self._reap(os.WNOHANG)
+            finally:
+                self._reap_lock.release()
+        return self.returncode
+
+    def wait(self, timeout: float | None = None) -> int:
+        if not hasattr(os, "wait4"):
+            return super().wait(timeout)
+        if timeout is None:
+            with self._reap_lock:
+                while self.returncode is None:
+                    self._reap(0)
+            return self.returncode
+        # Like Popen.wait with a timeout: poll with a growing delay.
+        deadline = time.monotonic() + timeout
+        delay = 0.0005
+        while self.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            time.sleep(min(delay, remaining, 0.05))
+            delay *= 2
+        return self.returncode
+
+    def _reap(self, flags: int) -> None:
+        try:
+            pid, status, rusage = os.wait4(self.pid, flags)
+        except ChildProcessError:
+            # Reaped elsewhere (e.g. SIGCHLD ignored): match Popen's handling.
+            self.returncode = 0
+            return
+        if pid != self.pid:
+            return
+        self.returncode = os.waitstatus_to_exitcode(status)
+        if self._meter is not None:
+            self._meter.record(
+                ProcessUsage.from_rusage(self._label, time.monotonic() - self._started, rusage)
+            )
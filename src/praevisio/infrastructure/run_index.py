@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+from .evidence_cache import sha256_file
+
+INDEX_FILENAME = "index.sqlite"
+_SCHEMA_VERSION = 1
+_TOOLCHAIN_KEYS = (
+    "praevisio_version",
+    "abductio_core_version",
+    "tool_versions",
+    "os",
+    "python_version",
+)
+_COLUMNS = (
+    "run_id",
+    "promise_id",
+    "verdict",
+    "credence",
+    "k_root",
+    "timestamp_utc",
+    "recorded_utc",
+    "manifest_sha256",
+    "audit_sha256",
+    "toolchain",
+)
+
+
+@dataclass(frozen=True)
+class RunRecord:
+    """One row of the run index: what `runs list` and `show-run` print."""
+
+    run_id: str
+    promise_id: str | None = None
+    verdict: str | None = None
+    credence: float | None = None
+    k_root: float | None = None
+    timestamp_utc: str | None = None
+    recorded_utc: str | None = None
+    manifest_sha256: str | None = None
+    audit_sha256: str | None = None
+    toolchain: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def toolchain_from_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: metadata.get(key) for key in _TOOLCHAIN_KEYS if key in metadata}
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def record_from_run_dir(run_root: Path) -> RunRecord | None:
+    """Reconstruct a run's index row from the files in its directory."""
+    manifest_path = run_root / "manifest.json"
+    if not manifest_path.is_file():
+        return None
+    metadata = _read_json(manifest_path).get("metadata") or {}
+    report = _read_json(run_root / "report.json")
+    decision = _read_json(run_root / "decision.json")
+    promise_result = (decision.get("promise_results") or [{}])[0]
+    return RunRecord(
+        run_id=run_root.name,
+        promise_id=report.get("promise_id") or promise_result.get("promise_id"),
+        verdict=report.get("verdict") or promise_result.get("verdict"),
+        credence=report.get("credence", promise_result.get("credence")),
+        k_root=promise_result.get("k_root"),
+        timestamp_utc=metadata.get("timestamp_utc"),
+        recorded_utc=datetime.fromtimestamp(
+            manifest_path.stat().st_mtime, timezone.utc
+        ).isoformat(),
+        manifest_sha256=sha256_file(manifest_path),
+        audit_sha256=sha256_file(run_root / "audit.json"),
+        toolchain=toolchain_from_metadata(metadata),
+    )
+
+
+def _epoch(timestamp: str | None) -> float | None:
+    if not timestamp:
+        return None
+    try:
+        parsed = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class RunIndex:
+    """SQLite catalog of the runs stored under a runs directory.
+
+    The database lives at `<runs_dir>/index.sqlite`. It only caches what is
+    already on disk, so when it is missing (or from an older schema) it is
+    rebuilt by scanning the run directories.
+    """
+
+    def __init__(self, runs_dir: Path) -> None:
+        self._runs_dir = runs_dir
+        self._path = runs_dir / INDEX_FILENAME
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def record(self, record: RunRecord) -> None:
+        with closing(self._connect()) as conn, conn:
+            self._upsert(conn, record)
+
+    def get(self, run_id: str) -> RunRecord | None:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return self._from_row(row) if row else None
+
+    def query(
+        self,
+        promise_id: str | None = None,
+        since: str | None = None,
+        limit: int | None = None,
+    ) -> List[RunRecord]:
+        """Runs newest first, optionally filtered by promise and start time."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        if promise_id:
+            clauses.append("promise_id = ?")
+            params.append(promise_id)
+        if since:
+            started = _epoch(since)
+            if started is None:
+                raise ValueError(f"invalid timestamp: {since}")
+            clauses.append("started >= ?")
+            params.append(started)
+        sql = f"SELECT {', '.join(_COLUMNS)} FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY started DESC, run_id DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with closing(self._connect()) as conn:
+            return [self._from_row(row) for row in conn.execute(sql, params)]
+
+    def latest_with_audit(self) -> Path | None:
+        """Audit file of the newest indexed run that still has one on disk."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT run_id FROM runs WHERE audit_sha256 IS NOT NULL"
+                " ORDER BY started DESC, run_id DESC"
+            )
+            for (run_id,) in rows:
+                audit_path = self._runs_dir / run_id / "audit.json"
+                if audit_path.is_file():
+                    return audit_path
+        return None
+
+    def rebuild(self) -> int:
+        """Re-create the index from the run directories; returns the row count."""
+        self._runs_dir.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self._path, timeout=30)) as conn, conn:
+            self._create(conn, drop=True)
+            return self._scan(conn)
+
+    def _connect(self) -> sqlite3.Connection:
+        self._runs_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._path, timeout=30)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != _SCHEMA_VERSION:
+            with conn:
+                self._create(conn, drop=version != 0)
+                self._scan(conn)
+        return conn
+
+    @staticmethod
+    def _create(conn: sqlite3.Connection, drop: bool) -> None:
+        if drop:
+            conn.execute("DROP TABLE IF EXISTS runs")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            " run_id TEXT PRIMARY KEY,"
+            " promise_id TEXT,"
+            " verdict TEXT,"
+            " credence REAL,"
+            " k_root REAL,"
+            " timestamp_utc TEXT,"
+            " started REAL,"
+            " recorded_utc TEXT,"
+            " manifest_sha256 TEXT,"
+            " audit_sha256 TEXT,"
+            " toolchain TEXT)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS runs_by_promise ON runs (promise_id, started)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS runs_by_start ON runs (started)")
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def _scan(self, conn: sqlite3.Connection) -> int:
+        count = 0
+        for entry in sorted(self._run_dirs()):
+            record = record_from_run_dir(entry)
+            if record is not None:
+                self._upsert(conn, record)
+                count += 1
+        return count
+
+    def _run_dirs(self) -> Iterator[Path]:
+        if not self._runs_dir.is_dir():
+            return
+        for entry in self._runs_dir.iterdir():
+            if entry.is_dir():
+                yield entry
+
+    @staticmethod
+    def _upsert(conn: sqlite3.Connection, record: RunRecord) -> None:
+        values = record.to_dict()
+        values["toolchain"] = json.dumps(record.toolchain, sort_keys=True)
+        conn.execute(
+            f"INSERT OR REPLACE INTO runs ({', '.join(_COLUMNS)}, started)"
+            f" VALUES ({', '.join('?' for _ in _COLUMNS)}, ?)",
+            [values[column] for column in _COLUMNS] + [_epoch(record.timestamp_utc)],
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> RunRecord:
+        values = dict(zip(_COLUMNS, row))
+        values["toolchain"] = json.loads(values["toolchain"] or "{}")
+        return RunRecord(**values)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict
+
+from ..domain.entities import EvaluationResult
+from ..domain.evaluation_config import EvaluationConfig
+from .atomic_write import write_text_atomic
+from .toolchain import current_toolchain_metadata
+
+
+def speculation_key(evaluation: EvaluationConfig, state: str) -> str:
+    """Identify an evaluation of working-tree `state` under `evaluation`.
+
+    Covers every evaluation setting and the toolchain, so a result is only
+    reused for exactly the evaluation that would otherwise run.
+    """
+    toolchain = current_toolchain_metadata()
+    payload = {
+        "state": state,
+        "evaluation": asdict(evaluation),
+        "tool_versions": toolchain.get("tool_versions"),
+        "praevisio_version": toolchain.get("praevisio_version"),
+        "abductio_core_version": toolchain.get("abductio_core_version"),
+    }
+    text = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class SpeculativeResultStore:
+    """Latest speculative EvaluationResult per promise, under the cache dir.
+
+    Written by `praevisio watch`, read by `pre-commit`; one file per promise
+    so a newer evaluation simply replaces the previous one.
+    """
+
+    def __init__(self, base_dir: Path) -> None:
+        self._base_dir = base_dir / "speculative"
+
+    def get(self, evaluation: EvaluationConfig, state: str) -> EvaluationResult | None:
+        path = self._path(evaluation.promise_id)
+        if not path.exists():
+            return None
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if entry.get("key") != speculation_key(evaluation, state):
+            return None
+        result: Dict[str, Any] = entry.get("result") or {}
+        return EvaluationResult(
+            credence=result.get("credence"),
+            verdict=result.get("verdict", "error"),
+            details=dict(result.get("details") or {}),
+        )
+
+    def has_entry(self, evaluation: EvaluationConfig) -> bool:
+        return self._path(evaluation.promise_id).exists()
+
+    def put(self, evaluation: EvaluationConfig, state: str, result: EvaluationResult) -> Path:
+        path = self._path(evaluation.promise_id)
+        entry = {
+            "key": speculation_key(evaluation, state),
+            "promise_id": evaluation.promise_id,
+            "result": {
+                "credence": result.credence,
+                "verdict": result.verdict,
+                "details": result.details,
+            },
+        }
+        write_text_atomic(path, json.dumps(entry, indent=2, sort_keys=True, default=str))
+        return path
+
+    def _path(self, promise_id: str) -> Path:
+        safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in promise_id)
+        return self._base_dir / f"{safe or 'default'}.json"
@@ -1,76 +1,468 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import posixpath
+import re
 import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import List
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import yaml
 
 from ..domain.entities import StaticAnalysisResult, StaticFinding
 from ..domain.ports import StaticAnalyzer
+from .atomic_write import write_text_atomic
+from .cancellation import popen_cancellable
+from .evidence_cache import SemgrepFileCache, sha256_file
+from .git import SubprocessGitRepository
+
+# Keep semgrep command lines well below typical ARG_MAX limits.
+_TARGET_CHUNK = 500
+# Size of the reads from semgrep's stdout while streaming its JSON.
+_READ_CHUNK = 1 << 16
+_WHITESPACE = " \t\r\n"
+
+
+def _match_rule(check_id: str | None, rule_id: str) -> bool:
+    if not check_id:
+        return False
+    return check_id == rule_id or check_id.endswith(f".{rule_id}")
+
+
+@dataclass(frozen=True, slots=True)
+class SemgrepMatch:
+    """The parts of a Semgrep result praevisio uses, without the rest of it."""
+
+    check_id: str
+    path: str
+    line: int | None
+    code: str
+
+    @classmethod
+    def from_json(cls, raw: Dict[str, Any]) -> "SemgrepMatch":
+        """Build from a Semgrep result (or a `to_json()` dict)."""
+        return cls(
+            check_id=sys.intern(str(raw.get("check_id") or "")),
+            path=sys.intern(posixpath.normpath(raw.get("path") or "")),
+            line=(raw.get("start") or {}).get("line"),
+            code=(raw.get("extra") or {}).get("lines", ""),
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "check_id": self.check_id,
+            "path": self.path,
+            "start": {"line": self.line},
+            "extra": {"lines": self.code},
+        }
+
+
+class _JsonStream:
+    """Incremental reader for a JSON document arriving in chunks."""
+
+    def __init__(self, stream: IO[str], chunk_size: int) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        data = self._stream.read(self._chunk_size)
+        if not data:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + data
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at the end of the input."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer) or not self._fill():
+                return self._buffer[self._pos : self._pos + 1]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"expected {char!r} at offset {self._pos}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Decode the next JSON value, reading more input until it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            # A scalar that ends with the buffer (e.g. a number) may continue
+            # in the next chunk.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def drain(self) -> None:
+        while self._fill():
+            self._pos = len(self._buffer)
+
+
+def iter_semgrep_results(
+    stream: IO[str], chunk_size: int = _READ_CHUNK
+) -> Iterator[Dict[str, Any]]:
+    """Yield the entries of the top-level "results" array of Semgrep's JSON.
+
+    The output is consumed in `chunk_size` reads and each result is decoded
+    on its own, so memory use is bounded by the largest single result rather
+    than the whole report. Other top-level keys are skipped; empty input
+    yields nothing.
+    """
+    reader = _JsonStream(stream, chunk_size)
+    if reader.peek() == "":
+        return
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        if key == "results":
+            reader.expect("[")
+            if reader.peek() != "]":
+                while True:
+                    yield reader.value()
+                    if reader.peek() != ",":
+                        break
+                    reader.expect(",")
+            reader.expect("]")
+            reader.drain()
+            return
+        reader.value()
+        if reader.peek() != ",":
+            reader.expect("}")
+            return
+        reader.expect(",")
+
+
+def _rules_filter_paths(rules_path: Path) -> bool:
+    """Whether any rule limits where it applies with `paths:`.
+
+    Such rules can report different findings for the same content at two
+    paths. A rules file that cannot be read counts as filtering.
+    """
+    try:
+        document = yaml.safe_load(rules_path.read_text(encoding="utf-8")) or {}
+    except (OSError, yaml.YAMLError):
+        return True
+    rules = document.get("rules") if isinstance(document, dict) else None
+    if not isinstance(rules, list):
+        return True
+    return any(isinstance(rule, dict) and "paths" in rule for rule in rules)
 
 
 class SemgrepStaticAnalyzer(StaticAnalyzer):
-    """StaticAnalyzer implementation using Semgrep."""
+    """StaticAnalyzer implementation using Semgrep.
+
+    When `baseline_path` is set the analyzer runs incrementally: it keeps the
+    per-file findings of the previous scan and only re-scans files that git
+    reports as changed since then. When `file_cache` is set, per-file findings
+    are looked up by content hash and Semgrep only sees the files that miss.
+    """
 
     def __init__(
         self,
         rules_path: Path | None = None,
         callsite_rule_id: str = "llm-call-site",
         violation_rule_id: str = "llm-call-must-log",
+        baseline_path: Path | None = None,
+        git: SubprocessGitRepository | None = None,
+        exclude_dirs: Sequence[str] = (),
+        file_cache: SemgrepFileCache | None = None,
     ) -> None:
         self._rules_path = rules_path or Path("governance/evidence/semgrep_rules.yaml")
         self._callsite_rule_id = callsite_rule_id
         self._violation_rule_id = violation_rule_id
+        self._baseline_path = baseline_path
+        self._git = git
+        self._file_cache = file_cache
+        self._semgrep_version_cache: Optional[str] = None
+        # Praevisio's own output (runs, caches) changes on every evaluation and
+        # must not count as a source change.
+        self._exclude_dirs = tuple(
+            posixpath.normpath(d).rstrip("/") + "/" for d in exclude_dirs if d
+        )
 
     def analyze(self, path: str) -> StaticAnalysisResult:
         # Ensure rules file exists in the target project
         root = Path(path)
+        rules_path = self._resolved_rules_path(root)
+        if not rules_path.exists():
+            return self._missing_rules(rules_path)
+
+        rules_sha = hashlib.sha256(rules_path.read_bytes()).hexdigest()
+        if self._baseline_path is not None:
+            return self._analyze_incremental(root, rules_path, rules_sha)
+        by_file = self._scan(root, rules_path, rules_sha, None)
+        return self._summarize([item for file in sorted(by_file) for item in by_file[file]])
+
+    def _resolved_rules_path(self, root: Path) -> Path:
         rules_path = self._rules_path
         if not rules_path.is_absolute():
             rules_path = root / rules_path
-        rules_path = rules_path.resolve()
-        if not rules_path.exists():
-            return StaticAnalysisResult(
-                total_llm_calls=0,
-                violations=0,
-                coverage=0.0,
-                findings=[],
-                error=(
-                    f"Semgrep rules file not found at {rules_path}\n"
-                    "Expected: governance/evidence/semgrep_rules.yaml\n"
-                    "Run 'praevisio install' to create a default config"
-                ),
+        return rules_path.resolve()
+
+    @staticmethod
+    def _missing_rules(rules_path: Path) -> StaticAnalysisResult:
+        return StaticAnalysisResult(
+            total_llm_calls=0,
+            violations=0,
+            coverage=0.0,
+            findings=[],
+            error=(
+                f"Semgrep rules file not found at {rules_path}\n"
+                "Expected: governance/evidence/semgrep_rules.yaml\n"
+                "Run 'praevisio install' to create a default config"
+            ),
+        )
+
+    def _analyze_incremental(
+        self, root: Path, rules_path: Path, rules_sha: str
+    ) -> StaticAnalysisResult:
+        baseline_path = self._baseline_path
+        if not baseline_path.is_absolute():
+            baseline_path = root / baseline_path
+        git = self._git_for(root)
+        revision = git.get_revision()
+        dirty = self._without_excluded(git.get_changed_files()) if revision else None
+        baseline = self._load_baseline(baseline_path, rules_sha)
+
+        changed = None
+        if baseline is not None and revision is not None and dirty is not None:
+            since = self._without_excluded(git.get_changed_files(since=baseline["revision"]))
+            if since is not None:
+                changed = set(since) | set(dirty) | set(baseline.get("dirty", []))
+
+        if changed is None:
+            scope = "full"
+            by_file = self._scan(root, rules_path, rules_sha, None)
+        else:
+            scope = "incremental"
+            by_file = {
+                file: items
+                for file, items in baseline["files"].items()
+                if file not in changed
+            }
+            targets = sorted(file for file in changed if (root / file).is_file())
+            if targets:
+                by_file.update(self._scan(root, rules_path, rules_sha, targets))
+
+        if revision is not None and dirty is not None:
+            self._save_baseline(
+                baseline_path,
+                {
+                    "rules_sha256": rules_sha,
+                    "callsite_rule_id": self._callsite_rule_id,
+                    "violation_rule_id": self._violation_rule_id,
+                    "revision": revision,
+                    # Files whose content differs from `revision`; they are
+                    # always re-scanned next time since their state is unknown.
+                    "dirty": sorted(dirty),
+                    "files": {
+                        file: [item.to_json() for item in items]
+                        for file, items in by_file.items()
+                    },
+                },
             )
+        merged = [item for file in sorted(by_file) for item in by_file[file]]
+        return self._summarize(merged, scope=scope)
 
-        # First: run Semgrep with JSON output using our governance rules
-        result = subprocess.run(
-            ["semgrep", "--config", str(rules_path), "--json", "."],
-            capture_output=True,
-            text=True,
-            cwd=path,
+    def _scan(
+        self, root: Path, rules_path: Path, rules_sha: str, targets: List[str] | None
+    ) -> Dict[str, List[SemgrepMatch]]:
+        """Relevant findings grouped by file; `targets=None` scans the whole tree."""
+        if self._file_cache is not None:
+            by_file = self._scan_cached(root, rules_path, rules_sha, targets)
+            if by_file is not None:
+                return by_file
+        return self._group_by_file(
+            self._relevant(self._run_semgrep(root, rules_path, targets or ["."]))
         )
 
-        if result.returncode >= 2:
-            raise RuntimeError(f"Semgrep failed: {result.stderr}")
+    def _scan_cached(
+        self, root: Path, rules_path: Path, rules_sha: str, targets: List[str] | None
+    ) -> Dict[str, List[SemgrepMatch]] | None:
+        version = self._semgrep_version()
+        if version is None:
+            return None
+        if targets is None:
+            # Semgrep is handed explicit paths from here on, so the file list
+            # has to come from git to keep ignored files out of the scan.
+            targets = self._without_excluded(self._git_for(root).get_files())
+            if targets is None:
+                return None
+        rule_ids = [self._callsite_rule_id, self._violation_rule_id]
+        path_scoped = _rules_filter_paths(rules_path)
+        by_file: Dict[str, List[SemgrepMatch]] = {}
+        missing: Dict[str, str] = {}
+        for file in sorted(set(targets)):
+            digest = sha256_file(root / file)
+            if digest is None:
+                continue
+            location = posixpath.normpath(file) if path_scoped else posixpath.splitext(file)[1]
+            key = self._file_cache.key(digest, rules_sha, version, rule_ids, location)
+            cached = self._file_cache.get(key)
+            if cached is None:
+                missing[file] = key
+            elif cached:
+                by_file[file] = [
+                    SemgrepMatch.from_json(dict(item, path=file)) for item in cached
+                ]
+        if missing:
+            fresh = self._group_by_file(
+                self._relevant(self._run_semgrep(root, rules_path, list(missing)))
+            )
+            for file, key in missing.items():
+                items = fresh.get(posixpath.normpath(file), [])
+                if items:
+                    by_file[file] = items
+                self._file_cache.put(
+                    key,
+                    [
+                        {k: v for k, v in item.to_json().items() if k != "path"}
+                        for item in items
+                    ],
+                )
+        return by_file
 
-        try:
-            output = json.loads(result.stdout or "{}")
-        except json.JSONDecodeError as exc:
-            raise RuntimeError(f"Could not parse Semgrep output: {exc}") from exc
+    def _semgrep_version(self) -> str | None:
+        if self._semgrep_version_cache is None:
+            try:
+                result = subprocess.run(
+                    ["semgrep", "--version"], capture_output=True, text=True
+                )
+            except OSError:
+                return None
+            if result.returncode != 0 or not result.stdout.strip():
+                return None
+            self._semgrep_version_cache = result.stdout.strip()
+        return self._semgrep_version_cache
+
+    def _git_for(self, root: Path) -> SubprocessGitRepository:
+        return self._git or SubprocessGitRepository(root)
+
+    def _without_excluded(self, files: List[str] | None) -> List[str] | None:
+        if files is None:
+            return None
+        return [f for f in files if not f.startswith(self._exclude_dirs)]
+
+    def _run_semgrep(
+        self,
+        root: Path,
+        rules_path: Path,
+        targets: List[str],
+        keep: Callable[[str], bool] | None = None,
+    ) -> List[SemgrepMatch]:
+        """Run Semgrep and return the matches whose rule id passes `keep`.
+
+        The JSON report is parsed as it is read from the pipe, and results
+        for other rules are dropped immediately instead of being held until
+        the scan finishes. `keep` defaults to this analyzer's two rule ids.
+        """
+        keep = keep or self._is_relevant
+        findings: List[SemgrepMatch] = []
+        for start in range(0, len(targets), _TARGET_CHUNK):
+            chunk = targets[start : start + _TARGET_CHUNK]
+            # First: run Semgrep with JSON output using our governance rules
+            parse_error: ValueError | None = None
+            with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as stderr:
+                with popen_cancellable(
+                    ["semgrep", "--config", str(rules_path), "--json", *chunk],
+                    stdout=subprocess.PIPE,
+                    stderr=stderr,
+                    text=True,
+                    cwd=root,
+                ) as process:
+                    try:
+                        for raw in iter_semgrep_results(process.stdout):
+                            if isinstance(raw, dict) and keep(str(raw.get("check_id") or "")):
+                                findings.append(SemgrepMatch.from_json(raw))
+                    except ValueError as exc:
+                        parse_error = exc
+                        process.stdout.read()
+                    returncode = process.wait()
+
+                if returncode >= 2:
+                    stderr.seek(0)
+                    raise RuntimeError(f"Semgrep failed: {stderr.read()}")
 
-        findings = output.get("results", [])
+            if parse_error is not None:
+                raise RuntimeError(
+                    f"Could not parse Semgrep output: {parse_error}"
+                ) from parse_error
+        return findings
 
-        def _match_rule(check_id: str | None, rule_id: str) -> bool:
-            if not check_id:
-                return False
-            return check_id == rule_id or check_id.endswith(f".{rule_id}")
+    def _is_relevant(self, check_id: str) -> bool:
+        return _match_rule(check_id, self._violation_rule_id) or _match_rule(
+            check_id, self._callsite_rule_id
+        )
+
+    def _relevant(self, findings: Iterable[SemgrepMatch]) -> List[SemgrepMatch]:
+        return [f for f in findings if self._is_relevant(f.check_id)]
+
+    @staticmethod
+    def _group_by_file(findings: Iterable[SemgrepMatch]) -> Dict[str, List[SemgrepMatch]]:
+        by_file: Dict[str, List[SemgrepMatch]] = {}
+        for f in findings:
+            file = posixpath.normpath(f.path)
+            if file != f.path:
+                f = replace(f, path=file)
+            by_file.setdefault(file, []).append(f)
+        return by_file
+
+    def _load_baseline(self, path: Path, rules_sha: str) -> Dict[str, Any] | None:
+        if not path.exists():
+            return None
+        try:
+            baseline = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if (
+            baseline.get("rules_sha256") != rules_sha
+            or baseline.get("callsite_rule_id") != self._callsite_rule_id
+            or baseline.get("violation_rule_id") != self._violation_rule_id
+            or not baseline.get("revision")
+            or not isinstance(baseline.get("files"), dict)
+        ):
+            return None
+        try:
+            baseline["files"] = {
+                file: [SemgrepMatch.from_json(item) for item in items]
+                for file, items in baseline["files"].items()
+            }
+        except (AttributeError, TypeError):
+            return None
+        return baseline
 
-        llm_violations = [
-            f for f in findings if _match_rule(f.get("check_id"), self._violation_rule_id)
-        ]
-        llm_call_sites = [
-            f for f in findings if _match_rule(f.get("check_id"), self._callsite_rule_id)
-        ]
+    @staticmethod
+    def _save_baseline(path: Path, baseline: Dict[str, Any]) -> None:
+        write_text_atomic(path, json.dumps(baseline, indent=2, sort_keys=True))
+
+    def _summarize(
+        self, findings: List[SemgrepMatch], scope: str = "full"
+    ) -> StaticAnalysisResult:
+        llm_violations = [f for f in findings if _match_rule(f.check_id, self._violation_rule_id)]
+        llm_call_sites = [f for f in findings if _match_rule(f.check_id, self._callsite_rule_id)]
 
         total_calls = len(llm_call_sites)
         num_violations = len(llm_violations)
@@ -84,11 +476,7 @@ class SemgrepStaticAnalyzer(StaticAnalyzer):
 
         findings_struct: List[StaticFinding] = []
         for f in llm_violations:
-            path_str = f.get("path", "")
-            start = f.get("start") or {}
-            line = start.get("line")
-            code = (f.get("extra") or {}).get("lines", "")
-            findings_struct.append(StaticFinding(file=path_str, line=line, code=code))
+            findings_struct.append(StaticFinding(file=f.path, line=f.line, code=f.code))
 
         return StaticAnalysisResult(
             total_llm_calls=total_calls,
@@ -96,4 +484,58 @@ class SemgrepStaticAnalyzer(StaticAnalyzer):
             coverage=coverage,
             findings=findings_struct,
             error=None,
+            scope=scope,
+        )
+
+
+_BATCH_ID = re.compile(r"(?:^|\.)praevisio-batch-(\d+)--(.+)$")
+
+
+def analyze_batch(
+    path: str, analyzers: Sequence[SemgrepStaticAnalyzer]
+) -> List[StaticAnalysisResult]:
+    """Analyze `path` for several analyzers with a single Semgrep run.
+
+    The analyzers' rule files are merged into one temporary config in which
+    every rule id is tagged with its file's index; the findings are split
+    back by that tag and summarized by each analyzer with its own
+    callsite/violation rule ids. Results are returned in `analyzers` order.
+    """
+    root = Path(path)
+    rule_files: List[Path] = []
+    merged: List[Dict[str, Any]] = []
+    for analyzer in analyzers:
+        rules_path = analyzer._resolved_rules_path(root)
+        if rules_path in rule_files or not rules_path.exists():
+            continue
+        index = len(rule_files)
+        rule_files.append(rules_path)
+        document = yaml.safe_load(rules_path.read_text(encoding="utf-8")) or {}
+        for rule in document.get("rules") or []:
+            merged.append(dict(rule, id=f"praevisio-batch-{index}--{rule.get('id')}"))
+
+    by_file: Dict[int, List[SemgrepMatch]] = {index: [] for index in range(len(rule_files))}
+    if rule_files:
+        with tempfile.TemporaryDirectory(prefix="praevisio-semgrep-") as tmp:
+            config = Path(tmp) / "rules.yaml"
+            config.write_text(yaml.safe_dump({"rules": merged}), encoding="utf-8")
+            for finding in analyzers[0]._run_semgrep(
+                root, config, ["."], keep=lambda check_id: _BATCH_ID.search(check_id) is not None
+            ):
+                match = _BATCH_ID.search(finding.check_id)
+                by_file[int(match.group(1))].append(
+                    replace(finding, check_id=sys.intern(match.group(2)))
+                )
+
+    results: List[StaticAnalysisResult] = []
+    for analyzer in analyzers:
+        rules_path = analyzer._resolved_rules_path(root)
+        if rules_path not in rule_files:
+            results.append(analyzer._missing_rules(rules_path))
+            continue
+        findings = analyzer._relevant(by_file[rule_files.index(rules_path)])
+        grouped = analyzer._group_by_file(findings)
+        results.append(
+            analyzer._summarize([item for file in sorted(grouped) for item in grouped[file]])
         )
+    return results
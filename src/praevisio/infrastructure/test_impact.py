@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .atomic_write import write_text_atomic
+from .evidence_cache import sha256_file
+
+PLUGIN = "praevisio.infrastructure.pytest_impact_plugin"
+
+# Changing any of these can alter collection or behaviour of every test.
+_CONFIG_FILES = ("pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini")
+
+
+@dataclass(frozen=True)
+class TestSelection:
+    """Which pytest arguments to execute and which tests are trusted as-is."""
+
+    __test__ = False  # not a pytest test class
+
+    mode: str  # full | selective
+    reason: str
+    targets: List[str]
+    trusted: List[str] = field(default_factory=list)
+
+
+class TestImpactMap:
+    """Map of pytest node ids to the source files (and their hashes) they use.
+
+    Stored as JSON at `path`. A test is trusted without running only if its
+    last recorded outcome was a pass and none of its dependencies changed.
+    """
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self, path: Path, root: Path, targets: List[str], args: List[str]) -> None:
+        self._path = path
+        self._root = root
+        self._settings = {
+            "targets": list(targets),
+            "args": list(args),
+            "python": sys.version.split()[0],
+        }
+        self._data = self._load()
+
+    def select(self) -> TestSelection:
+        targets = list(self._settings["targets"])
+        if self._data is None:
+            return TestSelection(mode="full", reason="no impact map", targets=targets)
+        current: Dict[str, str | None] = {}
+        if self._changed(self._data.get("config", {}), current):
+            return TestSelection(mode="full", reason="pytest configuration changed", targets=targets)
+
+        tests: Dict[str, Dict[str, Any]] = self._data["tests"]
+        known_files = {
+            entry["file"]: entry["deps"].get(entry["file"]) for entry in tests.values()
+        }
+        # New or edited test modules run in full so added tests are picked up;
+        # deleted ones simply drop out.
+        whole_files = {f for f in self._test_files(targets) if f not in known_files} | {
+            f for f, sha in known_files.items() if self._changed({f: sha}, current)
+        }
+        selected = sorted(f for f in whole_files if (self._root / f).is_file())
+        trusted: List[str] = []
+        for node, entry in sorted(tests.items()):
+            if entry["file"] in whole_files:
+                continue
+            if entry.get("outcome") != "passed" or self._changed(entry["deps"], current):
+                selected.append(node)
+            else:
+                trusted.append(node)
+        return TestSelection(
+            mode="selective", reason="impact map", targets=selected, trusted=trusted
+        )
+
+    def update(self, selection: TestSelection, record_paths: List[Path]) -> bool:
+        """Merge plugin records into the map; returns False if none was written."""
+        recorded: Dict[str, Dict[str, Any]] = {}
+        for record_path in record_paths:
+            try:
+                record = json.loads(record_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            recorded.update(record.get("tests", {}))
+        if not recorded:
+            return False
+        tests: Dict[str, Dict[str, Any]] = {}
+        if selection.mode == "selective" and self._data is not None:
+            rerun = set(selection.targets)
+            tests = {
+                node: entry
+                for node, entry in self._data["tests"].items()
+                if node not in rerun and entry["file"] not in rerun
+            }
+        hashes: Dict[str, str | None] = {}
+        for node, entry in recorded.items():
+            if "deps" not in entry or not entry.get("file"):
+                continue  # the test did not finish; leave it unmapped
+            tests[node] = {
+                "file": entry["file"],
+                "outcome": entry["outcome"],
+                "deps": {dep: self._hash(dep, hashes) for dep in entry["deps"]},
+            }
+        payload = {
+            "version": 1,
+            "settings": self._settings,
+            "config": {name: self._hash(name, hashes) for name in _CONFIG_FILES},
+            "tests": tests,
+        }
+        write_text_atomic(self._path, json.dumps(payload, indent=2, sort_keys=True))
+        self._data = payload
+        return True
+
+    def _load(self) -> Dict[str, Any] | None:
+        if not self._path.exists():
+            return None
+        try:
+            data = json.loads(self._path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if data.get("version") != 1 or data.get("settings") != self._settings:
+            return None
+        if not isinstance(data.get("tests"), dict):
+            return None
+        return data
+
+    def _hash(self, rel: str, hashes: Dict[str, str | None]) -> str | None:
+        if rel not in hashes:
+            hashes[rel] = sha256_file(self._root / rel)
+        return hashes[rel]
+
+    def _changed(
+        self, recorded: Dict[str, str | None], current: Dict[str, str | None]
+    ) -> bool:
+        return any(self._hash(rel, current) != sha for rel, sha in recorded.items())
+
+    def _test_files(self, targets: List[str]) -> List[str]:
+        """Test modules under `targets` following pytest's default naming."""
+        found: List[str] = []
+        for target in targets:
+            base = self._root / target.split("::", 1)[0]
+            if base.is_file():
+                candidates = [base]
+            elif base.is_dir():
+                candidates = [*base.rglob("test_*.py"), *base.rglob("*_test.py")]
+            else:
+                continue
+            for candidate in candidates:
+                try:
+                    found.append(candidate.relative_to(self._root).as_posix())
+                except ValueError:
+                    continue
+        return found
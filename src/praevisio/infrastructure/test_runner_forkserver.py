@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+from ..domain.ports import TestRunner
+from .resource_usage import ProcessUsage, max_rss_kb, record_usage
+from .test_runner_subprocess import SubprocessPytestRunner
+
+
+class _ForkServer:
+    def __init__(self, root: str, preload: Iterable[str]) -> None:
+        request_read, request_write = os.pipe()
+        reply_read, reply_write = os.pipe()
+        try:
+            self._process = subprocess.Popen(
+                [
+                    sys.executable,
+                    "-m",
+                    "praevisio.infrastructure.pytest_forkserver",
+                    str(request_read),
+                    str(reply_write),
+                    *preload,
+                ],
+                cwd=root,
+                pass_fds=(request_read, reply_write),
+            )
+        finally:
+            os.close(request_read)
+            os.close(reply_write)
+        self._requests = os.fdopen(request_write, "w", encoding="utf-8")
+        self._replies = os.fdopen(reply_read, "r", encoding="utf-8")
+        self.ready = bool((self._receive() or {}).get("ready"))
+
+    def request(self, payload: Dict[str, Any]) -> Dict[str, Any] | None:
+        try:
+            self._requests.write(json.dumps(payload) + "\n")
+            self._requests.flush()
+        except (BrokenPipeError, OSError, ValueError):
+            return None
+        return self._receive()
+
+    def _receive(self) -> Dict[str, Any] | None:
+        try:
+            line = self._replies.readline()
+        except (OSError, ValueError):
+            return None
+        if not line:
+            return None
+        return json.loads(line)
+
+    def close(self) -> None:
+        for handle in (self._requests, self._replies):
+            try:
+                handle.close()
+            except OSError:
+                pass
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+
+
+class ForkServerPytestRunner(TestRunner):
+    """Run pytest in children forked from a warm per-repository server.
+
+    The server pays interpreter startup, plugin discovery and the import of
+    `preload` modules once; each run is a fresh fork of it. Falls back to a
+    cold `SubprocessPytestRunner` where `os.fork` is unavailable or the
+    server cannot be used.
+    """
+
+    def __init__(self, preload: Iterable[str] = ()) -> None:
+        self._preload = tuple(preload)
+        # Idle servers per repository root. A run checks one out, so runs
+        # in different repositories, or overlapping runs in the same one,
+        # do not wait for each other.
+        self._idle: Dict[str, List[_ForkServer]] = {}
+        self._lock = threading.Lock()
+        self._fallback = SubprocessPytestRunner()
+        atexit.register(self.close)
+
+    def run(self, path: str, args: Iterable[str]) -> int:
+        if not hasattr(os, "fork"):
+            return self._fallback.run(path, args)
+        root = str(Path(path).resolve())
+        request = {"args": list(args), "cwd": root, "env": dict(os.environ)}
+        # A second attempt covers a server that restarted because a
+        # preloaded project module changed on disk.
+        for _ in range(2):
+            server = self._checkout(root)
+            if server is None:
+                server = _ForkServer(root, self._preload)
+                if not server.ready:
+                    server.close()
+                    break
+            reply = server.request(request)
+            if reply is not None and "exit_code" in reply:
+                self._checkin(root, server)
+                self._record_usage(reply.get("usage"))
+                return int(reply["exit_code"])
+            server.close()
+        return self._fallback.run(path, request["args"])
+
+    def _checkout(self, root: str) -> _ForkServer | None:
+        with self._lock:
+            idle = self._idle.get(root)
+            return idle.pop() if idle else None
+
+    def _checkin(self, root: str, server: _ForkServer) -> None:
+        with self._lock:
+            self._idle.setdefault(root, []).append(server)
+
+    @staticmethod
+    def _record_usage(usage: Dict[str, Any] | None) -> None:
+        # The server reaps the forked child, so it reports the rusage.
+        if not usage:
+            return
+        record_usage(
+            ProcessUsage(
+                command="pytest (forkserver)",
+                wall_s=round(float(usage["wall_s"]), 6),
+                user_cpu_s=round(float(usage["user_cpu_s"]), 6),
+                system_cpu_s=round(float(usage["system_cpu_s"]), 6),
+                max_rss_kb=max_rss_kb(int(usage["ru_maxrss"])),
+            )
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            servers = [server for idle in self._idle.values() for server in idle]
+            self._idle = {}
+        for server in servers:
+            server.close()
@@ -1,16 +1,187 @@
 from __future__ import annotations
 
+import contextvars
+import json
+import os
 import subprocess
 import sys
-from typing import Iterable
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
 
 from ..domain.ports import TestRunner
+from .atomic_write import write_text_atomic
+from .cancellation import run_cancellable
+
+SHARD_PLUGIN = "praevisio.infrastructure.pytest_shard_plugin"
+
+# Weight given to tests without recorded history.
+_DEFAULT_DURATION = 1.0
+
+
+@dataclass(frozen=True)
+class ShardOutcome:
+    index: int
+    tests: int
+    exit_code: int
+    duration_s: float
+
+
+def combine_exit_codes(codes: Iterable[int]) -> int:
+    """Fold per-shard pytest exit codes into one.
+
+    Errors (interrupted, internal, usage) win over test failures, failures
+    over success; "no tests collected" (5) only if every shard reports it.
+    """
+    codes = list(codes)
+    real = [code for code in codes if code not in (0, 5)]
+    if real:
+        errors = [code for code in real if code != 1]
+        return max(errors) if errors else 1
+    if codes and all(code == 5 for code in codes):
+        return 5
+    return 0
+
+
+def balance_shards(
+    nodeids: List[str], durations: Dict[str, float], shards: int
+) -> List[List[str]]:
+    """Longest-processing-time-first split of node ids into `shards` lists."""
+    known = sorted(durations[n] for n in nodeids if n in durations)
+    default = known[len(known) // 2] if known else _DEFAULT_DURATION
+    weighted = sorted(
+        ((durations.get(n, default), n) for n in nodeids), key=lambda item: (-item[0], item[1])
+    )
+    buckets: List[List[str]] = [[] for _ in range(shards)]
+    loads = [0.0] * shards
+    for weight, nodeid in weighted:
+        index = min(range(shards), key=lambda i: (loads[i], i))
+        buckets[index].append(nodeid)
+        loads[index] += weight
+    return [bucket for bucket in buckets if bucket]
 
 
 class SubprocessPytestRunner(TestRunner):
-    """Run pytest via subprocess to avoid pytest.main side effects."""
+    """Run pytest via subprocess to avoid pytest.main side effects.
+
+    With `shards > 1` the collected node ids are split across that many
+    concurrent pytest processes, balanced by the per-test durations kept in
+    `durations_path`.
+    """
+
+    def __init__(self, shards: int = 1, durations_path: Path | None = None) -> None:
+        self._shards = shards
+        self._durations_path = durations_path
 
     def run(self, path: str, args: Iterable[str]) -> int:
-        command = [sys.executable, "-m", "pytest", *args]
-        result = subprocess.run(command, cwd=path)
+        exit_code, _ = self.run_sharded(path, args)
+        return exit_code
+
+    def run_sharded(self, path: str, args: Iterable[str]) -> Tuple[int, List[ShardOutcome]]:
+        """Run pytest, returning the combined exit code and per-shard outcomes.
+
+        The outcome list is empty when the run was not sharded.
+        """
+        args = list(args)
+        if self._shards <= 1:
+            return self._run_single(path, args), []
+        with tempfile.TemporaryDirectory(prefix="praevisio-shards-") as tmp:
+            workdir = Path(tmp)
+            nodeids = self._collect(path, args, workdir)
+            if nodeids is None or len(nodeids) < 2:
+                return self._run_single(path, args), []
+            history = self._load_durations()
+            buckets = balance_shards(nodeids, history, self._shards)
+            with ThreadPoolExecutor(max_workers=len(buckets)) as pool:
+                futures = [
+                    pool.submit(
+                        contextvars.copy_context().run,
+                        self._run_shard,
+                        path,
+                        args,
+                        index,
+                        bucket,
+                        workdir,
+                    )
+                    for index, bucket in enumerate(buckets)
+                ]
+                outcomes = [future.result() for future in futures]
+            self._save_durations(history, workdir, len(buckets))
+        return combine_exit_codes(o.exit_code for o in outcomes), outcomes
+
+    @staticmethod
+    def _command(args: List[str]) -> List[str]:
+        return [sys.executable, "-m", "pytest", *args]
+
+    def _run_single(self, path: str, args: List[str]) -> int:
+        result = run_cancellable(self._command(args), cwd=path)
         return result.returncode
+
+    def _collect(self, path: str, args: List[str], workdir: Path) -> List[str] | None:
+        out = workdir / "collected.json"
+        result = run_cancellable(
+            self._command(
+                [*args, "--collect-only", "-p", SHARD_PLUGIN, f"--praevisio-collect-out={out}"]
+            ),
+            cwd=path,
+            capture_output=True,
+        )
+        if result.returncode != 0 or not out.exists():
+            return None
+        return json.loads(out.read_text(encoding="utf-8"))
+
+    def _run_shard(
+        self, path: str, args: List[str], index: int, nodeids: List[str], workdir: Path
+    ) -> ShardOutcome:
+        shard_file = workdir / f"shard-{index}.json"
+        shard_file.write_text(json.dumps(nodeids), encoding="utf-8")
+        env = dict(os.environ, PRAEVISIO_PYTEST_SHARD=str(index))
+        started = time.perf_counter()
+        result = run_cancellable(
+            self._command(
+                [
+                    *args,
+                    "-p",
+                    SHARD_PLUGIN,
+                    f"--praevisio-shard={shard_file}",
+                    f"--praevisio-durations-out={workdir / f'durations-{index}.json'}",
+                ]
+            ),
+            cwd=path,
+            env=env,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        duration = time.perf_counter() - started
+        # Shards run concurrently; print each one's output as a block.
+        sys.stdout.write(f"[praevisio][pytest shard {index}]\n")
+        sys.stdout.write(result.stdout.decode("utf-8", errors="replace"))
+        sys.stdout.flush()
+        return ShardOutcome(
+            index=index,
+            tests=len(nodeids),
+            exit_code=result.returncode,
+            duration_s=round(duration, 3),
+        )
+
+    def _load_durations(self) -> Dict[str, float]:
+        if self._durations_path is None or not self._durations_path.exists():
+            return {}
+        try:
+            data = json.loads(self._durations_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        return {str(k): float(v) for k, v in data.items()} if isinstance(data, dict) else {}
+
+    def _save_durations(self, history: Dict[str, float], workdir: Path, shards: int) -> None:
+        if self._durations_path is None:
+            return
+        merged = dict(history)
+        for index in range(shards):
+            out = workdir / f"durations-{index}.json"
+            if out.exists():
+                merged.update(json.loads(out.read_text(encoding="utf-8")))
+        write_text_atomic(self._durations_path, json.dumps(merged, indent=2, sort_keys=True))
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import copy
+import os
 import platform
-from typing import Any, Dict, List
+import shutil
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 try:
     from importlib import metadata as importlib_metadata  # Python 3.8+
@@ -25,6 +30,33 @@ def _module_version(module_name: str, fallback_package: str) -> str:
 
 
 def current_toolchain_metadata() -> Dict[str, Any]:
+    # pytest and semgrep are read from disk, so `pip install -U` changes them
+    # under a long-lived process (the daemon). The lookup is cached only
+    # until an install touches sys.path or the semgrep executable.
+    return copy.deepcopy(_toolchain_snapshot(_install_stamp()))
+
+
+def _install_stamp() -> Tuple[Tuple[str, int], ...]:
+    """Changes whenever a package or the semgrep executable is replaced.
+
+    Installing, upgrading or removing a distribution adds or removes entries
+    in its sys.path directory, which updates that directory's mtime.
+    """
+    paths = [entry or os.curdir for entry in sys.path]
+    semgrep = shutil.which("semgrep")
+    if semgrep:
+        paths.append(semgrep)
+    stamp = []
+    for path in paths:
+        try:
+            stamp.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            continue
+    return tuple(stamp)
+
+
+@lru_cache(maxsize=1)
+def _toolchain_snapshot(stamp: Tuple[Tuple[str, int], ...]) -> Dict[str, Any]:
     return {
         "os": platform.platform(),
         "python_version": platform.python_version(),
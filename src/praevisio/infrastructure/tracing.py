@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List
+
+TRACE_FORMAT = "praevisio-trace/1"
+
+
+@dataclass(frozen=True)
+class Span:
+    """One timed phase of an evaluation.
+
+    `start`/`end` are monotonic seconds relative to the tracer's creation;
+    `cpu_s` is the CPU time of the thread that ran the span (work done in
+    subprocesses such as pytest or semgrep is not included).
+    """
+
+    span_id: int
+    name: str
+    parent_id: int | None
+    start: float
+    end: float
+    cpu_s: float
+    thread: str
+    attributes: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.span_id,
+            "name": self.name,
+            "parent_id": self.parent_id,
+            "start_s": round(self.start, 6),
+            "end_s": round(self.end, 6),
+            "duration_s": round(self.duration, 6),
+            "cpu_s": round(self.cpu_s, 6),
+            "thread": self.thread,
+            "attributes": dict(self.attributes),
+        }
+
+
+class Tracer:
+    """Collect spans for one evaluation; safe to use from several threads."""
+
+    def __init__(self) -> None:
+        self._origin = time.monotonic()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._spans: List[Span] = []
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[None]:
+        with self._lock:
+            span_id = next(self._ids)
+        parent_id = _CURRENT_SPAN.get()
+        token = _CURRENT_SPAN.set(span_id)
+        start = time.monotonic()
+        cpu_start = time.thread_time()
+        try:
+            yield
+        finally:
+            cpu = time.thread_time() - cpu_start
+            end = time.monotonic()
+            _CURRENT_SPAN.reset(token)
+            finished = Span(
+                span_id=span_id,
+                name=name,
+                parent_id=parent_id,
+                start=start - self._origin,
+                end=end - self._origin,
+                cpu_s=cpu,
+                thread=threading.current_thread().name,
+                attributes=attributes,
+            )
+            with self._lock:
+                self._spans.append(finished)
+
+    @contextmanager
+    def active(self) -> Iterator["Tracer"]:
+        """Route module-level `span()` calls in this context to this tracer."""
+        tracer_token = _ACTIVE_TRACER.set(self)
+        span_token = _CURRENT_SPAN.set(None)
+        try:
+            yield self
+        finally:
+            _CURRENT_SPAN.reset(span_token)
+            _ACTIVE_TRACER.reset(tracer_token)
+
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return sorted(self._spans, key=lambda s: (s.start, s.span_id))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The `trace.json` payload; spans still open are not included."""
+        return {
+            "format": TRACE_FORMAT,
+            "clock": "monotonic",
+            "elapsed_s": round(time.monotonic() - self._origin, 6),
+            "spans": [s.to_dict() for s in self.spans()],
+        }
+
+
+_ACTIVE_TRACER: ContextVar[Tracer | None] = ContextVar("praevisio_tracer", default=None)
+_CURRENT_SPAN: ContextVar[int | None] = ContextVar("praevisio_span", default=None)
+
+
+def active_tracer() -> Tracer | None:
+    return _ACTIVE_TRACER.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[None]:
+    """Time a phase on the active tracer; a no-op when nothing is tracing."""
+    tracer = _ACTIVE_TRACER.get()
+    if tracer is None:
+        yield
+        return
+    with tracer.span(name, **attributes):
+        yield
+
+
+def phase_breakdown(trace: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Top-level spans of a `trace.json` payload with their share of the run."""
+    spans = trace.get("spans") or []
+    elapsed = float(trace.get("elapsed_s") or 0.0)
+    phases = []
+    for item in spans:
+        if item.get("parent_id") is not None:
+            continue
+        duration = float(item.get("duration_s") or 0.0)
+        phases.append(
+            {
+                "name": item.get("name"),
+                "duration_s": duration,
+                "cpu_s": float(item.get("cpu_s") or 0.0),
+                "share": duration / elapsed if elapsed > 0 else 0.0,
+                "children": [
+                    child for child in spans if child.get("parent_id") == item.get("id")
+                ],
+            }
+        )
+    return phases
+
+
+def to_chrome_trace(trace: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a `trace.json` payload to the Chrome trace-event format.
+
+    The result loads in chrome://tracing or Perfetto; each span becomes a
+    complete ("X") event, with one track per thread.
+    """
+    threads: Dict[str, int] = {}
+    events = []
+    for item in trace.get("spans") or []:
+        tid = threads.setdefault(item.get("thread") or "main", len(threads) + 1)
+        args = dict(item.get("attributes") or {})
+        args["cpu_ms"] = round(float(item.get("cpu_s") or 0.0) * 1000, 3)
+        events.append(
+            {
+                "name": item.get("name"),
+                "cat": "praevisio",
+                "ph": "X",
+                "ts": round(float(item.get("start_s") or 0.0) * 1_000_000, 3),
+                "dur": round(float(item.get("duration_s") or 0.0) * 1_000_000, 3),
+                "pid": 1,
+                "tid": tid,
+                "args": args,
+            }
+        )
+    for name, tid in threads.items():
+        events.append(
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+        )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
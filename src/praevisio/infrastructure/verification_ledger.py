@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Set
+
+from .. import __version__
+
+LEDGER_FILENAME = "verify-ledger.jsonl"
+
+
+class VerificationLedger:
+    """Append-only record of audit packs that passed `praevisio verify`.
+
+    Bundles are identified by the SHA-256 of the zip file, so a pack that
+    was moved or renamed is still recognised and one that changed is not.
+    Each verification is appended as one JSON line as soon as it finishes;
+    an interrupted batch keeps the progress it made.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def verified(self) -> Set[str]:
+        """SHA-256 digests of every bundle recorded as verified."""
+        digests: Set[str] = set()
+        try:
+            lines = self._path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return digests
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn last line from an interrupted append.
+                continue
+            if isinstance(entry, dict) and entry.get("sha256"):
+                digests.add(str(entry["sha256"]))
+        return digests
+
+    def record(self, sha256: str, bundle: str) -> None:
+        entry = {
+            "sha256": sha256,
+            "bundle": bundle,
+            "verified_utc": datetime.now(timezone.utc).isoformat(),
+            "praevisio_version": __version__,
+        }
+        line = (json.dumps(entry, sort_keys=True) + "\n").encode("utf-8")
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("ab+") as handle:
+            if handle.seek(0, os.SEEK_END) > 0:
+                handle.seek(-1, os.SEEK_END)
+                if handle.read(1) != b"\n":
+                    # Close off a line torn by an interrupted append, or this
+                    # entry would be glued to it and unreadable.
+                    line = b"\n" + line
+            handle.write(line)
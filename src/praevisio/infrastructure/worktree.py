@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Sequence
+
+
+def _git(cwd: Path, *args: str, input: bytes | None = None) -> bytes | None:
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, input=input, capture_output=True
+        )
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _is_excluded(rel: str, excluded: Sequence[str]) -> bool:
+    return any(rel == item or rel.startswith(item + "/") for item in excluded)
+
+
+def _worktree_copy(toplevel: Path, dest: Path, excluded: Sequence[str]) -> bool:
+    """Check out HEAD at `dest` and replay the uncommitted state on top."""
+    if _git(toplevel, "worktree", "add", "--detach", "--quiet", str(dest), "HEAD") is None:
+        return False
+    diff = _git(toplevel, "diff", "--binary", "--no-ext-diff", "HEAD")
+    if diff is None:
+        return False
+    if diff and _git(dest, "apply", "--binary", "--whitespace=nowarn", input=diff) is None:
+        return False
+    untracked = _git(toplevel, "ls-files", "--others", "--exclude-standard", "-z")
+    if untracked is None:
+        return False
+    for rel in filter(None, untracked.decode("utf-8").split("\0")):
+        if _is_excluded(rel, excluded):
+            continue
+        target = dest / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(toplevel / rel, target, follow_symlinks=False)
+    return True
+
+
+@contextmanager
+def isolated_copy(path: Path, exclude: Sequence[str] = ()) -> Iterator[Path]:
+    """Yield a private copy of `path` as it currently exists on disk.
+
+    Inside a git work tree this is a detached worktree of HEAD with the
+    staged, unstaged and untracked (non-ignored) changes replayed; elsewhere,
+    or if that fails, a plain recursive copy. `exclude` lists directories
+    relative to `path` (e.g. run output) that are left out.
+    """
+    path = path.resolve()
+    tmp = Path(tempfile.mkdtemp(prefix="praevisio-replicate-"))
+    # A unique basename keeps concurrent `git worktree add` calls from
+    # competing for the same administrative name.
+    dest = tmp / tmp.name
+    toplevel: Path | None = None
+    try:
+        output = _git(path, "rev-parse", "--show-toplevel")
+        if output is not None:
+            candidate = Path(output.decode("utf-8").strip()).resolve()
+            prefix = os.path.relpath(path, candidate).replace(os.sep, "/")
+            excluded: List[str] = [
+                os.path.normpath(os.path.join(prefix, item)).replace(os.sep, "/")
+                for item in exclude
+            ]
+            if _worktree_copy(candidate, dest, excluded):
+                toplevel = candidate
+                yield (dest / prefix).resolve() if prefix != "." else dest
+                return
+            _git(candidate, "worktree", "remove", "--force", str(dest))
+            shutil.rmtree(dest, ignore_errors=True)
+
+        excluded_paths = {(path / item).resolve() for item in exclude}
+
+        def ignore(directory: str, names: List[str]) -> List[str]:
+            return [
+                name
+                for name in names
+                if name == ".git" or (Path(directory) / name).resolve() in excluded_paths
+            ]
+
+        shutil.copytree(path, dest, symlinks=True, ignore=ignore)
+        yield dest
+    finally:
+        if toplevel is not None:
+            _git(toplevel, "worktree", "remove", "--force", str(dest))
+            _git(toplevel, "worktree", "prune")
+        shutil.rmtree(tmp, ignore_errors=True)
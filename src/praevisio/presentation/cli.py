@@ -1,45 +1,88 @@
-from __future__ import annotations
-
 """Typer-based command-line interface for praevisio.
 
 Commands map to application services. Run `python -m praevisio --help` to see
 available commands.
+
+Every git hook invocation pays for this module's imports, so only the
+standard library and typer are imported at module level; each command
+imports the services it uses (see tests/test_cli_startup.py for the budget).
 """
 
+from __future__ import annotations
+
 import hashlib
 import json
+import shlex
 import stat
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
 from dataclasses import replace
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 import typer
 
-from abductio_core.application.use_cases.replay_session import replay_session
+from .daemon_client import request as daemon_request, socket_path as daemon_socket_path
 
-from ..application.engine import PraevisioEngine
-from ..application.decision_service import build_decision, add_notification
-from ..application.evaluation_service import EvaluationService
-from ..application.installation_service import InstallationService
-from ..infrastructure.filesystem import LocalFileSystemService
-from ..infrastructure.config import YamlConfigLoader
-from ..infrastructure.toolchain import compare_toolchain, current_toolchain_metadata
-from ..infrastructure.audit_pack import export_audit_pack, verify_audit_pack
+if TYPE_CHECKING:
+    from ..application.engine import GateResult, PraevisioEngine
+    from ..application.evaluation_service import EvaluationService
+    from ..application.evidence_sharing import SharedEvidence
+    from ..domain.entities import StaticAnalysisResult
+    from ..domain.evaluation_config import EvaluationConfig
 
 
 app = typer.Typer(add_completion=False, no_args_is_help=True)
+runs_app = typer.Typer(
+    add_completion=False, no_args_is_help=True, help="Query the catalog of stored runs."
+)
+app.add_typer(runs_app, name="runs")
 
 
 def build_evaluation_service() -> EvaluationService:
+    from ..application.evaluation_service import EvaluationService
+
     return EvaluationService()
 
 
+_WARM_ENGINE: ContextVar[PraevisioEngine | None] = ContextVar(
+    "praevisio_warm_engine", default=None
+)
+
+
+@contextmanager
+def warm_engine(engine: PraevisioEngine) -> Iterator[None]:
+    """Make `build_engine` return `engine` (the daemon's long-lived one)."""
+    token = _WARM_ENGINE.set(engine)
+    try:
+        yield
+    finally:
+        _WARM_ENGINE.reset(token)
+
+
 def build_engine() -> PraevisioEngine:
+    engine = _WARM_ENGINE.get()
+    if engine is not None:
+        return engine
+    from ..application.engine import PraevisioEngine
+    from ..infrastructure.config import YamlConfigLoader
+    from ..infrastructure.filesystem import LocalFileSystemService
+
     loader = YamlConfigLoader()
     fs = LocalFileSystemService()
     return PraevisioEngine(loader, fs, evaluation_service=build_evaluation_service())
 
 
+def replay_session(audit):
+    """Replay an Abductio audit trace; abductio_core is only loaded here."""
+    from abductio_core.application.use_cases.replay_session import (
+        replay_session as _replay_session,
+    )
+
+    return _replay_session(audit)
+
+
 def load_configuration(engine: PraevisioEngine, path: str):
     try:
         return engine.load_config(path)
@@ -58,6 +101,9 @@ def _manifest_metadata_for_audit(audit_file: Path) -> Optional[dict]:
 
 @app.command()
 def install(config_path: str = ".praevisio.yaml") -> None:
+    from ..application.installation_service import InstallationService
+    from ..infrastructure.filesystem import LocalFileSystemService
+
     fs = LocalFileSystemService()
     installer = InstallationService(fs, config_path)
     path = installer.install()
@@ -73,13 +119,32 @@ def pre_commit(
     config_path: str = typer.Option(
         ".praevisio.yaml", "--config", help="Path to Praevisio configuration file."
     ),
+    incremental: bool = typer.Option(
+        False,
+        "--incremental",
+        help="Only re-scan files changed since the last Semgrep baseline.",
+    ),
+    test_impact: bool = typer.Option(
+        False,
+        "--test-impact",
+        help="Only run tests whose recorded dependencies changed since their last pass.",
+    ),
+    speculative: bool = typer.Option(
+        True,
+        "--speculative/--no-speculative",
+        help="Reuse the result `praevisio watch` stored for an unchanged working tree.",
+    ),
 ) -> None:
     """Local governance gate to block commits when credence is below threshold."""
     engine = build_engine()
     config = load_configuration(engine, config_path)
-    evaluation = config.evaluation
-    gate = engine.pre_commit_gate(path, evaluation, threshold_override=threshold)
+    evaluation = _pre_commit_evaluation(config.evaluation, incremental, test_impact)
+    gate = engine.pre_commit_gate(
+        path, evaluation, threshold_override=threshold, reuse_speculative=speculative
+    )
     result = gate.evaluation
+    if result.details.get("speculative"):
+        typer.echo("[praevisio][pre-commit] Reusing the result from `praevisio watch`.")
     if result.verdict == "error":
         typer.echo("[praevisio][pre-commit] ❌ Evaluation error. Commit aborted.")
         raise typer.Exit(code=1)
@@ -89,6 +154,71 @@ def pre_commit(
     typer.echo("[praevisio][pre-commit] ✅ All critical promises satisfied.")
 
 
+def _pre_commit_evaluation(
+    evaluation: EvaluationConfig, incremental: bool, test_impact: bool
+) -> EvaluationConfig:
+    return replace(
+        evaluation,
+        semgrep_incremental=incremental or evaluation.semgrep_incremental,
+        test_impact=test_impact or evaluation.test_impact,
+    )
+
+
+@app.command("watch")
+def watch(
+    path: str = typer.Argument(".", help="Path to the repository to watch."),
+    threshold: Optional[float] = typer.Option(
+        None, "--threshold", help="Same as `pre-commit --threshold`."
+    ),
+    config_path: str = typer.Option(
+        ".praevisio.yaml", "--config", help="Path to Praevisio configuration file."
+    ),
+    incremental: bool = typer.Option(
+        False, "--incremental", help="Same as `pre-commit --incremental`."
+    ),
+    test_impact: bool = typer.Option(
+        False, "--test-impact", help="Same as `pre-commit --test-impact`."
+    ),
+    poll_interval: float = typer.Option(
+        0.5, "--poll-interval", help="Seconds between checks of the working tree."
+    ),
+    debounce: float = typer.Option(
+        0.5, "--debounce", help="Quiet period, in seconds, before re-evaluating."
+    ),
+) -> None:
+    """Re-evaluate on every save so `pre-commit` can reuse the result.
+
+    Use the same options as the pre-commit hook; a result is only reused
+    for an identical evaluation of identical tracked content.
+    """
+    from ..application.watch_service import WatchService
+
+    engine = build_engine()
+    config = load_configuration(engine, config_path)
+    evaluation = engine.apply_threshold(
+        _pre_commit_evaluation(config.evaluation, incremental, test_impact), threshold, None
+    )
+
+    def report(result) -> None:
+        credence = "n/a" if result.credence is None else f"{result.credence:.3f}"
+        stamp = datetime.now().strftime("%H:%M:%S")
+        typer.echo(f"[praevisio][watch] {stamp} {result.verdict} (credence {credence})")
+
+    typer.echo(f"[praevisio][watch] watching {Path(path).resolve()} (Ctrl-C to stop)")
+    service = WatchService(
+        engine,
+        path,
+        evaluation,
+        poll_interval=poll_interval,
+        debounce=debounce,
+        on_result=report,
+    )
+    try:
+        service.run()
+    except KeyboardInterrupt:
+        typer.echo("[praevisio][watch] stopped")
+
+
 @app.command("evaluate-commit")
 def evaluate_commit_cmd(
     path: str,
@@ -113,7 +243,12 @@ def evaluate_commit_cmd(
     config = load_configuration(engine, config_path)
     evaluation = config.evaluation
     evaluation = engine.apply_threshold(evaluation, threshold, evaluation.severity)
-    evaluation = replace(evaluation, offline=offline or evaluation.offline)
+    evaluation = replace(
+        evaluation,
+        offline=offline or evaluation.offline,
+        semgrep_incremental=False,
+        test_impact=False,
+    )
     result = engine.evaluate(path, evaluation)
     _write_decision(
         result,
@@ -166,12 +301,24 @@ def ci_gate(
     offline: bool = typer.Option(
         False, "--offline", help="Run in offline mode (block network egress)."
     ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of promises to evaluate in parallel worker processes.",
+    ),
 ) -> None:
     """Run Praevisio as a CI governance gate."""
     engine = build_engine()
     config = load_configuration(engine, config_path)
     evaluation = config.evaluation
-    evaluation = replace(evaluation, offline=offline or evaluation.offline)
+    evaluation = replace(
+        evaluation,
+        offline=offline or evaluation.offline,
+        semgrep_incremental=False,
+        test_impact=False,
+    )
     promise_ids = list(getattr(config, "promises", []) or [])
     if not promise_ids:
         gate = engine.ci_gate(
@@ -202,17 +349,24 @@ def ci_gate(
         typer.echo("[praevisio][ci-gate] ✅ GATE PASSED")
         return
 
+    overrides = getattr(config, "promise_overrides", {}) or {}
+    evaluations = [
+        replace(evaluation, promise_id=promise_id, **overrides.get(promise_id, {}))
+        for promise_id in promise_ids
+    ]
+    gates = _run_promise_gates(
+        engine,
+        path,
+        evaluations,
+        severity=severity,
+        threshold=threshold,
+        fail_on_violation=fail_on_violation,
+        jobs=jobs,
+    )
+
     results = []
     should_fail = False
-    for promise_id in promise_ids:
-        eval_for_promise = replace(evaluation, promise_id=promise_id)
-        gate = engine.ci_gate(
-            path,
-            eval_for_promise,
-            severity=severity,
-            threshold_override=threshold,
-            fail_on_violation=fail_on_violation,
-        )
+    for eval_for_promise, gate in zip(evaluations, gates):
         effective = engine.apply_threshold(eval_for_promise, threshold, severity)
         _write_decision(
             gate.evaluation,
@@ -267,21 +421,59 @@ def install_hooks(
     hook_path = hooks_dir / "pre-commit"
     script = """#!/usr/bin/env sh
 # Praevisio governance pre-commit hook
+# Hands the check to a running `praevisio daemon` when there is one;
+# otherwise runs `praevisio pre-commit` in-process.
 
-praevisio pre-commit
+PYTHON=__PYTHON__
+if [ -x "$PYTHON" ]; then
+  "$PYTHON" -m praevisio.presentation.daemon_client pre-commit
+else
+  praevisio pre-commit
+fi
 STATUS=$?
 if [ "$STATUS" -ne 0 ]; then
   echo "[praevisio][pre-commit] ❌ Critical promises not satisfied. Commit aborted."
   exit "$STATUS"
 fi
 exit 0
-"""
+""".replace("__PYTHON__", shlex.quote(sys.executable))
     hook_path.write_text(script, encoding="utf-8")
     mode = hook_path.stat().st_mode
     hook_path.chmod(mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
     typer.echo(f"Installed pre-commit hook at {hook_path}")
 
 
+@app.command("daemon")
+def daemon_cmd(
+    path: str = typer.Argument(".", help="Repository the daemon serves."),
+    idle_timeout: float = typer.Option(
+        3600.0, "--idle-timeout", help="Exit after this many idle seconds (0 = never)."
+    ),
+    stop: bool = typer.Option(False, "--stop", help="Stop the daemon serving PATH."),
+    status: bool = typer.Option(False, "--status", help="Report whether a daemon serves PATH."),
+) -> None:
+    """Serve pre-commit checks for a repository from a warm process."""
+    if stop or status:
+        reply = daemon_request(path, {"command": "stop" if stop else "ping"})
+        if reply is None or not reply.get("ok"):
+            typer.echo(f"[praevisio][daemon] not running ({daemon_socket_path(path)})")
+            raise typer.Exit(code=1)
+        typer.echo(f"[praevisio][daemon] {'stopped' if stop else 'running'}")
+        return
+    from .daemon import DaemonAlreadyRunning, DaemonUnavailable, EvaluationDaemon
+
+    daemon = EvaluationDaemon(Path(path), idle_timeout=idle_timeout)
+    typer.echo(f"[praevisio][daemon] listening on {daemon.socket_path}")
+    try:
+        daemon.serve()
+    except DaemonAlreadyRunning as exc:
+        typer.echo(f"[praevisio][daemon] {exc}")
+        raise typer.Exit(code=1)
+    except DaemonUnavailable as exc:
+        typer.echo(f"[praevisio][daemon] {exc}; pre-commit will run in-process")
+        raise typer.Exit(code=1)
+
+
 @app.command("ingest")
 def ingest(
     source_dir: str = typer.Argument(..., help="Path to VDR export directory."),
@@ -326,7 +518,7 @@ def ingest(
 @app.command("replay-audit")
 def replay_audit(
     audit_path: Optional[str] = typer.Argument(
-        None, help="Path to an Abductio audit JSON file."
+        None, help="Path to an Abductio audit file (audit.json or audit.jsonl)."
     ),
     latest: bool = typer.Option(
         False, "--latest", help="Replay the most recent audit under the runs directory."
@@ -345,8 +537,18 @@ def replay_audit(
         "--json",
         help="Print structured JSON output instead of plain text.",
     ),
+    jobs: int = typer.Option(
+        4,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of threads hashing evidence artifacts.",
+    ),
 ) -> None:
     """Replay an Abductio audit trace and print the reconstructed ledger."""
+    from ..infrastructure.audit_log import load_audit
+    from ..infrastructure.toolchain import compare_toolchain, current_toolchain_metadata
+
     audit_file = Path(audit_path) if audit_path else None
     if latest:
         audit_file = _latest_audit_file(Path(runs_dir))
@@ -373,17 +575,27 @@ def replay_audit(
         ):
             retention = "hash_only"
     if retention == "hash_only" and manifest:
-        missing = []
-        for artifact in manifest.get("artifacts", []):
-            rel = artifact.get("path") or artifact.get("pointer")
-            if not rel:
-                continue
-            if not (manifest_path.parent / rel).exists():
-                missing.append(rel)
-        if missing:
-            typer.echo(f"[praevisio][replay] missing evidence artifact: {missing[0]}")
+        from ..infrastructure.artifact_hashing import MISSING, find_first_failure
+
+        run_root = manifest_path.parent
+
+        def open_local(rel: str):
+            path = run_root / rel
+            return path.open("rb") if path.is_file() else None
+
+        expected = [
+            (artifact.get("path") or artifact.get("pointer"), artifact.get("sha256"))
+            for artifact in manifest.get("artifacts", [])
+            if artifact.get("path") or artifact.get("pointer")
+        ]
+        failure = find_first_failure(expected, open_local, jobs)
+        if failure is not None:
+            if failure.reason == MISSING:
+                typer.echo(f"[praevisio][replay] missing evidence artifact: {failure.path}")
+            else:
+                typer.echo(f"[praevisio][replay] evidence artifact hash mismatch: {failure.path}")
             raise typer.Exit(code=2)
-    audit = json.loads(audit_file.read_text(encoding="utf-8"))
+    audit = load_audit(audit_file)
     result = replay_session(audit)
     if json_output:
         payload = result.to_dict_view()
@@ -412,34 +624,233 @@ def show_run(
     runs_dir: str = typer.Option(
         ".praevisio/runs", "--runs-dir", help="Base directory for run artifacts."
     ),
+    artifacts: bool = typer.Option(
+        False, "--artifacts", help="Also list the artifacts recorded in the manifest."
+    ),
+    chrome_trace: Optional[str] = typer.Option(
+        None,
+        "--chrome-trace",
+        help="Write the run's trace in Chrome trace-event format to this path.",
+    ),
 ) -> None:
-    """Show a summary of a stored run (manifest + audit paths)."""
+    """Show a summary of a stored run (manifest, audit and phase timings)."""
+    import sqlite3
+
+    from ..infrastructure.run_index import RunIndex, record_from_run_dir
+    from ..infrastructure.tracing import to_chrome_trace
+
     run_root = Path(runs_dir) / run_id
     manifest_path = run_root / "manifest.json"
     audit_path = run_root / "audit.json"
     if not manifest_path.exists():
         typer.echo(f"[praevisio] manifest not found: {manifest_path}")
         raise typer.Exit(code=2)
-    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    record = None
+    try:
+        record = RunIndex(Path(runs_dir)).get(run_id)
+    except sqlite3.Error:
+        pass
+    if record is None:
+        record = record_from_run_dir(run_root)
     typer.echo(f"Run: {run_id}")
-    metadata = manifest.get("metadata", {})
-    if metadata:
-        typer.echo(f"Timestamp: {metadata.get('timestamp_utc')}")
-        typer.echo(f"Praevisio: {metadata.get('praevisio_version')}")
-        typer.echo(f"Abductio: {metadata.get('abductio_core_version')}")
+    if record is not None:
+        if record.timestamp_utc:
+            typer.echo(f"Timestamp: {record.timestamp_utc}")
+            typer.echo(f"Praevisio: {record.toolchain.get('praevisio_version')}")
+            typer.echo(f"Abductio: {record.toolchain.get('abductio_core_version')}")
+        if record.verdict:
+            typer.echo(f"Promise: {record.promise_id}")
+            typer.echo(f"Verdict: {record.verdict} (credence {record.credence})")
     typer.echo(f"Manifest: {manifest_path}")
     if audit_path.exists():
         typer.echo(f"Audit: {audit_path}")
-    artifacts = manifest.get("artifacts", [])
-    if artifacts:
+    trace = _read_trace(run_root / "trace.json")
+    if trace is not None:
+        _echo_phase_breakdown(trace)
+        if chrome_trace:
+            Path(chrome_trace).write_text(
+                json.dumps(to_chrome_trace(trace), indent=2), encoding="utf-8"
+            )
+            typer.echo(f"Chrome trace: {chrome_trace}")
+    elif chrome_trace:
+        typer.echo(f"[praevisio] no trace recorded for run {run_id}")
+        raise typer.Exit(code=2)
+    if not artifacts:
+        return
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    items = manifest.get("artifacts", [])
+    if items:
         typer.echo("Artifacts:")
-        for item in artifacts:
+        for item in items:
             kind = item.get("kind")
             path = item.get("path")
             sha = item.get("sha256")
             typer.echo(f"- {kind}: {path} ({sha})")
 
 
+def _read_trace(trace_path: Path) -> Dict | None:
+    if not trace_path.exists():
+        return None
+    try:
+        return json.loads(trace_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _echo_phase_breakdown(trace: Dict) -> None:
+    from ..infrastructure.tracing import phase_breakdown
+
+    typer.echo(f"Phases (total {float(trace.get('elapsed_s') or 0.0):.3f}s):")
+    for phase in phase_breakdown(trace):
+        typer.echo(
+            f"- {phase['name']}: {phase['duration_s']:.3f}s"
+            f" ({phase['share']:.0%}, cpu {phase['cpu_s']:.3f}s)"
+        )
+        for child in phase["children"]:
+            typer.echo(
+                f"  - {child.get('name')}: {float(child.get('duration_s') or 0.0):.3f}s"
+                f" (cpu {float(child.get('cpu_s') or 0.0):.3f}s, {child.get('thread')})"
+            )
+
+
+@runs_app.command("list")
+def runs_list(
+    promise: Optional[str] = typer.Option(None, "--promise", help="Only runs of this promise."),
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Only runs started at or after this ISO-8601 date/time (UTC)."
+    ),
+    limit: int = typer.Option(50, "--limit", help="Maximum number of runs to list."),
+    runs_dir: str = typer.Option(
+        ".praevisio/runs", "--runs-dir", help="Base directory for run artifacts."
+    ),
+    json_output: bool = typer.Option(
+        False,
+        "--json-output",
+        "--json",
+        help="Print structured JSON output instead of plain text.",
+    ),
+) -> None:
+    """List stored runs, newest first, from the run index."""
+    from ..infrastructure.run_index import RunIndex
+
+    try:
+        records = RunIndex(Path(runs_dir)).query(promise_id=promise, since=since, limit=limit)
+    except ValueError as exc:
+        typer.echo(f"[praevisio] {exc}")
+        raise typer.Exit(code=2)
+    if json_output:
+        typer.echo(json.dumps([record.to_dict() for record in records], indent=2))
+        return
+    if not records:
+        typer.echo("[praevisio] No runs found.")
+        return
+    for record in records:
+        credence = "-" if record.credence is None else f"{record.credence:.3f}"
+        typer.echo(
+            f"{record.run_id}  {record.promise_id or '-'}  {record.verdict or '-'}"
+            f"  {credence}  {record.timestamp_utc or '-'}"
+        )
+
+
+@runs_app.command("rebuild-index")
+def runs_rebuild_index(
+    runs_dir: str = typer.Option(
+        ".praevisio/runs", "--runs-dir", help="Base directory for run artifacts."
+    ),
+) -> None:
+    """Re-create the run index by scanning the run directories."""
+    from ..infrastructure.run_index import RunIndex
+
+    count = RunIndex(Path(runs_dir)).rebuild()
+    typer.echo(f"[praevisio][runs] indexed {count} runs")
+
+
+@app.command("bench")
+def bench(
+    scenarios_path: str = typer.Option(
+        "benchmarks/scenarios.yaml",
+        "--scenarios",
+        help="YAML file of benchmark scenarios (built-in set if it does not exist).",
+    ),
+    only: Optional[List[str]] = typer.Option(
+        None, "--scenario", help="Only run the named scenario (repeatable)."
+    ),
+    repeat: int = typer.Option(3, "--repeat", min=1, help="Timed runs per operation."),
+    output: str = typer.Option(
+        "logs/bench-results.json", "--output", help="Where to write the JSON results."
+    ),
+    baseline: Optional[str] = typer.Option(
+        None, "--baseline", help="Results file to compare against; regressions fail."
+    ),
+    tolerance: float = typer.Option(
+        0.25, "--tolerance", help="Allowed slowdown against the baseline (0.25 = 25%)."
+    ),
+    standins: bool = typer.Option(
+        False,
+        "--standins",
+        help="Use the built-in semgrep/pytest stand-ins even where the tools are installed.",
+    ),
+    workdir: Optional[str] = typer.Option(
+        None, "--workdir", help="Keep generated repositories here instead of a temp dir."
+    ),
+) -> None:
+    """Benchmark evaluation, ci-gate, replay, export and verify on synthetic repos."""
+    import tempfile
+
+    from ..application.bench_service import BenchError, BenchService, compare_to_baseline
+    from ..infrastructure.bench_fixtures import DEFAULT_SCENARIOS, load_scenarios
+
+    try:
+        path = Path(scenarios_path)
+        scenarios = load_scenarios(path) if path.exists() else list(DEFAULT_SCENARIOS)
+    except (ValueError, TypeError) as exc:
+        typer.echo(f"[praevisio][bench] invalid scenarios: {exc}")
+        raise typer.Exit(code=2)
+    if only:
+        scenarios = [scenario for scenario in scenarios if scenario.name in only]
+        if not scenarios:
+            typer.echo(f"[praevisio][bench] no scenario named {', '.join(only)}")
+            raise typer.Exit(code=2)
+
+    def echo_result(result) -> None:
+        typer.echo(
+            f"[praevisio][bench] {result.scenario:<12} {result.operation:<14}"
+            f" median {result.median_s:8.3f}s  min {min(result.timings_s):8.3f}s"
+        )
+
+    with tempfile.TemporaryDirectory(prefix="praevisio-bench-") as tmp:
+        service = BenchService(
+            Path(workdir) if workdir else Path(tmp), repeat=repeat, force_standins=standins
+        )
+        if service.standins.replaced:
+            typer.echo(
+                f"[praevisio][bench] using stand-ins for: {', '.join(service.standins.replaced)}"
+            )
+        try:
+            report = service.run(scenarios, on_result=echo_result)
+        except BenchError as exc:
+            typer.echo(f"[praevisio][bench] {exc}")
+            raise typer.Exit(code=1)
+
+    out_path = Path(output)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    out_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    typer.echo(f"[praevisio][bench] results written to {out_path}")
+    if not baseline:
+        return
+    previous = json.loads(Path(baseline).read_text(encoding="utf-8"))
+    regressions = compare_to_baseline(report, previous, tolerance)
+    for regression in regressions:
+        typer.echo(
+            f"[praevisio][bench] regression: {regression.scenario} {regression.operation}"
+            f" {regression.baseline_s:.3f}s -> {regression.current_s:.3f}s"
+            f" (x{regression.ratio:.2f})"
+        )
+    if regressions:
+        raise typer.Exit(code=1)
+    typer.echo(f"[praevisio][bench] no regressions against {baseline}")
+
+
 @app.command("export")
 def export_audit_pack_cmd(
     run: str = typer.Option(..., "--run", help="Run identifier under the runs directory."),
@@ -449,6 +860,8 @@ def export_audit_pack_cmd(
     ),
 ) -> None:
     """Export a portable audit pack bundle for offline verification."""
+    from ..infrastructure.audit_pack import export_audit_pack
+
     run_root = Path(runs_dir) / run
     if not run_root.exists():
         typer.echo(f"[praevisio] run not found: {run_root}")
@@ -459,16 +872,45 @@ def export_audit_pack_cmd(
 
 @app.command("verify")
 def verify_audit_pack_cmd(
-    bundle: str = typer.Argument(..., help="Path to an audit pack bundle (zip)."),
+    bundle: str = typer.Argument(
+        ..., help="Path to an audit pack bundle (zip), or a directory with --recursive."
+    ),
     json_output: bool = typer.Option(
         False,
         "--json-output",
         "--json",
         help="Print structured JSON output instead of plain text.",
     ),
+    jobs: int = typer.Option(
+        4,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Number of workers: hashing threads, or with --recursive the budget "
+        "shared by bundle processes and their hashing threads.",
+    ),
+    recursive: bool = typer.Option(
+        False,
+        "--recursive",
+        "-r",
+        help="Verify every *.zip under the directory, streaming NDJSON results.",
+    ),
+    ledger_path: str = typer.Option(
+        ".praevisio/verify-ledger.jsonl",
+        "--ledger",
+        help="Ledger of verified bundle hashes used with --recursive.",
+    ),
+    reverify: bool = typer.Option(
+        False, "--reverify", help="Verify bundles even if the ledger lists them."
+    ),
 ) -> None:
     """Verify an audit pack bundle (hash chain, signatures, evidence hashes)."""
-    ok, error, payload = verify_audit_pack(Path(bundle))
+    if recursive:
+        _verify_recursive(Path(bundle), Path(ledger_path), jobs, reverify)
+        return
+    from ..infrastructure.audit_pack import verify_audit_pack
+
+    ok, error, payload = verify_audit_pack(Path(bundle), jobs=jobs)
     if json_output:
         if not payload:
             payload = {"integrity_ok": False, "error": error}
@@ -483,6 +925,84 @@ def verify_audit_pack_cmd(
     raise typer.Exit(code=1)
 
 
+def _verify_recursive(root: Path, ledger_path: Path, jobs: int, reverify: bool) -> None:
+    """Verify every bundle under `root`, one NDJSON line per bundle then a summary."""
+    from ..application.batch_verification import find_bundles, verify_bundles
+    from ..infrastructure.verification_ledger import VerificationLedger
+
+    if not root.is_dir():
+        typer.echo(f"[praevisio][verify] not a directory: {root}")
+        raise typer.Exit(code=2)
+    summary = verify_bundles(
+        find_bundles(root),
+        VerificationLedger(ledger_path),
+        jobs=jobs,
+        reverify=reverify,
+        on_result=lambda result: typer.echo(json.dumps(result.to_dict(), sort_keys=True)),
+    )
+    typer.echo(json.dumps(summary.to_dict(), sort_keys=True))
+    if summary.failed:
+        raise typer.Exit(code=1)
+
+
+@app.command("prove-event")
+def prove_event(
+    audit_path: str = typer.Argument(..., help="Path to a run's audit.json or audit.jsonl."),
+    index: int = typer.Argument(..., min=0, help="Zero-based index of the event to prove."),
+    output: Optional[str] = typer.Option(
+        None, "--output", "-o", help="Write the proof to this file instead of stdout."
+    ),
+) -> None:
+    """Produce a Merkle inclusion proof for one audit event."""
+    from ..infrastructure.audit_chain import inclusion_document
+    from ..infrastructure.audit_log import load_audit
+
+    audit = load_audit(Path(audit_path))
+    try:
+        document = inclusion_document(audit, index)
+    except (IndexError, ValueError) as exc:
+        typer.echo(f"[praevisio][proof] {exc}")
+        raise typer.Exit(code=2)
+    text = json.dumps(document, indent=2, sort_keys=True)
+    if output:
+        Path(output).write_text(text + "\n", encoding="utf-8")
+        typer.echo(f"[praevisio][proof] wrote {output}")
+        return
+    typer.echo(text)
+
+
+@app.command("verify-proof")
+def verify_proof(
+    proof_path: str = typer.Argument(..., help="Proof file written by 'prove-event'."),
+    root: Optional[str] = typer.Option(
+        None, "--root", help="Trusted Merkle root of the audit log."
+    ),
+    manifest: Optional[str] = typer.Option(
+        None, "--manifest", help="Run manifest.json to read the trusted Merkle root from."
+    ),
+) -> None:
+    """Check an audit event's inclusion proof against a trusted Merkle root."""
+    from ..infrastructure.audit_chain import InclusionProof, verify_inclusion
+
+    trusted = root
+    if trusted is None and manifest:
+        metadata = json.loads(Path(manifest).read_text(encoding="utf-8")).get("metadata") or {}
+        trusted = metadata.get("audit_merkle_root")
+    if not trusted:
+        # The root inside the proof file proves nothing on its own.
+        typer.echo("[praevisio][proof] a trusted root is required (--root or --manifest)")
+        raise typer.Exit(code=2)
+    document = json.loads(Path(proof_path).read_text(encoding="utf-8"))
+    proof = InclusionProof.from_dict(document["proof"])
+    ok, error = verify_inclusion(document["event"], proof, trusted)
+    if not ok:
+        typer.echo(f"[praevisio][proof] failed: {error}")
+        raise typer.Exit(code=1)
+    typer.echo(
+        f"[praevisio][proof] event {proof.index} of {proof.tree_size} is included under {trusted}"
+    )
+
+
 @app.command()
 def version() -> None:
     """Print Praevisio version."""
@@ -491,9 +1011,118 @@ def version() -> None:
     typer.echo(f"praevisio {__version__}")
 
 
+def _run_promise_gates(
+    engine: PraevisioEngine,
+    path: str,
+    evaluations: List[EvaluationConfig],
+    *,
+    severity: Optional[str],
+    threshold: Optional[float],
+    fail_on_violation: bool,
+    jobs: int,
+) -> List[GateResult]:
+    """Evaluate each promise's gate, returning results in configuration order.
+
+    Promises whose evidence fingerprints match share one evidence collection:
+    the first promise per fingerprint runs the tools, the rest reuse its
+    evidence. With ``semgrep_batch`` the leaders' rule sets are scanned in a
+    single Semgrep run up front. With ``jobs > 1`` each phase runs on a
+    process pool.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    from ..application.evidence_sharing import evidence_fingerprint
+    from ..application.semgrep_batch import batch_static_analysis
+
+    fingerprints = [evidence_fingerprint(path, item) for item in evaluations]
+    leaders: Dict[str, int] = {}
+    for index, fingerprint in enumerate(fingerprints):
+        leaders.setdefault(fingerprint, index)
+    leader_indices = sorted(leaders.values())
+    follower_indices = [i for i in range(len(evaluations)) if i not in set(leader_indices)]
+    static_results: Dict[int, Optional[StaticAnalysisResult]] = {}
+    batched = batch_static_analysis(path, [evaluations[i] for i in leader_indices])
+    if batched is not None:
+        static_results = dict(zip(leader_indices, batched))
+
+    gates: Dict[int, GateResult] = {}
+    shared: Dict[str, Optional[SharedEvidence]] = {}
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 and len(evaluations) > 1 else None
+    try:
+        for phase in (leader_indices, follower_indices):
+            tasks = [
+                (
+                    path,
+                    evaluations[i],
+                    severity,
+                    threshold,
+                    fail_on_violation,
+                    shared.get(fingerprints[i]),
+                    static_results.get(i),
+                )
+                for i in phase
+            ]
+            if pool is not None and len(tasks) > 1:
+                # map() yields in submission order, so completion order never
+                # leaks into the report.
+                outcomes = list(pool.map(_ci_gate_promise, *zip(*tasks)))
+            else:
+                outcomes = [_ci_gate_promise(*task, engine=engine) for task in tasks]
+            for index, (gate, evidence) in zip(phase, outcomes):
+                gates[index] = gate
+                shared.setdefault(fingerprints[index], evidence)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return [gates[index] for index in range(len(evaluations))]
+
+
+def _ci_gate_promise(
+    path: str,
+    evaluation: EvaluationConfig,
+    severity: Optional[str],
+    threshold: Optional[float],
+    fail_on_violation: bool,
+    shared: Optional[SharedEvidence] = None,
+    static_result: Optional[StaticAnalysisResult] = None,
+    engine: Optional[PraevisioEngine] = None,
+) -> Tuple[GateResult, Optional[SharedEvidence]]:
+    from ..application.evidence_sharing import (
+        EvidenceRegistry,
+        evidence_fingerprint,
+        shared_evidence,
+    )
+    from ..application.semgrep_batch import precomputed_static_analysis
+
+    engine = engine or build_engine()
+    registry = EvidenceRegistry()
+    fingerprint = evidence_fingerprint(path, evaluation)
+    if shared is not None:
+        registry.put(fingerprint, shared)
+    with shared_evidence(registry), precomputed_static_analysis(static_result):
+        gate = engine.ci_gate(
+            path,
+            evaluation,
+            severity=severity,
+            threshold_override=threshold,
+            fail_on_violation=fail_on_violation,
+        )
+    return gate, registry.get(fingerprint)
+
+
 def _latest_audit_file(runs_dir: Path) -> Path | None:
+    import sqlite3
+
+    from ..infrastructure.run_index import RunIndex
+
     if not runs_dir.exists():
         return None
+    try:
+        latest = RunIndex(runs_dir).latest_with_audit()
+    except sqlite3.Error:
+        latest = None
+    if latest is not None:
+        return latest
     candidates = []
     for entry in runs_dir.iterdir():
         if not entry.is_dir():
@@ -515,6 +1144,9 @@ def _write_decision(
     fail_on_violation: bool,
     include_notification: bool,
 ) -> Path | None:
+    from ..application.decision_service import add_notification, build_decision
+    from ..infrastructure.atomic_write import write_text_atomic
+
     manifest_path = result.details.get("manifest_path")
     audit_path = result.details.get("audit_path")
     run_root = None
@@ -540,7 +1172,7 @@ def _write_decision(
     if include_notification:
         decision = add_notification(decision, evaluation=evaluation, result=result)
     decision_path = run_root / "decision.json"
-    decision_path.write_text(json.dumps(decision, indent=2), encoding="utf-8")
+    write_text_atomic(decision_path, json.dumps(decision, indent=2))
     return decision_path
 
 
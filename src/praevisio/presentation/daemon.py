@@ -0,0 +1,188 @@
+"""Long-running evaluation daemon behind `praevisio daemon`.
+
+The daemon serves one repository over a Unix socket (see
+`daemon_client.socket_path`). It keeps a single engine alive across
+requests, so the parsed configuration, promise definitions, toolchain
+metadata and any forkserver pytest workers are reused from one commit to
+the next. Requests are handled one at a time: a request's output goes to
+the client's own stdout/stderr, which are installed as fds 1 and 2 while
+it runs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .. import __version__
+from ..application.engine import PraevisioEngine
+from ..infrastructure.config import CachingConfigLoader, YamlConfigLoader
+from ..infrastructure.filesystem import LocalFileSystemService
+from . import cli
+from .daemon_client import (
+    DAEMON_COMMANDS,
+    MAX_MESSAGE,
+    encode_message,
+    ensure_socket_dir,
+    request,
+    socket_path,
+)
+
+# How long a client may take to send its request; a peer that connects and
+# stays silent must not block the (single-threaded) daemon.
+REQUEST_TIMEOUT = 10.0
+
+
+class DaemonAlreadyRunning(RuntimeError):
+    """Raised when another daemon already serves the repository."""
+
+
+class DaemonUnavailable(RuntimeError):
+    """Raised when the daemon cannot listen; hooks then run in-process."""
+
+
+class EvaluationDaemon:
+    def __init__(self, root: Path, idle_timeout: float | None = None) -> None:
+        self._root = root.resolve()
+        self._idle_timeout = idle_timeout or None
+        self._socket_path = socket_path(self._root)
+        self._engine = PraevisioEngine(
+            CachingConfigLoader(YamlConfigLoader()),
+            LocalFileSystemService(),
+            evaluation_service=cli.build_evaluation_service(),
+        )
+
+    @property
+    def socket_path(self) -> Path:
+        return self._socket_path
+
+    def serve(self) -> None:
+        """Accept requests until stopped or idle for `idle_timeout` seconds."""
+        server = self._bind()
+        try:
+            server.settimeout(self._idle_timeout)
+            while True:
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    return
+                with conn:
+                    conn.settimeout(REQUEST_TIMEOUT)
+                    try:
+                        if not self._handle(conn):
+                            return
+                    except OSError:
+                        # Timed out or hung up; the client falls back to
+                        # running in-process.
+                        continue
+        finally:
+            server.close()
+            self._socket_path.unlink(missing_ok=True)
+
+    def _bind(self) -> socket.socket:
+        try:
+            ensure_socket_dir(self._socket_path)
+            if os.path.lexists(self._socket_path):
+                if request(self._root, {"command": "ping"}) is not None:
+                    raise DaemonAlreadyRunning(
+                        f"daemon already running at {self._socket_path}"
+                    )
+                self._socket_path.unlink()
+        except OSError as exc:
+            raise DaemonUnavailable(f"cannot listen on {self._socket_path}: {exc}") from exc
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        old_umask = os.umask(0o177)
+        try:
+            server.bind(str(self._socket_path))
+            server.listen()
+        except OSError as exc:
+            server.close()
+            raise DaemonUnavailable(f"cannot listen on {self._socket_path}: {exc}") from exc
+        finally:
+            os.umask(old_umask)
+        return server
+
+    def _handle(self, conn: socket.socket) -> bool:
+        """Serve one connection; returns False when asked to stop."""
+        data, fds, _, _ = socket.recv_fds(conn, MAX_MESSAGE, 2)
+        try:
+            while data and not data.endswith(b"\n"):
+                chunk = conn.recv(MAX_MESSAGE)
+                if not chunk:
+                    return True
+                data += chunk
+            try:
+                message: Dict[str, Any] = json.loads(data.decode("utf-8") or "null") or {}
+            except ValueError:
+                return True
+            command = message.get("command")
+            if message.get("version") != __version__:
+                # A client from another install; it falls back to in-process.
+                reply: Dict[str, Any] = {"error": "version mismatch"}
+            elif command == "ping":
+                reply = {"ok": True, "pid": os.getpid(), "root": str(self._root)}
+            elif command == "stop":
+                conn.sendall(encode_message({"ok": True}))
+                return False
+            elif command == "run":
+                reply = self._run_request(message, fds)
+            else:
+                reply = {"error": f"unknown command: {command}"}
+            conn.sendall(encode_message(reply))
+            return True
+        finally:
+            for fd in fds:
+                os.close(fd)
+
+    def _run_request(self, message: Dict[str, Any], fds: List[int]) -> Dict[str, Any]:
+        argv = message.get("argv")
+        cwd = Path(str(message.get("cwd") or "")).resolve()
+        if not isinstance(argv, list) or not argv or argv[0] not in DAEMON_COMMANDS:
+            return {"error": "command not served by the daemon"}
+        if len(fds) != 2:
+            return {"error": "missing stdout/stderr"}
+        if cwd != self._root and self._root not in cwd.parents:
+            return {"error": f"{cwd} is outside {self._root}"}
+        return {"exit_code": self._run(argv, cwd, fds)}
+
+    def _run(self, argv: List[str], cwd: Path, fds: List[int]) -> int:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        saved = [os.dup(1), os.dup(2)]
+        previous_cwd = os.getcwd()
+        try:
+            os.dup2(fds[0], 1)
+            os.dup2(fds[1], 2)
+            os.chdir(cwd)
+            with cli.warm_engine(self._engine):
+                return _invoke([str(arg) for arg in argv])
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os.dup2(saved[0], 1)
+            os.dup2(saved[1], 2)
+            for fd in saved:
+                os.close(fd)
+            os.chdir(previous_cwd)
+
+
+def _invoke(argv: List[str]) -> int:
+    """Run the CLI like the `praevisio` entry point would, returning the exit code."""
+    try:
+        result = cli.app(args=argv, prog_name="praevisio", standalone_mode=False)
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else 1
+    except Exception as exc:
+        show = getattr(exc, "show", None)
+        if callable(show) and isinstance(getattr(exc, "exit_code", None), int):
+            # Usage errors: print them as the standalone CLI does.
+            show()
+            return exc.exit_code
+        traceback.print_exc()
+        return 1
+    return result if isinstance(result, int) else 0
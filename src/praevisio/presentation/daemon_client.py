@@ -0,0 +1,146 @@
+"""Thin client for `praevisio daemon`, used by the installed git hook.
+
+Only the standard library is imported here so that a commit pays for a
+socket round-trip rather than for importing the CLI. When no daemon is
+listening (or it cannot serve the request) the command runs in-process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import socket
+import stat
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .. import __version__
+
+# Commands the daemon runs on behalf of a client.
+DAEMON_COMMANDS = ("pre-commit",)
+MAX_MESSAGE = 1 << 16
+
+
+def socket_path(root: str | Path) -> Path:
+    """Per-repository socket path, in a directory only this user can enter.
+
+    `$XDG_RUNTIME_DIR` is private to the user already; otherwise the socket
+    lives in the repository's `.git` (or `.praevisio`) directory. Never in
+    the shared temp directory, where another user could take the name first.
+    """
+    root = Path(root).resolve()
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        digest = hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:16]
+        return Path(runtime) / "praevisio" / f"{digest}.sock"
+    state = root / ".git" if (root / ".git").is_dir() else root / ".praevisio"
+    return state / "daemon" / "daemon.sock"
+
+
+def _owned_by_user(st: os.stat_result) -> bool:
+    return not hasattr(os, "getuid") or st.st_uid == os.getuid()
+
+
+def ensure_socket_dir(path: Path) -> None:
+    """Create the socket's directory with mode 0700, refusing one we do not own."""
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    st = path.parent.lstat()
+    if not stat.S_ISDIR(st.st_mode) or not _owned_by_user(st):
+        raise PermissionError(f"{path.parent} is not a directory owned by this user")
+    if stat.S_IMODE(st.st_mode) & 0o077:
+        os.chmod(path.parent, 0o700)
+
+
+def is_trusted_socket(path: Path) -> bool:
+    """True when `path` is a socket owned by this user in a private directory.
+
+    A reply from anything else could claim any exit code, so the client
+    does not talk to it.
+    """
+    try:
+        st = path.lstat()
+        parent = path.parent.lstat()
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(st.st_mode)
+        and _owned_by_user(st)
+        and stat.S_ISDIR(parent.st_mode)
+        and _owned_by_user(parent)
+        and not stat.S_IMODE(parent.st_mode) & 0o022
+    )
+
+
+def read_message(sock: socket.socket) -> Dict[str, Any] | None:
+    """Read one newline-terminated JSON object, or None if the peer hung up."""
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = sock.recv(MAX_MESSAGE)
+        if not chunk:
+            return None
+        data += chunk
+    message = json.loads(data.decode("utf-8"))
+    return message if isinstance(message, dict) else None
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+def request(
+    root: str | Path, message: Dict[str, Any], fds: List[int] | None = None
+) -> Dict[str, Any] | None:
+    """Send `message` to the daemon for `root`; None when none is reachable."""
+    path = socket_path(root)
+    if not is_trusted_socket(path):
+        return None
+    payload = encode_message(dict(message, version=__version__))
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(path))
+            if fds:
+                socket.send_fds(sock, [payload], fds)
+            else:
+                sock.sendall(payload)
+            return read_message(sock)
+    except (OSError, ValueError):
+        return None
+
+
+def forward(argv: List[str], cwd: str | Path | None = None) -> int | None:
+    """Run a CLI invocation in the daemon, returning its exit code.
+
+    The daemon writes straight to this process' stdout/stderr, whose file
+    descriptors are passed along with the request. Returns None when the
+    command has to run in-process instead.
+    """
+    if not argv or argv[0] not in DAEMON_COMMANDS:
+        return None
+    cwd = Path(cwd or os.getcwd()).resolve()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    response = request(
+        cwd,
+        {"command": "run", "argv": list(argv), "cwd": str(cwd)},
+        fds=[sys.stdout.fileno(), sys.stderr.fileno()],
+    )
+    if response is None or not isinstance(response.get("exit_code"), int):
+        return None
+    return response["exit_code"]
+
+
+def main(argv: List[str] | None = None) -> None:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    exit_code = forward(argv)
+    if exit_code is None:
+        from .cli import app
+
+        app(args=argv, prog_name="praevisio")
+        return
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
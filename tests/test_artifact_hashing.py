@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import threading
+
+from praevisio.infrastructure.artifact_hashing import (
+    MISMATCH,
+    MISSING,
+    ArtifactFailure,
+    find_first_failure,
+)
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class _SlowStream(io.BytesIO):
+    """Blocks its first read until `release` is set."""
+
+    def __init__(self, data: bytes, release: threading.Event) -> None:
+        super().__init__(data)
+        self._release = release
+
+    def read(self, size: int = -1) -> bytes:
+        assert self._release.wait(timeout=10)
+        return super().read(size)
+
+
+def test_first_failure_is_reported_in_manifest_order_not_completion_order() -> None:
+    release = threading.Event()
+    blobs = {"a": b"first", "b": b"second", "c": b"third"}
+    artifacts = [
+        ("a", _sha(b"tampered")),
+        ("b", _sha(b"second")),
+        ("c", _sha(b"other")),
+        ("d", None),
+    ]
+
+    def open_artifact(path: str):
+        if path == "a":
+            return _SlowStream(blobs["a"], release)
+        if path not in blobs:
+            return None
+        if path == "c":
+            # "c" fails while "a" is still being hashed.
+            release.set()
+        return io.BytesIO(blobs[path])
+
+    assert find_first_failure(artifacts, open_artifact, jobs=4) == ArtifactFailure("a", MISMATCH)
+    assert find_first_failure(artifacts, open_artifact, jobs=1) == ArtifactFailure("a", MISMATCH)
+
+
+def test_missing_artifact_and_existence_only_checks() -> None:
+    blobs = {"a": b"x", "b": b"y"}
+    opener = lambda path: io.BytesIO(blobs[path]) if path in blobs else None  # noqa: E731
+
+    assert find_first_failure([("a", _sha(b"x")), ("b", None)], opener, jobs=2) is None
+    assert find_first_failure(
+        [("a", _sha(b"x")), ("gone", None), ("b", "0" * 64)], opener, jobs=3
+    ) == ArtifactFailure("gone", MISSING)
+
+
+def test_later_artifacts_stop_after_an_earlier_failure() -> None:
+    hashed = []
+    lock = threading.Lock()
+
+    class _Counting(io.BytesIO):
+        def __init__(self, path: str) -> None:
+            super().__init__(b"z" * (8 << 20))
+            self._path = path
+
+        def read(self, size: int = -1) -> bytes:
+            with lock:
+                hashed.append(self._path)
+            return super().read(size)
+
+    artifacts = [("bad", None)] + [(f"big{i}", "0" * 64) for i in range(8)]
+    opener = lambda path: None if path == "bad" else _Counting(path)  # noqa: E731
+
+    assert find_first_failure(artifacts, opener, jobs=1) == ArtifactFailure("bad", MISSING)
+    assert hashed == []
+    assert find_first_failure(artifacts, opener, jobs=4) == ArtifactFailure("bad", MISSING)
+    # Workers already started stop at their next chunk instead of hashing 8 MiB each.
+    assert len(hashed) < 8 * 8
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from praevisio.infrastructure.atomic_write import write_text_atomic
+
+
+@pytest.mark.skipif(not hasattr(os, "fchmod"), reason="POSIX file modes")
+def test_atomic_writes_get_the_same_mode_as_plain_writes(tmp_path: Path) -> None:
+    plain = tmp_path / "plain.json"
+    plain.write_text("{}", encoding="utf-8")
+    atomic = tmp_path / "atomic.json"
+    write_text_atomic(atomic, "{}")
+
+    assert stat.S_IMODE(atomic.stat().st_mode) == stat.S_IMODE(plain.stat().st_mode)
+
+    # Rewriting keeps whatever mode the file was given since.
+    atomic.chmod(0o640)
+    write_text_atomic(atomic, "[]")
+    assert stat.S_IMODE(atomic.stat().st_mode) == 0o640
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import tracemalloc
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from abductio_core.domain.audit import AuditEvent
+
+from praevisio.application.evaluation_service import EvaluationService
+from praevisio.domain.entities import StaticAnalysisResult
+from praevisio.domain.evaluation_config import EvaluationConfig
+from praevisio.domain.models import Promise
+from praevisio.infrastructure.abductio_ports import JsonlAuditSink
+from praevisio.infrastructure.audit_chain import (
+    AuditChainValidator,
+    audit_merkle_root,
+    chain_audit_log,
+)
+from praevisio.infrastructure.audit_log import (
+    JsonlAuditWriter,
+    iter_audit_jsonl,
+    write_audit_json,
+)
+from praevisio.infrastructure.audit_pack import export_audit_pack, verify_audit_pack
+
+
+@dataclass
+class FakePromiseLoader:
+    def load(self, promise_id: str) -> Promise:
+        return Promise(id=promise_id, statement="test")
+
+
+@dataclass
+class PassingTestRunner:
+    def run(self, path: str, args: list[str]) -> int:
+        return 0
+
+
+@dataclass
+class CleanAnalyzer:
+    def analyze(self, path: str) -> StaticAnalysisResult:
+        return StaticAnalysisResult(total_llm_calls=1, violations=0, coverage=1.0, findings=[])
+
+
+def _events(count: int) -> list:
+    return [
+        {"event_type": "OP_EXECUTED", "payload": {"step": i, "node": {"k": 0.5, "refs": ["e"]}}}
+        for i in range(count)
+    ]
+
+
+def test_streamed_log_matches_the_whole_log_chain(tmp_path: Path) -> None:
+    events = _events(50)
+    with JsonlAuditWriter(tmp_path / "audit.jsonl") as writer:
+        for event in events:
+            writer.append(event["event_type"], event["payload"])
+
+    chained = chain_audit_log(json.loads(json.dumps(events)))
+    assert list(iter_audit_jsonl(writer.path)) == chained
+    assert writer.merkle_root == audit_merkle_root(chained)
+    assert writer.sha256 == hashlib.sha256(writer.path.read_bytes()).hexdigest()
+    # audit.json keeps the exact bytes the single-document writer produced.
+    legacy = json.dumps(chained, indent=2, sort_keys=True).encode("utf-8")
+    legacy_sha = write_audit_json(writer.path, tmp_path / "audit.json")
+    assert legacy_sha == hashlib.sha256(legacy).hexdigest()
+    assert (tmp_path / "audit.json").read_bytes() == legacy
+
+
+def test_events_are_on_disk_before_the_session_ends(tmp_path: Path) -> None:
+    writer = JsonlAuditWriter(tmp_path / "audit.jsonl")
+    sink = JsonlAuditSink(writer)
+    for event in _events(3):
+        sink.append(AuditEvent(event["event_type"], event["payload"]))
+
+    # Nothing closed the writer, as after a crash: the chain so far is intact.
+    validator = AuditChainValidator()
+    assert all(validator.add(event) for event in iter_audit_jsonl(writer.path))
+    assert validator.merkle_root == writer.merkle_root
+    assert sink.events == ()
+    writer.close()
+
+
+def test_sink_memory_does_not_grow_with_session_length(tmp_path: Path) -> None:
+    def peak_for(count: int) -> int:
+        with JsonlAuditWriter(tmp_path / f"audit-{count}.jsonl") as writer:
+            sink = JsonlAuditSink(writer)
+            tracemalloc.start()
+            try:
+                for step in range(count):
+                    sink.append(AuditEvent("OP_EXECUTED", {"step": step, "refs": ["e"]}))
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+    assert peak_for(20_000) < 4 * peak_for(2_000)
+
+
+def test_export_ships_the_run_audit_jsonl_unchanged(tmp_path: Path) -> None:
+    service = EvaluationService(
+        analyzer=CleanAnalyzer(),
+        test_runner=PassingTestRunner(),
+        promise_loader=FakePromiseLoader(),
+    )
+    config = EvaluationConfig(promise_id="p", pytest_targets=["tests"], run_dir="runs")
+    result = service.evaluate_path(str(tmp_path), config)
+    run_root = tmp_path / "runs" / result.details["run_id"]
+    manifest = json.loads((run_root / "manifest.json").read_text(encoding="utf-8"))
+    kinds = {artifact["kind"]: artifact for artifact in manifest["artifacts"]}
+    jsonl = (run_root / "audit.jsonl").read_bytes()
+
+    assert kinds["audit_log"]["sha256"] == hashlib.sha256(jsonl).hexdigest()
+    assert result.details["session"]["audit"] == []
+    bundle = tmp_path / "pack.zip"
+    export_audit_pack(run_root, bundle)
+    with zipfile.ZipFile(bundle) as zf:
+        assert [name for name in zf.namelist() if name == "audit.jsonl"] == ["audit.jsonl"]
+        assert zf.read("audit.jsonl") == jsonl
+    assert verify_audit_pack(bundle) == (True, "", {"integrity_ok": True})
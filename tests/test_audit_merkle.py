@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import copy
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from praevisio.infrastructure.audit_chain import (
+    AuditChainValidator,
+    InclusionProof,
+    audit_merkle_root,
+    chain_audit_log,
+    inclusion_proof,
+    verify_inclusion,
+)
+from praevisio.infrastructure.audit_pack import verify_audit_pack
+from praevisio.infrastructure.report_signing import sign_bytes
+from praevisio.presentation.cli import app
+
+
+def _audit(size: int) -> list:
+    return chain_audit_log(
+        [{"event_type": "op", "payload": {"step": i}} for i in range(size)]
+    )
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 8, 33])
+def test_every_event_proves_against_the_root(size: int) -> None:
+    audit = _audit(size)
+    root = audit_merkle_root(audit)
+    validator = AuditChainValidator()
+    assert all(validator.add(event) for event in audit)
+    assert validator.merkle_root == root
+
+    for index, event in enumerate(audit):
+        proof = InclusionProof.from_dict(inclusion_proof(audit, index).to_dict())
+        assert len(proof.path) <= max(1, (size - 1).bit_length())
+        assert verify_inclusion(event, proof, root) == (True, "")
+
+
+def test_tampered_event_or_foreign_root_fails() -> None:
+    audit = _audit(10)
+    root = audit_merkle_root(audit)
+    proof = inclusion_proof(audit, 4)
+
+    edited = copy.deepcopy(audit[4])
+    edited["payload"]["step"] = 99
+    assert verify_inclusion(edited, proof, root) == (False, "event hash mismatch")
+    assert verify_inclusion(audit[5], proof, root)[0] is False
+    other_root = audit_merkle_root(_audit(11))
+    assert verify_inclusion(audit[4], proof, other_root) == (False, "merkle root mismatch")
+
+
+def test_prove_and_verify_cli_round_trip(tmp_path: Path) -> None:
+    audit = _audit(20)
+    audit_path = tmp_path / "audit.json"
+    audit_path.write_text(json.dumps(audit), encoding="utf-8")
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps({"artifacts": [], "metadata": {"audit_merkle_root": audit_merkle_root(audit)}}),
+        encoding="utf-8",
+    )
+    proof_path = tmp_path / "proof.json"
+    runner = CliRunner()
+
+    proved = runner.invoke(app, ["prove-event", str(audit_path), "13", "-o", str(proof_path)])
+    assert proved.exit_code == 0, proved.output
+    checked = runner.invoke(app, ["verify-proof", str(proof_path), "--manifest", str(manifest)])
+    assert checked.exit_code == 0, checked.output
+    unpinned = runner.invoke(app, ["verify-proof", str(proof_path)])
+    assert unpinned.exit_code == 2
+
+
+def test_verify_rejects_pack_whose_recorded_root_differs(tmp_path: Path) -> None:
+    audit = _audit(5)
+    report = json.dumps({"audit_merkle_root": audit_merkle_root(_audit(6))}).encode("utf-8")
+    bundle = tmp_path / "pack.zip"
+    with zipfile.ZipFile(bundle, "w") as zf:
+        zf.writestr("manifest.json", json.dumps({"artifacts": []}))
+        zf.writestr("audit.jsonl", "".join(json.dumps(event) + "\n" for event in audit))
+        zf.writestr("report.json", report)
+        zf.writestr("report.sig", sign_bytes(report))
+
+    assert verify_audit_pack(bundle) == (False, "merkle root mismatch", {})
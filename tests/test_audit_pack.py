@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import tracemalloc
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from praevisio.application.evaluation_service import EvaluationService
+from praevisio.domain.entities import StaticAnalysisResult
+from praevisio.domain.evaluation_config import EvaluationConfig
+from praevisio.domain.models import Promise
+from praevisio.infrastructure.audit_pack import export_audit_pack, verify_audit_pack
+
+LARGE_MEMBER = 64 * 1024 * 1024
+
+
+@dataclass
+class FakePromiseLoader:
+    def load(self, promise_id: str) -> Promise:
+        return Promise(id=promise_id, statement="test")
+
+
+@dataclass
+class PassingTestRunner:
+    def run(self, path: str, args: list[str]) -> int:
+        return 0
+
+
+@dataclass
+class CleanAnalyzer:
+    def analyze(self, path: str) -> StaticAnalysisResult:
+        return StaticAnalysisResult(total_llm_calls=1, violations=0, coverage=1.0, findings=[])
+
+
+def _export_with_large_evidence(tmp_path: Path) -> Path:
+    service = EvaluationService(
+        analyzer=CleanAnalyzer(),
+        test_runner=PassingTestRunner(),
+        promise_loader=FakePromiseLoader(),
+    )
+    result = service.evaluate_path(
+        str(tmp_path), EvaluationConfig(promise_id="p", pytest_targets=["tests"], run_dir="runs")
+    )
+    run_root = tmp_path / "runs" / result.details["run_id"]
+    # Stand in for a large evidence export recorded in the manifest.
+    blob = run_root / "evidence" / "export.bin"
+    digest = hashlib.sha256()
+    with blob.open("wb") as handle:
+        for index in range(LARGE_MEMBER // (1 << 20)):
+            chunk = bytes([index % 251]) * (1 << 20)
+            handle.write(chunk)
+            digest.update(chunk)
+    manifest_path = run_root / "manifest.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    manifest["artifacts"].append(
+        {"kind": "export", "path": "evidence/export.bin", "sha256": digest.hexdigest()}
+    )
+    manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+    bundle = tmp_path / "pack.zip"
+    export_audit_pack(run_root, bundle)
+    return bundle
+
+
+def test_verify_streams_members_in_constant_memory(tmp_path: Path, monkeypatch) -> None:
+    bundle = _export_with_large_evidence(tmp_path)
+
+    def no_extract(*args, **kwargs):
+        raise AssertionError("verification must not extract the bundle")
+
+    monkeypatch.setattr(zipfile.ZipFile, "extractall", no_extract)
+    tracemalloc.start()
+    try:
+        ok, error, payload = verify_audit_pack(bundle)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert (ok, error, payload) == (True, "", {"integrity_ok": True})
+    assert peak < LARGE_MEMBER // 8
+
+
+@pytest.mark.parametrize("jobs", [1, 4])
+def test_verify_reports_tampered_member(tmp_path: Path, jobs: int) -> None:
+    bundle = _export_with_large_evidence(tmp_path)
+    tampered = tmp_path / "tampered.zip"
+    with zipfile.ZipFile(bundle) as source, zipfile.ZipFile(tampered, "w") as target:
+        for info in source.infolist():
+            if info.filename == "evidence/pytest.json":
+                target.writestr(info.filename, b"{}")
+            else:
+                with source.open(info) as member, target.open(info.filename, "w") as out:
+                    for chunk in iter(lambda: member.read(1 << 20), b""):
+                        out.write(chunk)
+
+    assert verify_audit_pack(tampered, jobs=jobs) == (
+        False,
+        "hash mismatch for evidence/pytest.json",
+        {},
+    )
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+import shutil
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from praevisio.application.batch_verification import split_jobs, verify_bundles
+from praevisio.application.evaluation_service import EvaluationService
+from praevisio.domain.entities import StaticAnalysisResult
+from praevisio.domain.evaluation_config import EvaluationConfig
+from praevisio.domain.models import Promise
+from praevisio.infrastructure.audit_pack import export_audit_pack
+from praevisio.infrastructure.verification_ledger import VerificationLedger
+from praevisio.presentation.cli import app
+
+
+@dataclass
+class FakePromiseLoader:
+    def load(self, promise_id: str) -> Promise:
+        return Promise(id=promise_id, statement="test")
+
+
+@dataclass
+class PassingTestRunner:
+    def run(self, path: str, args: list[str]) -> int:
+        return 0
+
+
+@dataclass
+class CleanAnalyzer:
+    def analyze(self, path: str) -> StaticAnalysisResult:
+        return StaticAnalysisResult(total_llm_calls=1, violations=0, coverage=1.0, findings=[])
+
+
+def _bundles(tmp_path: Path) -> Path:
+    service = EvaluationService(
+        analyzer=CleanAnalyzer(),
+        test_runner=PassingTestRunner(),
+        promise_loader=FakePromiseLoader(),
+    )
+    packs = tmp_path / "packs"
+    for name in ("a", "b"):
+        config = EvaluationConfig(promise_id=name, pytest_targets=["tests"], run_dir="runs")
+        result = service.evaluate_path(str(tmp_path), config)
+        export_audit_pack(tmp_path / "runs" / result.details["run_id"], packs / f"{name}.zip")
+    # A copy of "a" whose pytest evidence was rewritten.
+    (packs / "nested").mkdir()
+    with zipfile.ZipFile(packs / "a.zip") as source, zipfile.ZipFile(
+        packs / "nested" / "tampered.zip", "w"
+    ) as target:
+        for info in source.infolist():
+            data = b"{}" if info.filename == "evidence/pytest.json" else source.read(info)
+            target.writestr(info.filename, data)
+    shutil.copy(packs / "b.zip", packs / "nested" / "b-copy.zip")
+    return packs
+
+
+def test_batch_skips_bundles_already_in_the_ledger(tmp_path: Path) -> None:
+    packs = _bundles(tmp_path)
+    ledger = VerificationLedger(tmp_path / "ledger.jsonl")
+    bundles = sorted(packs.rglob("*.zip"))
+    streamed = []
+
+    first = verify_bundles(bundles, ledger, jobs=3, on_result=streamed.append)
+
+    assert sorted(r.bundle for r in streamed) == [str(b) for b in bundles]
+    assert (first.bundles, first.ok, first.failed, first.skipped) == (4, 3, 1, 0)
+    tampered = str(packs / "nested" / "tampered.zip")
+    mismatch = "hash mismatch for evidence/pytest.json"
+    assert first.failures == [{"bundle": tampered, "error": mismatch}]
+    assert first.reasons == {mismatch: 1}
+
+    again = verify_bundles(bundles, ledger, jobs=3)
+    assert (again.ok, again.failed, again.skipped) == (0, 1, 3)
+    assert verify_bundles(bundles, ledger, reverify=True).skipped == 0
+
+
+def test_verify_recursive_streams_ndjson_and_summary(tmp_path: Path) -> None:
+    packs = _bundles(tmp_path)
+    ledger = tmp_path / "ledger.jsonl"
+
+    result = CliRunner().invoke(
+        app, ["verify", "--recursive", str(packs), "--ledger", str(ledger), "--jobs", "2"]
+    )
+
+    assert result.exit_code == 1
+    lines = [json.loads(line) for line in result.output.splitlines()]
+    assert [line["type"] for line in lines] == ["bundle"] * 4 + ["summary"]
+    assert {line["status"] for line in lines[:4]} == {"ok", "failed"}
+    assert lines[-1]["ok"] == 3 and lines[-1]["failed"] == 1
+    assert len(ledger.read_text(encoding="utf-8").splitlines()) == 3
+
+
+def test_ledger_record_after_a_torn_line_stays_readable(tmp_path: Path) -> None:
+    ledger = VerificationLedger(tmp_path / "verify-ledger.jsonl")
+    ledger.record("a" * 64, "first.zip")
+    with ledger.path.open("a", encoding="utf-8") as handle:
+        handle.write('{"sha256": "torn')
+    ledger.record("b" * 64, "second.zip")
+
+    assert ledger.verified() == {"a" * 64, "b" * 64}
+
+
+def test_split_jobs_shares_the_worker_budget() -> None:
+    assert split_jobs(8, 100) == (8, 1)
+    assert split_jobs(8, 2) == (2, 4)
+    assert split_jobs(1, 5) == (1, 1)
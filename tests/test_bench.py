@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from praevisio.application.bench_service import OPERATIONS, BenchService, compare_to_baseline
+from praevisio.infrastructure.bench_fixtures import BenchScenario, load_scenarios
+
+
+def test_bench_runs_offline_with_standins(tmp_path: Path) -> None:
+    scenario = BenchScenario(name="tiny", files=3, call_sites=5, findings=2, promises=2)
+    service = BenchService(tmp_path, repeat=1, force_standins=True)
+
+    report = service.run([scenario])
+
+    assert report["standins"] == ["semgrep", "pytest"]
+    assert [r["operation"] for r in report["results"]] == list(OPERATIONS)
+    evaluate = report["results"][0]
+    assert evaluate["details"]["llm_call_sites"] == 5
+    assert evaluate["details"]["violations"] == 2
+    assert evaluate["details"]["audit_events"] > 0
+    assert all(r["median_s"] > 0 for r in report["results"])
+
+
+def test_compare_to_baseline_flags_slowdowns_beyond_tolerance() -> None:
+    def report(**medians: float) -> dict:
+        return {
+            "results": [
+                {"scenario": "s", "operation": op, "median_s": median}
+                for op, median in medians.items()
+            ]
+        }
+
+    baseline = report(export=1.0, verify=1.0)
+    current = report(export=1.2, verify=1.5, replay=9.0)
+
+    regressions = compare_to_baseline(current, baseline, tolerance=0.25)
+    assert [(r.operation, r.ratio) for r in regressions] == [("verify", 1.5)]
+
+
+def test_repository_scenarios_are_valid() -> None:
+    scenarios = load_scenarios(Path(__file__).parents[1] / "benchmarks" / "scenarios.yaml")
+    assert [s.name for s in scenarios] == ["small", "medium", "large"]
+    with pytest.raises(ValueError):
+        BenchScenario(name="bad", call_sites=1, findings=2)
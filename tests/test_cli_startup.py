@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from praevisio.presentation import daemon_client
+
+# Modules that only some commands need; loading them at CLI start-up is what
+# made every git hook invocation slow.
+HEAVY_MODULES = (
+    "abductio_core",
+    "yaml",
+    "sqlite3",
+    "concurrent.futures.process",
+    "praevisio.application.engine",
+    "praevisio.application.evaluation_service",
+    "praevisio.infrastructure.audit_pack",
+)
+
+# Cumulative import time of praevisio.presentation.cli, in microseconds. It is
+# about 120ms on a developer laptop (stdlib + typer); the budget leaves room for
+# slow CI machines but not for an eager import of the evaluation stack.
+CLI_IMPORT_BUDGET_US = 400_000
+
+
+def _import_times(*args: str, module: str = "praevisio", cwd: Path | None = None) -> Dict[str, int]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", module, *args],
+        capture_output=True,
+        text=True,
+        check=False,
+        cwd=cwd,
+    )
+    assert completed.returncode == 0, completed.stdout + completed.stderr
+    times: Dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative.strip())
+    return times
+
+
+@pytest.mark.parametrize("args", [["version"], ["runs", "list", "--help"], ["--help"]])
+def test_cli_startup_skips_heavy_modules(args: List[str]) -> None:
+    times = _import_times(*args)
+
+    assert "praevisio.presentation.cli" in times
+    loaded = sorted(name for name in times if name.startswith(HEAVY_MODULES))
+    assert loaded == []
+
+
+def test_cli_import_stays_within_budget() -> None:
+    times = _import_times("version")
+
+    assert times["praevisio.presentation.cli"] < CLI_IMPORT_BUDGET_US
+
+
+def test_show_run_loads_only_the_run_index(tmp_path: Path) -> None:
+    run_root = tmp_path / "runs" / "run-1"
+    run_root.mkdir(parents=True)
+    (run_root / "manifest.json").write_text('{"metadata": {}}', encoding="utf-8")
+
+    times = _import_times("show-run", "run-1", "--runs-dir", "runs", cwd=tmp_path)
+
+    loaded = sorted(name for name in times if name.startswith(HEAVY_MODULES))
+    # The run index is SQLite; nothing else of the evaluation stack is needed.
+    assert loaded and all(name.startswith("sqlite3") for name in loaded)
+
+
+def test_pre_commit_hook_client_skips_the_cli(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    path = daemon_client.socket_path(tmp_path)
+    daemon_client.ensure_socket_dir(path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen(1)
+
+    def serve() -> None:
+        # Stands in for a warm daemon: accept one request and pass it.
+        conn, _ = server.accept()
+        with conn:
+            _, fds, _, _ = socket.recv_fds(conn, daemon_client.MAX_MESSAGE, 2)
+            for fd in fds:
+                os.close(fd)
+            conn.sendall(daemon_client.encode_message({"exit_code": 0}))
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    try:
+        times = _import_times(
+            "pre-commit", module="praevisio.presentation.daemon_client", cwd=tmp_path
+        )
+    finally:
+        thread.join(timeout=10)
+        server.close()
+
+    loaded = sorted(
+        name
+        for name in times
+        if name.startswith(HEAVY_MODULES) or name in ("typer", "praevisio.presentation.cli")
+    )
+    assert loaded == []
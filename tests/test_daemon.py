@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from praevisio.infrastructure.config import CachingConfigLoader, YamlConfigLoader
+from praevisio.presentation import daemon_client
+
+
+@pytest.fixture
+def daemon(tmp_path: Path):
+    process = subprocess.Popen(
+        [sys.executable, "-m", "praevisio", "daemon", str(tmp_path), "--idle-timeout", "60"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 20
+        while daemon_client.request(tmp_path, {"command": "ping"}) is None:
+            assert process.poll() is None, "daemon exited during startup"
+            assert time.monotonic() < deadline, "daemon did not start"
+            time.sleep(0.05)
+        yield tmp_path
+    finally:
+        daemon_client.request(tmp_path, {"command": "stop"})
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def test_forwarded_command_writes_to_client_streams(daemon: Path, capfd) -> None:
+    exit_code = daemon_client.forward(["pre-commit", "--config", "missing.yaml"], cwd=daemon)
+
+    assert exit_code == 2
+    assert "Config not found: missing.yaml" in capfd.readouterr().out
+    # Only the hook's command is served; everything else runs in-process.
+    assert daemon_client.forward(["ci-gate"], cwd=daemon) is None
+
+
+def test_client_falls_back_without_daemon(tmp_path: Path) -> None:
+    assert daemon_client.request(tmp_path, {"command": "ping"}) is None
+    assert daemon_client.forward(["pre-commit"], cwd=tmp_path) is None
+
+
+def test_caching_config_loader_reloads_changed_file(tmp_path: Path) -> None:
+    config_path = tmp_path / ".praevisio.yaml"
+    config_path.write_text("evaluation:\n  threshold: 0.5\n", encoding="utf-8")
+    loader = CachingConfigLoader(YamlConfigLoader())
+
+    first = loader.load(str(config_path))
+    assert loader.load(str(config_path)) is first
+    config_path.write_text("evaluation:\n  threshold: 0.75\n", encoding="utf-8")
+    assert loader.load(str(config_path)).evaluation.threshold == 0.75
+
+
+def test_client_ignores_untrusted_sockets(tmp_path: Path, monkeypatch) -> None:
+    import socket
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    path = daemon_client.socket_path(tmp_path)
+    assert path == tmp_path / ".praevisio" / "daemon" / "daemon.sock"
+    daemon_client.ensure_socket_dir(path)
+    path.write_text("not a socket", encoding="utf-8")
+    assert not daemon_client.is_trusted_socket(path)
+    path.unlink()
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(path))
+        assert daemon_client.is_trusted_socket(path)
+        # Anyone able to write to the directory could have swapped the socket.
+        path.parent.chmod(0o777)
+        assert not daemon_client.is_trusted_socket(path)
+        assert daemon_client.request(tmp_path, {"command": "ping"}) is None
+
+
+def test_silent_client_does_not_block_the_daemon(tmp_path: Path, monkeypatch) -> None:
+    import socket
+    import threading
+
+    from praevisio.presentation import daemon as daemon_module
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr(daemon_module, "REQUEST_TIMEOUT", 0.2)
+    server = daemon_module.EvaluationDaemon(tmp_path, idle_timeout=30)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not daemon_client.is_trusted_socket(server.socket_path):
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.02)
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as silent:
+        silent.connect(str(server.socket_path))
+        started = time.monotonic()
+        reply = daemon_client.request(tmp_path, {"command": "ping"})
+        assert reply is not None and reply["ok"]
+        assert time.monotonic() - started < 5
+    daemon_client.request(tmp_path, {"command": "stop"})
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+
+
+def test_daemon_reports_unusable_socket_dir(tmp_path: Path, monkeypatch) -> None:
+    from praevisio.presentation.daemon import DaemonUnavailable, EvaluationDaemon
+
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    (tmp_path / ".praevisio").mkdir()
+    (tmp_path / ".praevisio" / "daemon").write_text("", encoding="utf-8")
+
+    with pytest.raises(DaemonUnavailable):
+        EvaluationDaemon(tmp_path).serve()
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import os
+from pathlib import Path
+import subprocess
+import sys
+import threading
+import time
 
 from praevisio.application.evaluation_service import EvaluationService
 from praevisio.domain.entities import StaticAnalysisResult
 from praevisio.domain.evaluation_config import EvaluationConfig
 from praevisio.domain.models import Promise
+from praevisio.infrastructure.cancellation import run_cancellable
+from praevisio.infrastructure.test_runner_forkserver import ForkServerPytestRunner
+from praevisio.infrastructure.test_runner_subprocess import SubprocessPytestRunner
 
 
 @dataclass
@@ -215,3 +223,123 @@ def test_applicability_override_ignored(monkeypatch, tmp_path) -> None:
     result = service.evaluate_path(str(tmp_path), config=config)
     assert result.details["applicable"] is True
     assert "applicability_override_ignored" in result.details["anomalies"]
+
+
+def test_collectors_run_concurrently_under_seed(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr("praevisio.application.evaluation_service.run_session", _fake_run_session)
+    barrier = threading.Barrier(2, timeout=5)
+    seen_seeds = []
+
+    class BarrierTestRunner:
+        def run(self, path: str, args: list[str]) -> int:
+            seen_seeds.append(os.environ.get("PRAEVISIO_SEED"))
+            barrier.wait()
+            return 0
+
+    class BarrierAnalyzer:
+        def analyze(self, path: str) -> StaticAnalysisResult:
+            seen_seeds.append(os.environ.get("PRAEVISIO_SEED"))
+            barrier.wait()
+            return StaticAnalysisResult(total_llm_calls=1, violations=0, coverage=1.0, findings=[])
+
+    loader = FakePromiseLoader(Promise(id="llm-input-logging", statement="test"))
+    service = EvaluationService(
+        analyzer=BarrierAnalyzer(), test_runner=BarrierTestRunner(), promise_loader=loader
+    )
+    config = replace(_base_config(), determinism_runs=1, determinism_seed=7)
+    result = service.evaluate_path(str(tmp_path), config=config)
+    assert result.verdict != "error"
+    assert result.details["evidence"]["test_passes"] is True
+    assert seen_seeds == ["7", "7"]
+
+
+def test_replicates_run_in_isolated_copies_of_the_dirty_tree(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr("praevisio.application.evaluation_service.run_session", _fake_run_session)
+    git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    (tmp_path / "app.py").write_text("v1\n", encoding="utf-8")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    subprocess.run([*git, "add", "app.py"], cwd=tmp_path, check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "init"], cwd=tmp_path, check=True)
+    (tmp_path / "app.py").write_text("v2\n", encoding="utf-8")
+    (tmp_path / "new.py").write_text("untracked\n", encoding="utf-8")
+    seen = []
+
+    class TreeAnalyzer:
+        def analyze(self, path: str) -> StaticAnalysisResult:
+            root = Path(path)
+            seen.append((path, (root / "app.py").read_text(), (root / "new.py").exists()))
+            return StaticAnalysisResult(total_llm_calls=1, violations=0, coverage=1.0, findings=[])
+
+    loader = FakePromiseLoader(Promise(id="llm-input-logging", statement="test"))
+    service = EvaluationService(
+        analyzer=TreeAnalyzer(), test_runner=FlakyTestRunner(), promise_loader=loader
+    )
+    config = replace(_base_config(), determinism_runs=3, determinism_seed=1)
+    result = service.evaluate_path(str(tmp_path), config=config)
+
+    assert result.details["determinism"]["mismatch"] is False
+    assert len({path for path, _, _ in seen}) == 3
+    assert all(content == "v2\n" and untracked for _, content, untracked in seen)
+    worktrees = subprocess.run(
+        ["git", "worktree", "list"], cwd=tmp_path, capture_output=True, text=True, check=True
+    )
+    assert len(worktrees.stdout.splitlines()) == 1
+
+
+def test_first_mismatch_cancels_remaining_replicates(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr("praevisio.application.evaluation_service.run_session", _fake_run_session)
+    lock = threading.Lock()
+    replicate_calls = []
+
+    class SlowReplicaRunner:
+        def run(self, path: str, args: list[str]) -> int:
+            if Path(path) == tmp_path:
+                return 0
+            with lock:
+                replicate_calls.append(path)
+                first = len(replicate_calls) == 1
+            if first:
+                return 1
+            return run_cancellable([sys.executable, "-c", "import time; time.sleep(60)"]).returncode
+
+    loader = FakePromiseLoader(Promise(id="llm-input-logging", statement="test"))
+    service = EvaluationService(
+        analyzer=FakeAnalyzer(
+            StaticAnalysisResult(total_llm_calls=1, violations=0, coverage=1.0, findings=[])
+        ),
+        test_runner=SlowReplicaRunner(),
+        promise_loader=loader,
+    )
+    config = replace(_base_config(), determinism_runs=4, determinism_seed=1)
+    started = time.monotonic()
+    result = service.evaluate_path(str(tmp_path), config=config)
+
+    assert result.details["determinism"]["mismatch"] is True
+    assert time.monotonic() - started < 30
+
+
+def test_replicates_do_not_start_fork_servers(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr("praevisio.application.evaluation_service.run_session", _fake_run_session)
+    runs = []
+    monkeypatch.setattr(
+        ForkServerPytestRunner, "run", lambda self, path, args: runs.append(("fork", path)) or 0
+    )
+    monkeypatch.setattr(
+        SubprocessPytestRunner,
+        "run_sharded",
+        lambda self, path, args: runs.append(("cold", path)) or (0, []),
+    )
+    loader = FakePromiseLoader(Promise(id="llm-input-logging", statement="test"))
+    service = EvaluationService(
+        analyzer=FakeAnalyzer(
+            StaticAnalysisResult(total_llm_calls=1, violations=0, coverage=1.0, findings=[])
+        ),
+        promise_loader=loader,
+    )
+    config = replace(
+        _base_config(), determinism_runs=3, determinism_seed=1, pytest_runner="forkserver"
+    )
+    service.evaluate_path(str(tmp_path), config=config)
+
+    assert runs[0] == ("fork", str(tmp_path))
+    assert sorted(kind for kind, _ in runs[1:]) == ["cold", "cold"]
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+
+from praevisio.application.evaluation_service import EvaluationService
+from praevisio.domain.entities import StaticAnalysisResult, StaticFinding
+from praevisio.domain.evaluation_config import EvaluationConfig
+from praevisio.domain.models import Promise
+
+
+@dataclass
+class FakePromiseLoader:
+    def load(self, promise_id: str) -> Promise:
+        return Promise(id=promise_id, statement="test")
+
+
+@dataclass
+class CountingTestRunner:
+    calls: int = 0
+
+    def run(self, path: str, args: list[str]) -> int:
+        self.calls += 1
+        return 0
+
+
+@dataclass
+class FakeAnalyzer:
+    def analyze(self, path: str) -> StaticAnalysisResult:
+        return StaticAnalysisResult(
+            total_llm_calls=2,
+            violations=1,
+            coverage=0.5,
+            findings=[StaticFinding(file="app.py", line=3, code="call()")],
+        )
+
+
+def _git_repo(root: Path) -> None:
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    (root / "app.py").write_text("print('hello')\n", encoding="utf-8")
+    (root / "rules.yaml").write_text("rules: []\n", encoding="utf-8")
+    subprocess.run(["git", "add", "app.py", "rules.yaml"], cwd=root, check=True)
+
+
+def _config(run_dir: str) -> EvaluationConfig:
+    return EvaluationConfig(
+        promise_id="llm-input-logging",
+        threshold=0.2,
+        abductio_tau=0.1,
+        pytest_targets=["tests/test_logging.py"],
+        semgrep_rules_path="rules.yaml",
+        run_dir=run_dir,
+        evidence_cache=True,
+    )
+
+
+def _metadata(result) -> dict:
+    manifest = json.loads(Path(result.details["manifest_path"]).read_text(encoding="utf-8"))
+    return manifest["metadata"]
+
+
+def _evidence_file(result, name: str) -> dict:
+    run_root = Path(result.details["manifest_path"]).parent
+    return json.loads((run_root / "evidence" / name).read_text(encoding="utf-8"))
+
+
+def _service(runner: CountingTestRunner) -> EvaluationService:
+    return EvaluationService(
+        analyzer=FakeAnalyzer(), test_runner=runner, promise_loader=FakePromiseLoader()
+    )
+
+
+def test_cache_hit_skips_collection(tmp_path: Path) -> None:
+    _git_repo(tmp_path)
+    runner = CountingTestRunner()
+    first = _service(runner).evaluate_path(str(tmp_path), config=_config("runs-1"))
+    second = _service(runner).evaluate_path(str(tmp_path), config=_config("runs-2"))
+
+    assert runner.calls == 1
+    assert _metadata(first)["evidence_source"] == "collected"
+    assert _metadata(second)["evidence_source"] == "cache"
+    assert _metadata(second)["evidence_cache_key"] == _metadata(first)["evidence_cache_key"]
+    assert first.details["evidence"] == second.details["evidence"]
+    for name in ("pytest.json", "semgrep.json"):
+        collected, replayed = (_evidence_file(result, name) for result in (first, second))
+        # Resource figures describe the run, so a cache hit reports none.
+        assert replayed.pop("resources") == {
+            "processes": 0,
+            "wall_s": 0,
+            "user_cpu_s": None,
+            "system_cpu_s": None,
+            "max_rss_kb": None,
+            "invocations": [],
+            "cached": True,
+        }
+        collected.pop("resources")
+        assert collected == replayed
+
+
+def test_cache_misses_after_tracked_change(tmp_path: Path) -> None:
+    _git_repo(tmp_path)
+    runner = CountingTestRunner()
+    first = _service(runner).evaluate_path(str(tmp_path), config=_config("runs-1"))
+    (tmp_path / "app.py").write_text("print('changed')\n", encoding="utf-8")
+    second = _service(runner).evaluate_path(str(tmp_path), config=_config("runs-2"))
+
+    assert runner.calls == 2
+    assert _metadata(second)["evidence_source"] == "collected"
+    assert _metadata(second)["evidence_cache_key"] != _metadata(first)["evidence_cache_key"]
+
+
+def test_cache_disabled_outside_git(tmp_path: Path) -> None:
+    runner = CountingTestRunner()
+    _service(runner).evaluate_path(str(tmp_path), config=_config("runs-1"))
+    result = _service(runner).evaluate_path(str(tmp_path), config=_config("runs-2"))
+
+    assert runner.calls == 2
+    assert "evidence_cache_key" not in _metadata(result)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, replace
+from pathlib import Path
+
+from praevisio.application.evaluation_service import EvaluationService
+from praevisio.application.evidence_sharing import evidence_fingerprint, shared_evidence
+from praevisio.domain.entities import StaticAnalysisResult
+from praevisio.domain.evaluation_config import EvaluationConfig
+from praevisio.domain.models import Promise
+
+
+@dataclass
+class FakePromiseLoader:
+    def load(self, promise_id: str) -> Promise:
+        return Promise(id=promise_id, statement="test")
+
+
+@dataclass
+class CountingTestRunner:
+    calls: int = 0
+
+    def run(self, path: str, args: list[str]) -> int:
+        self.calls += 1
+        return 0
+
+
+@dataclass
+class CountingAnalyzer:
+    calls: int = 0
+
+    def analyze(self, path: str) -> StaticAnalysisResult:
+        self.calls += 1
+        return StaticAnalysisResult(total_llm_calls=1, violations=0, coverage=1.0, findings=[])
+
+
+def _config(promise_id: str, run_dir: str) -> EvaluationConfig:
+    return EvaluationConfig(
+        promise_id=promise_id,
+        threshold=0.2,
+        abductio_tau=0.1,
+        pytest_targets=["tests/test_logging.py"],
+        semgrep_rules_path="rules.yaml",
+        run_dir=run_dir,
+    )
+
+
+def _manifest(result) -> dict:
+    return json.loads(Path(result.details["manifest_path"]).read_text(encoding="utf-8"))
+
+
+def test_fingerprint_ignores_promise_id() -> None:
+    base = _config("a", ".praevisio/runs")
+    assert evidence_fingerprint(".", base) == evidence_fingerprint(
+        ".", replace(base, promise_id="b", threshold=0.9)
+    )
+    assert evidence_fingerprint(".", base) != evidence_fingerprint(
+        ".", replace(base, pytest_args=["-x"])
+    )
+    for changed in (
+        replace(base, pytest_runner="forkserver"),
+        replace(base, pytest_shards=4),
+        replace(base, semgrep_file_cache=True),
+        replace(base, evidence_cache=True),
+        replace(base, evidence_cache_dir="cache"),
+        replace(base, hash_only_evidence=True),
+    ):
+        assert evidence_fingerprint(".", base) != evidence_fingerprint(".", changed)
+
+
+def test_shared_evidence_collects_once(tmp_path: Path) -> None:
+    runner = CountingTestRunner()
+    analyzer = CountingAnalyzer()
+    service = EvaluationService(
+        analyzer=analyzer, test_runner=runner, promise_loader=FakePromiseLoader()
+    )
+    with shared_evidence():
+        first = service.evaluate_path(str(tmp_path), config=_config("a", "runs-a"))
+        second = service.evaluate_path(str(tmp_path), config=_config("b", "runs-b"))
+
+    assert runner.calls == 1
+    assert analyzer.calls == 1
+    assert first.details["evidence_refs"] == second.details["evidence_refs"]
+    assert _manifest(first)["metadata"]["evidence_source"] == "collected"
+    metadata = _manifest(second)["metadata"]
+    assert metadata["evidence_source"] == "shared"
+    assert metadata["evidence_shared_from"] == first.details["run_id"]
+
+    shared_pytest = Path(second.details["manifest_path"]).parent / "evidence" / "pytest.json"
+    original_pytest = Path(first.details["manifest_path"]).parent / "evidence" / "pytest.json"
+    assert shared_pytest.read_bytes() == original_pytest.read_bytes()
+
+
+def test_evidence_not_shared_outside_scope(tmp_path: Path) -> None:
+    runner = CountingTestRunner()
+    service = EvaluationService(
+        analyzer=CountingAnalyzer(), test_runner=runner, promise_loader=FakePromiseLoader()
+    )
+    service.evaluate_path(str(tmp_path), config=_config("a", "runs-a"))
+    service.evaluate_path(str(tmp_path), config=_config("b", "runs-b"))
+    assert runner.calls == 2
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from praevisio.infrastructure.test_runner_forkserver import ForkServerPytestRunner
+
+
+@pytest.fixture
+def runner():
+    runner = ForkServerPytestRunner(preload=["helper"])
+    yield runner
+    runner.close()
+
+
+def _project(root: Path) -> None:
+    (root / "helper.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (root / "test_value.py").write_text(
+        "import os\n\nimport helper\n\n\n"
+        "def test_value():\n    assert helper.VALUE == int(os.environ['EXPECTED'])\n",
+        encoding="utf-8",
+    )
+
+
+def test_exit_codes_and_environment_reach_each_run(runner, monkeypatch, tmp_path: Path) -> None:
+    _project(tmp_path)
+    monkeypatch.setenv("EXPECTED", "1")
+    assert runner.run(str(tmp_path), ["-q", "-p", "no:cacheprovider"]) == 0
+    monkeypatch.setenv("EXPECTED", "2")
+    assert runner.run(str(tmp_path), ["-q", "-p", "no:cacheprovider"]) == 1
+
+
+def test_changed_preloaded_module_restarts_server(runner, monkeypatch, tmp_path: Path) -> None:
+    _project(tmp_path)
+    monkeypatch.setenv("EXPECTED", "1")
+    assert runner.run(str(tmp_path), ["-q", "-p", "no:cacheprovider"]) == 0
+
+    (tmp_path / "helper.py").write_text("VALUE = 22\n", encoding="utf-8")
+    monkeypatch.setenv("EXPECTED", "22")
+    assert runner.run(str(tmp_path), ["-q", "-p", "no:cacheprovider"]) == 0
+
+
+def test_runs_in_different_roots_overlap(runner, tmp_path: Path) -> None:
+    # Each test waits for the other's marker file, so the runs pass only if
+    # both are in flight at the same time.
+    roots = [tmp_path / "a", tmp_path / "b"]
+    for root, other in zip(roots, reversed(roots)):
+        root.mkdir()
+        (root / "helper.py").write_text("", encoding="utf-8")
+        (root / "test_overlap.py").write_text(
+            "import pathlib\nimport time\n\n\n"
+            "def test_overlap():\n"
+            f"    pathlib.Path({str(root / 'started')!r}).touch()\n"
+            "    deadline = time.monotonic() + 20\n"
+            f"    while not pathlib.Path({str(other / 'started')!r}).exists():\n"
+            "        assert time.monotonic() < deadline\n"
+            "        time.sleep(0.05)\n",
+            encoding="utf-8",
+        )
+    codes: dict = {}
+    threads = [
+        threading.Thread(
+            target=lambda root=root: codes.update(
+                {root: runner.run(str(root), ["-q", "-p", "no:cacheprovider"])}
+            )
+        )
+        for root in roots
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert codes == {roots[0]: 0, roots[1]: 0}
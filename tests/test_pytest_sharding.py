@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from praevisio.application.evaluation_service import EvaluationService
+from praevisio.domain.entities import StaticAnalysisResult
+from praevisio.domain.evaluation_config import EvaluationConfig
+from praevisio.domain.models import Promise
+from praevisio.infrastructure.test_runner_subprocess import balance_shards, combine_exit_codes
+
+
+@dataclass
+class FakePromiseLoader:
+    def load(self, promise_id: str) -> Promise:
+        return Promise(id=promise_id, statement="test")
+
+
+@dataclass
+class FakeAnalyzer:
+    def analyze(self, path: str) -> StaticAnalysisResult:
+        return StaticAnalysisResult(total_llm_calls=0, violations=0, coverage=1.0, findings=[])
+
+
+def test_balance_shards_uses_recorded_durations() -> None:
+    durations = {"t::slow": 10.0, "t::a": 3.0, "t::b": 3.0, "t::c": 3.0}
+    shards = balance_shards(["t::a", "t::b", "t::c", "t::slow", "t::new"], durations, 2)
+    assert shards == [["t::slow"], ["t::a", "t::b", "t::c", "t::new"]]
+
+
+def test_combine_exit_codes() -> None:
+    assert combine_exit_codes([0, 0]) == 0
+    assert combine_exit_codes([0, 5]) == 0
+    assert combine_exit_codes([5, 5]) == 5
+    assert combine_exit_codes([0, 1]) == 1
+    assert combine_exit_codes([1, 2]) == 2
+
+
+def test_failing_shard_fails_the_run(tmp_path: Path) -> None:
+    (tmp_path / "test_many.py").write_text(
+        "import pytest\n\n\n"
+        "@pytest.mark.parametrize('n', range(5))\n"
+        "def test_n(n):\n    assert n != 3\n",
+        encoding="utf-8",
+    )
+    config = EvaluationConfig(
+        promise_id="p",
+        pytest_targets=["test_many.py"],
+        pytest_args=["-q", "-p", "no:cacheprovider"],
+        semgrep_rules_path="",
+        pytest_shards=2,
+    )
+    service = EvaluationService(analyzer=FakeAnalyzer(), promise_loader=FakePromiseLoader())
+    result = service.evaluate_path(str(tmp_path), config=config)
+
+    assert result.details["evidence"]["test_passes"] is False
+    manifest = Path(result.details["manifest_path"])
+    payload = json.loads((manifest.parent / "evidence" / "pytest.json").read_text())
+    assert payload["exit_code"] == 1
+    shards = payload["shards"]
+    assert [shard["index"] for shard in shards] == [0, 1]
+    assert sum(shard["tests"] for shard in shards) == 5
+    assert sorted(shard["exit_code"] for shard in shards) == [0, 1]
+    durations = json.loads((tmp_path / ".praevisio/cache/pytest-durations.json").read_text())
+    assert len(durations) == 5
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import os
+import sys
+import time
+from dataclasses import replace
+
+import pytest
+
+from praevisio.application.evaluation_service import EvaluationService, EvidenceCollection
+from praevisio.domain.entities import StaticAnalysisResult
+from praevisio.infrastructure.cancellation import run_cancellable
+from praevisio.infrastructure.resource_usage import (
+    RESOURCES_KEY,
+    MeteredPopen,
+    measure_resources,
+)
+
+ALLOCATE_64MB = "data = bytearray(64 * 1024 * 1024); data[::4096] = b'x' * len(data[::4096])"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="child rusage needs os.wait4")
+def test_child_rusage_is_recorded_on_the_active_meter() -> None:
+    run_cancellable([sys.executable, "-c", "pass"])  # no meter: nothing to record
+    with measure_resources() as meter:
+        result = run_cancellable([sys.executable, "-c", ALLOCATE_64MB], capture_output=True)
+
+    assert result.returncode == 0
+    summary = meter.summary()
+    assert summary["processes"] == 1
+    assert summary["max_rss_kb"] >= 64 * 1024
+    assert summary["user_cpu_s"] is not None and summary["wall_s"] > 0
+    assert summary["invocations"][0]["command"].startswith(os.path.basename(sys.executable))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="child rusage needs os.wait4")
+def test_child_reaped_by_poll_is_recorded() -> None:
+    with measure_resources() as meter:
+        process = MeteredPopen([sys.executable, "-c", ALLOCATE_64MB])
+        deadline = time.monotonic() + 30
+        while process.poll() is None:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+    assert process.returncode == 0 and process.wait() == 0
+    summary = meter.summary()
+    assert summary["processes"] == 1
+    assert summary["max_rss_kb"] >= 64 * 1024
+
+
+def test_resources_do_not_affect_evidence_digest() -> None:
+    collection = EvidenceCollection(
+        evidence={},
+        pytest_payload={"exit_code": 0, RESOURCES_KEY: {"max_rss_kb": 1000}},
+        semgrep_payload={"violations": 0, RESOURCES_KEY: {"max_rss_kb": 2000}},
+        static_skipped=False,
+        test_error=None,
+        sa_result=StaticAnalysisResult(total_llm_calls=0, violations=0, coverage=0.0),
+    )
+    heavier = replace(
+        collection,
+        pytest_payload={"exit_code": 0, RESOURCES_KEY: {"max_rss_kb": 9000}},
+        semgrep_payload={"violations": 0},
+    )
+
+    assert EvaluationService._evidence_digest(collection) == EvaluationService._evidence_digest(
+        heavier
+    )
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from praevisio.application.evaluation_service import EvaluationService
+from praevisio.domain.entities import StaticAnalysisResult
+from praevisio.domain.evaluation_config import EvaluationConfig
+from praevisio.domain.models import Promise
+from praevisio.infrastructure.run_index import INDEX_FILENAME, RunIndex
+from praevisio.presentation.cli import app
+
+
+@dataclass
+class FakePromiseLoader:
+    def load(self, promise_id: str) -> Promise:
+        return Promise(id=promise_id, statement="test")
+
+
+@dataclass
+class PassingTestRunner:
+    def run(self, path: str, args: list[str]) -> int:
+        return 0
+
+
+@dataclass
+class CleanAnalyzer:
+    def analyze(self, path: str) -> StaticAnalysisResult:
+        return StaticAnalysisResult(total_llm_calls=1, violations=0, coverage=1.0, findings=[])
+
+
+def _evaluate(root: Path, promise_id: str, run_dir: str):
+    service = EvaluationService(
+        analyzer=CleanAnalyzer(),
+        test_runner=PassingTestRunner(),
+        promise_loader=FakePromiseLoader(),
+    )
+    config = EvaluationConfig(promise_id=promise_id, pytest_targets=["tests"], run_dir=run_dir)
+    return service.evaluate_path(str(root), config)
+
+
+def test_evaluations_are_indexed_and_index_is_rebuilt(tmp_path: Path) -> None:
+    first = _evaluate(tmp_path, "promise-a", "runs")
+    second = _evaluate(tmp_path, "promise-b", "runs")
+
+    index = RunIndex(tmp_path / "runs")
+    record = index.get(first.details["run_id"])
+    assert record is not None
+    assert record.promise_id == "promise-a"
+    assert record.verdict == first.verdict
+    assert record.credence == first.credence
+    assert record.k_root == first.details["k_root"]
+    assert record.manifest_sha256 == first.details["manifest_sha256"]
+    assert record.audit_sha256 == first.details["audit_sha256"]
+    assert record.toolchain["praevisio_version"]
+    assert [r.promise_id for r in index.query()] == ["promise-b", "promise-a"]
+    assert [r.run_id for r in index.query(promise_id="promise-b")] == [
+        second.details["run_id"]
+    ]
+
+    (tmp_path / "runs" / INDEX_FILENAME).unlink()
+    rebuilt = RunIndex(tmp_path / "runs").get(first.details["run_id"])
+    assert rebuilt is not None
+    assert (rebuilt.promise_id, rebuilt.verdict) == ("promise-a", first.verdict)
+    assert rebuilt.audit_sha256 == first.details["audit_sha256"]
+
+
+def test_runs_list_filters_by_promise_and_time(tmp_path: Path) -> None:
+    result = _evaluate(tmp_path, "promise-a", "runs")
+    runs_dir = str(tmp_path / "runs")
+    runner = CliRunner()
+
+    listed = runner.invoke(app, ["runs", "list", "--runs-dir", runs_dir, "--promise", "promise-a"])
+    assert listed.exit_code == 0
+    assert result.details["run_id"] in listed.output
+
+    other = runner.invoke(app, ["runs", "list", "--runs-dir", runs_dir, "--promise", "other"])
+    assert "No runs found" in other.output
+    future = runner.invoke(app, ["runs", "list", "--runs-dir", runs_dir, "--since", "2999-01-01"])
+    assert "No runs found" in future.output
+    invalid = runner.invoke(app, ["runs", "list", "--runs-dir", runs_dir, "--since", "soon"])
+    assert invalid.exit_code == 2
+
+
+def test_concurrent_evaluations_get_their_own_run_directories(tmp_path: Path) -> None:
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(
+            pool.map(lambda i: _evaluate(tmp_path, f"promise-{i}", "runs"), range(8))
+        )
+
+    run_ids = [result.details["run_id"] for result in results]
+    assert len(set(run_ids)) == len(run_ids)
+    assert sorted(r.run_id for r in RunIndex(tmp_path / "runs").query()) == sorted(run_ids)
+    for index, run_id in enumerate(run_ids):
+        report = (tmp_path / "runs" / run_id / "report.json").read_text(encoding="utf-8")
+        assert f'"promise-{index}"' in report
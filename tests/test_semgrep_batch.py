@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import yaml
+
+from praevisio.application.semgrep_batch import batch_static_analysis
+from praevisio.domain.evaluation_config import EvaluationConfig
+from praevisio.infrastructure.config import YamlConfigLoader
+from praevisio.infrastructure.static_analysis_semgrep import (
+    SemgrepMatch,
+    SemgrepStaticAnalyzer,
+)
+
+
+def _rules(path: Path, label: str, violation_id: str) -> None:
+    path.write_text(
+        yaml.safe_dump(
+            {
+                "rules": [
+                    {"id": "llm-call-site", "message": label},
+                    {"id": violation_id, "message": label},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def test_single_run_is_split_per_promise(monkeypatch, tmp_path: Path) -> None:
+    calls = []
+
+    def fake_run(self, root: Path, rules_path: Path, targets: list[str], keep=None):
+        # Stand-in for semgrep: every rule matches once, reporting its message.
+        rules = yaml.safe_load(rules_path.read_text(encoding="utf-8"))["rules"]
+        calls.append([rule["id"] for rule in rules])
+        return [
+            SemgrepMatch(f"tmp.rules.{rule['id']}", "app.py", line, rule["message"])
+            for line, rule in enumerate(rules, 1)
+        ]
+
+    monkeypatch.setattr(SemgrepStaticAnalyzer, "_run_semgrep", fake_run)
+    # Both rule files reuse the id "llm-call-site"; findings must not leak.
+    _rules(tmp_path / "a.yaml", "A", "a-must-log")
+    _rules(tmp_path / "b.yaml", "B", "b-must-log")
+    evaluations = [
+        EvaluationConfig(
+            promise_id="a",
+            semgrep_batch=True,
+            semgrep_rules_path="a.yaml",
+            semgrep_violation_rule_id="a-must-log",
+        ),
+        EvaluationConfig(
+            promise_id="b",
+            semgrep_batch=True,
+            semgrep_rules_path="b.yaml",
+            semgrep_violation_rule_id="b-must-log",
+        ),
+        EvaluationConfig(promise_id="c", semgrep_batch=True, semgrep_rules_path=""),
+    ]
+    results = batch_static_analysis(str(tmp_path), evaluations)
+
+    assert len(calls) == 1
+    a, b, c = results
+    assert (a.total_llm_calls, a.violations) == (1, 1)
+    assert [f.code for f in a.findings] == ["A"]
+    assert [f.code for f in b.findings] == ["B"]
+    assert c is None
+
+
+def test_batching_needs_two_rule_sets(tmp_path: Path) -> None:
+    evaluation = EvaluationConfig(semgrep_batch=True)
+    assert batch_static_analysis(str(tmp_path), [evaluation]) is None
+    assert batch_static_analysis(str(tmp_path), [EvaluationConfig()] * 2) is None
+
+
+def test_promise_entries_can_override_semgrep_rules(tmp_path: Path) -> None:
+    config_path = tmp_path / ".praevisio.yaml"
+    config_path.write_text(
+        yaml.safe_dump(
+            {
+                "evaluation": {"semgrep_batch": True},
+                "promises": [
+                    "llm-input-logging",
+                    {
+                        "id": "llm-privacy-redaction",
+                        "semgrep_rules_path": "governance/evidence/redaction.yaml",
+                        "semgrep_violation_rule_id": "llm-call-must-redact",
+                    },
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    config = YamlConfigLoader().load(str(config_path))
+
+    assert config.promises == ["llm-input-logging", "llm-privacy-redaction"]
+    assert config.evaluation.semgrep_batch is True
+    assert config.promise_overrides == {
+        "llm-privacy-redaction": {
+            "semgrep_rules_path": "governance/evidence/redaction.yaml",
+            "semgrep_violation_rule_id": "llm-call-must-redact",
+        }
+    }
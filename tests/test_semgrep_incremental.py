@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from praevisio.infrastructure.evidence_cache import SemgrepFileCache
+from praevisio.infrastructure.static_analysis_semgrep import (
+    SemgrepMatch,
+    SemgrepStaticAnalyzer,
+)
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _fake_scan(calls: list[list[str]]):
+    """Stand-in for semgrep: `llm(` is a call site, unless followed by `# logged`."""
+
+    def run(self, root: Path, rules_path: Path, targets: list[str], keep=None):
+        calls.append(list(targets))
+        if targets == ["."]:
+            files = sorted(
+                p.relative_to(root).as_posix()
+                for p in root.rglob("*.py")
+                if ".git" not in p.parts
+            )
+        else:
+            files = targets
+        findings = []
+        for file in files:
+            for number, line in enumerate((root / file).read_text().splitlines(), 1):
+                if "llm(" not in line:
+                    continue
+                findings.append(
+                    {"check_id": "rules.llm-call-site", "path": file, "start": {"line": number}}
+                )
+                if "# logged" not in line:
+                    findings.append(
+                        {
+                            "check_id": "rules.llm-call-must-log",
+                            "path": file,
+                            "start": {"line": number},
+                            "extra": {"lines": line},
+                        }
+                    )
+        return [SemgrepMatch.from_json(f) for f in findings]
+
+    return run
+
+
+def _repo(root: Path) -> None:
+    (root / "rules.yaml").write_text("rules: []\n", encoding="utf-8")
+    (root / "a.py").write_text("llm()  # logged\nllm()\n", encoding="utf-8")
+    (root / "b.py").write_text("llm()  # logged\n", encoding="utf-8")
+    _git(root, "init", "-q")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "init")
+
+
+def test_incremental_scan_rescans_only_changed_files(monkeypatch, tmp_path: Path) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(SemgrepStaticAnalyzer, "_run_semgrep", _fake_scan(calls))
+    _repo(tmp_path)
+    analyzer = SemgrepStaticAnalyzer(
+        rules_path=Path("rules.yaml"),
+        baseline_path=Path(".praevisio/cache/semgrep-baseline.json"),
+        exclude_dirs=[".praevisio/cache"],
+    )
+
+    first = analyzer.analyze(str(tmp_path))
+    assert first.scope == "full"
+    assert (first.total_llm_calls, first.violations) == (3, 1)
+    assert calls[-1] == ["."]
+
+    (tmp_path / "b.py").write_text("llm()  # logged\nllm()\n", encoding="utf-8")
+    second = analyzer.analyze(str(tmp_path))
+    assert second.scope == "incremental"
+    assert calls[-1] == ["b.py"]
+    assert (second.total_llm_calls, second.violations) == (4, 2)
+    assert sorted(f.file for f in second.findings) == ["a.py", "b.py"]
+
+    # Once committed, the previously dirty file is re-scanned one last time.
+    _git(tmp_path, "commit", "-q", "-am", "change b")
+    third = analyzer.analyze(str(tmp_path))
+    assert calls[-1] == ["b.py"]
+    assert (third.total_llm_calls, third.violations) == (4, 2)
+
+    calls_before = len(calls)
+    fourth = analyzer.analyze(str(tmp_path))
+    assert len(calls) == calls_before
+    assert (fourth.total_llm_calls, fourth.violations) == (4, 2)
+
+
+def test_incremental_scan_drops_deleted_files(monkeypatch, tmp_path: Path) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(SemgrepStaticAnalyzer, "_run_semgrep", _fake_scan(calls))
+    _repo(tmp_path)
+    analyzer = SemgrepStaticAnalyzer(
+        rules_path=Path("rules.yaml"),
+        baseline_path=Path(".praevisio/cache/semgrep-baseline.json"),
+        exclude_dirs=[".praevisio/cache"],
+    )
+    analyzer.analyze(str(tmp_path))
+    (tmp_path / "a.py").unlink()
+    result = analyzer.analyze(str(tmp_path))
+    assert calls == [["."]]
+    assert (result.total_llm_calls, result.violations) == (1, 0)
+
+
+def test_rules_change_forces_full_scan(monkeypatch, tmp_path: Path) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(SemgrepStaticAnalyzer, "_run_semgrep", _fake_scan(calls))
+    _repo(tmp_path)
+    analyzer = SemgrepStaticAnalyzer(
+        rules_path=Path("rules.yaml"),
+        baseline_path=Path(".praevisio/cache/semgrep-baseline.json"),
+        exclude_dirs=[".praevisio/cache"],
+    )
+    analyzer.analyze(str(tmp_path))
+    (tmp_path / "rules.yaml").write_text("rules: [changed]\n", encoding="utf-8")
+    result = analyzer.analyze(str(tmp_path))
+    assert result.scope == "full"
+    assert calls[-1] == ["."]
+
+
+def test_file_cache_scans_only_unseen_content(monkeypatch, tmp_path: Path) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(SemgrepStaticAnalyzer, "_run_semgrep", _fake_scan(calls))
+    monkeypatch.setattr(SemgrepStaticAnalyzer, "_semgrep_version", lambda self: "1.0.0")
+    _repo(tmp_path)
+    cache = SemgrepFileCache(tmp_path / ".praevisio/cache")
+
+    def analyze():
+        # A fresh analyzer each time: the cache must work without a baseline.
+        analyzer = SemgrepStaticAnalyzer(
+            rules_path=Path("rules.yaml"),
+            exclude_dirs=[".praevisio/cache"],
+            file_cache=cache,
+        )
+        return analyzer.analyze(str(tmp_path))
+
+    first = analyze()
+    assert calls == [["a.py", "b.py", "rules.yaml"]]
+    assert (first.total_llm_calls, first.violations) == (3, 1)
+
+    second = analyze()
+    assert len(calls) == 1
+    assert (second.total_llm_calls, second.violations) == (3, 1)
+
+    # Same content under a new path is a cache hit reported at the new path.
+    (tmp_path / "c.py").write_text("llm()\n", encoding="utf-8")
+    (tmp_path / "d.py").write_text((tmp_path / "a.py").read_text(), encoding="utf-8")
+    third = analyze()
+    assert calls[-1] == ["c.py"]
+    assert (third.total_llm_calls, third.violations) == (6, 3)
+    assert sorted(f.file for f in third.findings) == ["a.py", "c.py", "d.py"]
+
+
+def test_file_cache_misses_on_new_semgrep_version(monkeypatch, tmp_path: Path) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(SemgrepStaticAnalyzer, "_run_semgrep", _fake_scan(calls))
+    _repo(tmp_path)
+    cache = SemgrepFileCache(tmp_path / ".praevisio/cache")
+    for version in ("1.0.0", "1.1.0"):
+        monkeypatch.setattr(SemgrepStaticAnalyzer, "_semgrep_version", lambda self: version)
+        SemgrepStaticAnalyzer(rules_path=Path("rules.yaml"), file_cache=cache).analyze(
+            str(tmp_path)
+        )
+    assert len(calls) == 2
+
+
+def test_file_cache_key_covers_what_rules_can_see_of_the_path(monkeypatch, tmp_path: Path) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(SemgrepStaticAnalyzer, "_run_semgrep", _fake_scan(calls))
+    monkeypatch.setattr(SemgrepStaticAnalyzer, "_semgrep_version", lambda self: "1.0.0")
+    _repo(tmp_path)
+    cache = SemgrepFileCache(tmp_path / ".praevisio/cache")
+
+    def analyze():
+        SemgrepStaticAnalyzer(
+            rules_path=Path("rules.yaml"), exclude_dirs=[".praevisio/cache"], file_cache=cache
+        ).analyze(str(tmp_path))
+
+    analyze()
+    # The suffix picks the language, so the same bytes in a .txt file miss.
+    (tmp_path / "a.txt").write_text((tmp_path / "a.py").read_text(), encoding="utf-8")
+    analyze()
+    assert calls[-1] == ["a.txt"]
+
+    # With `paths:` filters, findings depend on the whole path.
+    (tmp_path / "rules.yaml").write_text(
+        "rules:\n  - id: llm-call-site\n    paths: {include: [src/]}\n", encoding="utf-8"
+    )
+    analyze()
+    (tmp_path / "moved.py").write_text((tmp_path / "b.py").read_text(), encoding="utf-8")
+    analyze()
+    assert calls[-1] == ["moved.py"]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import sys
+from pathlib import Path
+
+from praevisio.infrastructure.static_analysis_semgrep import (
+    SemgrepMatch,
+    SemgrepStaticAnalyzer,
+    iter_semgrep_results,
+)
+
+
+def _result(check_id: str, line: int, code: str = "llm()") -> dict:
+    return {
+        "check_id": check_id,
+        "path": "./app.py",
+        "start": {"line": line, "col": 1},
+        "extra": {"lines": code, "metadata": {"note": "] } , \" ["}},
+    }
+
+
+def test_results_are_decoded_across_small_reads() -> None:
+    report = {
+        "version": "1.0.0",
+        "paths": {"scanned": ["app.py"] * 50},
+        "results": [_result(f"rules.r{i}", i, 'say("\\u00e9 }]")') for i in range(20)],
+        "errors": [],
+    }
+    text = json.dumps(report)
+    for chunk_size in (1, 7, 4096):
+        items = list(iter_semgrep_results(io.StringIO(text), chunk_size=chunk_size))
+        assert items == report["results"]
+
+    assert list(iter_semgrep_results(io.StringIO(""))) == []
+    assert list(iter_semgrep_results(io.StringIO('{"results": []}'))) == []
+
+
+def test_run_semgrep_keeps_only_relevant_matches(monkeypatch, tmp_path: Path) -> None:
+    # A fake `semgrep` executable that reports many findings for other rules.
+    results = [_result("rules.unrelated", i) for i in range(5000)]
+    results.insert(100, _result("rules.llm-call-site", 1))
+    results.append(_result("rules.llm-call-must-log", 2, "llm(x)"))
+    report = tmp_path / "report.json"
+    report.write_text(json.dumps({"results": results, "errors": []}), encoding="utf-8")
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "semgrep"
+    script.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        f"sys.stdout.write(open({str(report)!r}).read())\n",
+        encoding="utf-8",
+    )
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+    analyzer = SemgrepStaticAnalyzer()
+    matches = analyzer._run_semgrep(tmp_path, tmp_path / "rules.yaml", ["."])
+
+    assert matches == [
+        SemgrepMatch("rules.llm-call-site", "app.py", 1, "llm()"),
+        SemgrepMatch("rules.llm-call-must-log", "app.py", 2, "llm(x)"),
+    ]
+    result = analyzer._summarize(matches)
+    assert (result.total_llm_calls, result.violations) == (1, 1)
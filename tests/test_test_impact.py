@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from praevisio.application.evaluation_service import EvaluationService
+from praevisio.domain.entities import StaticAnalysisResult
+from praevisio.domain.evaluation_config import EvaluationConfig
+from praevisio.domain.models import Promise
+from praevisio.infrastructure.test_runner_subprocess import SubprocessPytestRunner
+
+
+@dataclass
+class FakePromiseLoader:
+    def load(self, promise_id: str) -> Promise:
+        return Promise(id=promise_id, statement="test")
+
+
+@dataclass
+class FakeAnalyzer:
+    def analyze(self, path: str) -> StaticAnalysisResult:
+        return StaticAnalysisResult(total_llm_calls=0, violations=0, coverage=1.0, findings=[])
+
+
+def _project(root: Path) -> None:
+    (root / "calc.py").write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    (root / "other.py").write_text("def value():\n    return 1\n", encoding="utf-8")
+    (root / "test_calc.py").write_text(
+        "from calc import add\n\n\ndef test_add():\n    assert add(1, 2) == 3\n",
+        encoding="utf-8",
+    )
+    # `other` is only imported while the test runs, so only call tracing sees it.
+    (root / "test_other.py").write_text(
+        "import importlib\n\n\n"
+        "def test_other():\n    assert importlib.import_module('other').value() == 1\n",
+        encoding="utf-8",
+    )
+
+
+def _impact(root: Path, run: int, **overrides) -> dict:
+    config = EvaluationConfig(
+        promise_id="p",
+        pytest_targets=["."],
+        semgrep_rules_path="",
+        run_dir=f"runs-{run}",
+        test_impact=True,
+        **overrides,
+    )
+    service = EvaluationService(
+        analyzer=FakeAnalyzer(),
+        test_runner=SubprocessPytestRunner(),
+        promise_loader=FakePromiseLoader(),
+    )
+    result = service.evaluate_path(str(root), config=config)
+    manifest = Path(result.details["manifest_path"])
+    payload = json.loads((manifest.parent / "evidence" / "pytest.json").read_text())
+    assert result.details["evidence"]["test_passes"] is True
+    assert result.verdict != "error"
+    return payload["impact"]
+
+
+def test_only_affected_tests_run(tmp_path: Path) -> None:
+    _project(tmp_path)
+
+    first = _impact(tmp_path, 1)
+    assert (first["mode"], first["executed"]) == ("full", ["."])
+
+    second = _impact(tmp_path, 2)
+    assert second["mode"] == "selective"
+    assert second["executed"] == []
+    assert second["trusted"] == ["test_calc.py::test_add", "test_other.py::test_other"]
+
+    (tmp_path / "other.py").write_text("def value():\n    return 1  # edited\n")
+    third = _impact(tmp_path, 3)
+    assert third["executed"] == ["test_other.py::test_other"]
+    assert third["trusted"] == ["test_calc.py::test_add"]
+
+
+def test_new_test_module_runs_in_full(tmp_path: Path) -> None:
+    _project(tmp_path)
+    _impact(tmp_path, 1)
+    (tmp_path / "test_new.py").write_text("def test_new():\n    assert True\n")
+
+    impact = _impact(tmp_path, 2)
+    assert impact["executed"] == ["test_new.py"]
+    assert "test_new.py::test_new" in _impact(tmp_path, 3)["trusted"]
+
+
+def test_trusted_run_matches_full_determinism_replicate(tmp_path: Path) -> None:
+    _project(tmp_path)
+    _impact(tmp_path, 1)
+
+    # Nothing changed, so the base run executes no test; the replicate runs
+    # the whole suite and must still count as the same result.
+    impact = _impact(tmp_path, 2, determinism_runs=2, determinism_mode="strict")
+    assert impact["executed"] == []
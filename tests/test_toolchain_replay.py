@@ -63,3 +63,26 @@ def test_replay_strict_fails_on_toolchain_mismatch(monkeypatch, tmp_path) -> Non
     result = runner.invoke(cli.app, ["replay-audit", str(audit_path), "--strict-determinism"])
     assert result.exit_code == 1
     assert "toolchain mismatch" in result.output
+
+
+def test_toolchain_metadata_is_refreshed_after_an_install(monkeypatch, tmp_path) -> None:
+    import os
+    import sys
+
+    from praevisio.infrastructure import toolchain
+
+    installed = {"pytest": "7.0.0"}
+    monkeypatch.setattr(toolchain, "_package_version", lambda name: installed.get(name, "x"))
+    site = tmp_path / "site-packages"
+    site.mkdir()
+    monkeypatch.setattr(sys, "path", [str(site)])
+    toolchain._toolchain_snapshot.cache_clear()
+
+    first = toolchain.current_toolchain_metadata()
+    installed["pytest"] = "8.0.0"
+    assert toolchain.current_toolchain_metadata() == first  # cached while nothing changed
+
+    (site / "pytest-8.0.0.dist-info").mkdir()
+    os.utime(site, ns=(0, site.stat().st_mtime_ns + 1_000_000_000))
+    assert toolchain.current_toolchain_metadata()["tool_versions"]["pytest"] == "8.0.0"
+    toolchain._toolchain_snapshot.cache_clear()
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from praevisio.application.evaluation_service import EvaluationService
+from praevisio.domain.entities import StaticAnalysisResult
+from praevisio.domain.evaluation_config import EvaluationConfig
+from praevisio.domain.models import Promise
+from praevisio.infrastructure.tracing import Tracer, span, to_chrome_trace
+from praevisio.presentation.cli import app
+
+
+@dataclass
+class FakePromiseLoader:
+    def load(self, promise_id: str) -> Promise:
+        return Promise(id=promise_id, statement="test")
+
+
+@dataclass
+class PassingTestRunner:
+    def run(self, path: str, args: list[str]) -> int:
+        return 0
+
+
+@dataclass
+class CleanAnalyzer:
+    def analyze(self, path: str) -> StaticAnalysisResult:
+        return StaticAnalysisResult(total_llm_calls=1, violations=0, coverage=1.0, findings=[])
+
+
+def test_evaluation_writes_trace_hashed_into_manifest(tmp_path: Path) -> None:
+    service = EvaluationService(
+        analyzer=CleanAnalyzer(),
+        test_runner=PassingTestRunner(),
+        promise_loader=FakePromiseLoader(),
+    )
+    result = service.evaluate_path(
+        str(tmp_path), EvaluationConfig(promise_id="p", pytest_targets=["tests"], run_dir="runs")
+    )
+    run_root = tmp_path / "runs" / result.details["run_id"]
+
+    trace = json.loads((run_root / "trace.json").read_text(encoding="utf-8"))
+    spans = {item["name"]: item for item in trace["spans"]}
+    for phase in ("load_promise", "evidence", "run_session", "audit_chain", "report"):
+        assert phase in spans
+        assert spans[phase]["parent_id"] is None
+    # pytest runs on a worker thread but still nests under the evidence phase.
+    assert spans["pytest"]["parent_id"] == spans["evidence"]["id"]
+    assert spans["pytest"]["thread"] != spans["semgrep"]["thread"]
+    manifest = json.loads((run_root / "manifest.json").read_text(encoding="utf-8"))
+    assert "trace.json" in [a["path"] for a in manifest["artifacts"]]
+
+    shown = CliRunner().invoke(
+        app,
+        [
+            "show-run",
+            result.details["run_id"],
+            "--runs-dir",
+            str(tmp_path / "runs"),
+            "--chrome-trace",
+            str(tmp_path / "chrome.json"),
+        ],
+    )
+    assert shown.exit_code == 0
+    assert "- run_session:" in shown.output
+    assert "  - pytest:" in shown.output
+    events = json.loads((tmp_path / "chrome.json").read_text(encoding="utf-8"))["traceEvents"]
+    assert {e["name"] for e in events if e["ph"] == "X"} == set(spans)
+
+
+def _untraced_work() -> None:
+    with span("elsewhere"):
+        pass
+
+
+def test_spans_nest_per_context_and_noop_without_tracer() -> None:
+    with span("untraced"):
+        pass
+    tracer = Tracer()
+    with tracer.active():
+        with span("outer"):
+            # Plain threads start with an empty context, so nothing is traced.
+            worker = threading.Thread(target=_untraced_work)
+            worker.start()
+            worker.join()
+            with span("inner", step=1):
+                pass
+
+    spans = {s.name: s for s in tracer.spans()}
+    assert set(spans) == {"outer", "inner"}
+    assert spans["inner"].parent_id == spans["outer"].span_id
+    assert spans["inner"].attributes == {"step": 1}
+    assert spans["outer"].start <= spans["inner"].start <= spans["inner"].end <= spans["outer"].end
+    chrome = to_chrome_trace(tracer.to_dict())
+    assert [e["name"] for e in chrome["traceEvents"] if e["ph"] == "X"] == ["outer", "inner"]
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from praevisio.application.engine import PraevisioEngine
+from praevisio.application.evaluation_service import EvaluationService
+from praevisio.application.watch_service import WatchService
+from praevisio.domain.config import Configuration
+from praevisio.domain.entities import StaticAnalysisResult
+from praevisio.domain.evaluation_config import EvaluationConfig
+from praevisio.domain.models import Promise
+from praevisio.infrastructure.config import InMemoryConfigLoader
+from praevisio.infrastructure.filesystem import LocalFileSystemService
+
+
+@dataclass
+class FakePromiseLoader:
+    def load(self, promise_id: str) -> Promise:
+        return Promise(id=promise_id, statement="test")
+
+
+@dataclass
+class CountingTestRunner:
+    calls: list = field(default_factory=list)
+
+    def run(self, path: str, args: list[str]) -> int:
+        self.calls.append(path)
+        return 0
+
+
+@dataclass
+class CleanAnalyzer:
+    def analyze(self, path: str) -> StaticAnalysisResult:
+        return StaticAnalysisResult(total_llm_calls=1, violations=0, coverage=1.0, findings=[])
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+
+def _setup(root: Path):
+    _git(root, "init", "-q")
+    (root / ".gitignore").write_text(".praevisio/\n", encoding="utf-8")
+    (root / "app.py").write_text("print('v1')\n", encoding="utf-8")
+    _git(root, "add", ".")
+    runner = CountingTestRunner()
+    service = EvaluationService(
+        analyzer=CleanAnalyzer(), test_runner=runner, promise_loader=FakePromiseLoader()
+    )
+    engine = PraevisioEngine(
+        InMemoryConfigLoader(Configuration()), LocalFileSystemService(), service
+    )
+    evaluation = engine.apply_threshold(
+        EvaluationConfig(promise_id="p", pytest_targets=["tests"], threshold=0.1), None, None
+    )
+    return engine, evaluation, runner
+
+
+def test_pre_commit_reuses_result_for_unchanged_tree(tmp_path: Path) -> None:
+    engine, evaluation, runner = _setup(tmp_path)
+    watch = WatchService(engine, str(tmp_path), evaluation)
+
+    first = watch.evaluate_if_changed()
+    assert first is not None
+    assert watch.evaluate_if_changed() is None
+    assert len(runner.calls) == 1
+
+    # Editing and then staging the edit: only the content counts.
+    (tmp_path / "app.py").write_text("print('v2')\n", encoding="utf-8")
+    assert watch.evaluate_if_changed() is not None
+    _git(tmp_path, "add", "app.py")
+    gate = engine.pre_commit_gate(str(tmp_path), evaluation, reuse_speculative=True)
+    assert gate.evaluation.details["speculative"] is True
+    assert len(runner.calls) == 2
+
+    # A different setting, or new content, means a real evaluation.
+    gate = engine.pre_commit_gate(
+        str(tmp_path), evaluation, threshold_override=0.2, reuse_speculative=True
+    )
+    assert "speculative" not in gate.evaluation.details
+    (tmp_path / "app.py").write_text("print('v3')\n", encoding="utf-8")
+    gate = engine.pre_commit_gate(str(tmp_path), evaluation, reuse_speculative=True)
+    assert "speculative" not in gate.evaluation.details
+    assert len(runner.calls) == 4
+
+
+def test_untracked_files_are_part_of_the_state(tmp_path: Path) -> None:
+    engine, evaluation, runner = _setup(tmp_path)
+    # Run output that is not ignored must still not count as an edit.
+    evaluation = replace(evaluation, run_dir="runs")
+    watch = WatchService(engine, str(tmp_path), evaluation)
+    assert watch.evaluate_if_changed() is not None
+    assert watch.evaluate_if_changed() is None
+
+    # pytest and Semgrep see a new, unstaged file, so the stored result is stale.
+    (tmp_path / "agent.py").write_text("llm(prompt)\n", encoding="utf-8")
+    gate = engine.pre_commit_gate(str(tmp_path), evaluation, reuse_speculative=True)
+    assert "speculative" not in gate.evaluation.details
+    assert watch.evaluate_if_changed() is not None
+
+    (tmp_path / "agent.py").unlink()
+    assert watch.evaluate_if_changed() is not None
+    assert len(runner.calls) == 4
+
+
+def test_watch_coalesces_a_burst_of_saves(tmp_path: Path) -> None:
+    engine, evaluation, runner = _setup(tmp_path)
+    watch = WatchService(engine, str(tmp_path), evaluation, poll_interval=0.02, debounce=0.3)
+    thread = threading.Thread(target=watch.run, kwargs={"max_evaluations": 2}, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not runner.calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+    for version in range(5):
+        (tmp_path / "app.py").write_text(f"print({version})\n", encoding="utf-8")
+        time.sleep(0.03)
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert len(runner.calls) == 2